@@ -0,0 +1,198 @@
+import os
+import struct
+import tempfile
+import threading
+from array import array
+
+# File signature and format version
+_MAGIC = b"GACP"
+_VERSION = 1
+# Version, generation, number of variables, number of clauses, population size, number of evaluations,
+# best fitness, whether a best solution exists
+_HEADER = struct.Struct("<HqqqqqdB")
+# Version of the random generator state, whether a gaussian is pending, the pending gaussian
+_RANDOM_STATE = struct.Struct("<qBd")
+
+
+def write_atomically(path, data):
+    """ Writes 'data' to a temporary file next to 'path' and renames it to 'path',
+        so that 'path' always holds either the previous or the new contents in full.
+    :param path: path of the file to write
+    :param data: bytes to write
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+class Checkpoint:
+    """ Snapshot of the state of a GA run at the start of a generation, from which GA.resume continues.
+        Genomes are stored packed into bits; a fitness of NaN marks a candidate whose fitness is not known yet.
+    """
+
+    def __init__(self, generation, num_variables, num_clauses, genomes, fitness, random_state,
+                 best_genome=None, best_fitness=0.0, num_evaluations=0):
+        """
+        :param generation: index of the generation about to be evaluated
+        :param num_variables: number of variables of the problem
+        :param num_clauses: number of clauses of the problem
+        :param genomes: list containing the packed genome of each candidate, as returned by CompactValuation.pack
+        :param fitness: list containing the known fitness of each candidate, or NaN
+        :param random_state: state of the random number generator of the GA, as returned by random.Random.getstate
+        :param best_genome: packed genome of the best solution found so far, if any
+        :param best_fitness: fitness of the best solution found so far
+        :param num_evaluations: number of candidates evaluated so far
+        """
+        if len(genomes) != len(fitness):
+            raise ValueError("'genomes' and 'fitness' must have the same length.")
+
+        self.generation = generation
+        self.num_variables = num_variables
+        self.num_clauses = num_clauses
+        self.genomes = genomes
+        self.fitness = fitness
+        self.random_state = random_state
+        self.best_genome = best_genome
+        self.best_fitness = best_fitness
+        self.num_evaluations = num_evaluations
+
+    def to_bytes(self):
+        """
+        :return: binary representation of the checkpoint
+        """
+        genome_size = (self.num_variables + 7) // 8
+        version, internal_state, gaussian = self.random_state
+
+        parts = [
+            _MAGIC,
+            _HEADER.pack(_VERSION, self.generation, self.num_variables, self.num_clauses, len(self.genomes),
+                         self.num_evaluations, self.best_fitness, self.best_genome is not None),
+            _RANDOM_STATE.pack(version, gaussian is not None, gaussian if gaussian is not None else 0.0),
+            struct.pack("<q", len(internal_state)),
+            array("Q", internal_state).tobytes(),
+            array("d", self.fitness).tobytes(),
+        ]
+        for genome in self.genomes:
+            parts.append(bytes(genome).ljust(genome_size, b"\0"))
+        if self.best_genome is not None:
+            parts.append(bytes(self.best_genome).ljust(genome_size, b"\0"))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        :param data: bytes as returned by 'to_bytes'
+        :return: Checkpoint instance
+        """
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError("Data is not a GA checkpoint.")
+        offset = len(_MAGIC)
+
+        (version, generation, num_variables, num_clauses, population_size, num_evaluations, best_fitness,
+         has_best) = _HEADER.unpack_from(data, offset)
+        if version != _VERSION:
+            raise ValueError("Unsupported checkpoint version {0}.".format(version))
+        offset += _HEADER.size
+
+        random_version, has_gaussian, gaussian = _RANDOM_STATE.unpack_from(data, offset)
+        offset += _RANDOM_STATE.size
+        state_length, = struct.unpack_from("<q", data, offset)
+        offset += 8
+        internal_state = array("Q")
+        internal_state.frombytes(data[offset:offset + 8 * state_length])
+        offset += 8 * state_length
+        random_state = (random_version, tuple(internal_state), gaussian if has_gaussian else None)
+
+        fitness = array("d")
+        fitness.frombytes(data[offset:offset + 8 * population_size])
+        offset += 8 * population_size
+
+        genome_size = (num_variables + 7) // 8
+        genomes = []
+        for _ in range(population_size):
+            genomes.append(bytes(data[offset:offset + genome_size]))
+            offset += genome_size
+        best_genome = bytes(data[offset:offset + genome_size]) if has_best else None
+
+        return cls(generation, num_variables, num_clauses, genomes, list(fitness), random_state,
+                   best_genome, best_fitness, num_evaluations)
+
+    def write(self, path):
+        """ Writes the checkpoint to 'path' atomically.
+        """
+        write_atomically(path, self.to_bytes())
+
+    @classmethod
+    def read(cls, path):
+        """
+        :param path: path of a file written by 'write'
+        :return: Checkpoint instance
+        """
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class CheckpointWriter:
+    """ Writes checkpoints to a file in a background thread, so that the GA does not wait for the disk.
+        If a checkpoint is submitted while the previous one is still waiting to be written,
+        only the most recent one is written.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: path of the checkpoint file
+        """
+        self.path = path
+        self._pending = None
+        self._closed = False
+        self._error = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._write_pending, name="CheckpointWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, checkpoint):
+        """
+        :param checkpoint: Checkpoint to write
+        """
+        with self._condition:
+            self._raise_error()
+            if self._closed:
+                raise ValueError("Cannot submit a checkpoint to a closed writer.")
+            self._pending = checkpoint
+            self._condition.notify()
+
+    def close(self):
+        """ Writes the pending checkpoint, if any, and stops the background thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self._raise_error()
+
+    def _write_pending(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                checkpoint, self._pending = self._pending, None
+                if checkpoint is None:
+                    return
+            try:
+                checkpoint.write(self.path)
+            except Exception as error:
+                with self._condition:
+                    self._error = error
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
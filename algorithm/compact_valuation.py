@@ -0,0 +1,236 @@
+import random
+
+from algorithm.valuation import Valuation
+from sat.literal import Literal
+from sat.variable import Variable
+
+# Translation tables between 0/1 bytes and the ASCII digits used to (un)pack bit strings
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class CompactValuation(Valuation):
+    """ Truth assignment stored as a bytearray holding one 0/1 byte per variable,
+        indexed by the ordinal of the variable in a shared variable list.
+        Offers the same interface as Valuation, plus bulk accessors operating on index ranges.
+    """
+
+    @classmethod
+    def init_random_from_variables(cls, variables, index=None, rng=None):
+        if not isinstance(variables, list):
+            raise TypeError("'variables' must be a list.")
+
+        bits = (rng or random).getrandbits(len(variables)) if variables else 0
+        if index is None:
+            return cls(variables, cls.unpack_bits(bits, len(variables)))
+        return cls.from_trusted(variables, cls.unpack_bits(bits, len(variables)), index)
+
+    @classmethod
+    def from_trusted(cls, variables, values, index):
+        """
+        Creates a valuation like the constructor, without checking its arguments and without copying 'values',
+        for values that are valid by construction and not referenced elsewhere.
+        :param variables: variables determining the ordinal of each value
+        :param values: bytearray holding one 0/1 byte per variable, which the valuation takes ownership of
+        :param index: 'Variable -> ordinal' mapping for 'variables'
+        :return: CompactValuation holding 'values'
+        """
+        instance = cls.__new__(cls)
+        instance._variables = variables
+        instance._index = index
+        instance._values = values
+        instance.clause_counters = None
+        return instance
+
+    @classmethod
+    def from_valuation(cls, valuation, variables, index=None):
+        """
+        :param valuation: Valuation instance to convert
+        :param variables: variables determining the ordinal of each value
+        :param index: optional 'Variable -> ordinal' mapping for 'variables'
+        :return: CompactValuation holding the same truth assignment as 'valuation'
+        """
+        if not isinstance(valuation, Valuation):
+            raise TypeError("'valuation' must be a Valuation instance.")
+        if not isinstance(variables, list):
+            raise TypeError("'variables' must be a list.")
+
+        values = bytearray(bool(valuation.get_value_for_variable(v)) for v in variables)
+        return cls(variables, values, index)
+
+    @classmethod
+    def unpack(cls, variables, packed, index=None):
+        """
+        :param variables: variables determining the ordinal of each value
+        :param packed: bytes as returned by 'pack'
+        :param index: optional 'Variable -> ordinal' mapping for 'variables'
+        :return: CompactValuation holding the packed truth assignment
+        """
+        if not isinstance(packed, (bytes, bytearray)):
+            raise TypeError("'packed' must be bytes.")
+
+        return cls(variables, cls.unpack_bits(int.from_bytes(packed, "little"), len(variables)), index)
+
+    @staticmethod
+    def unpack_bits(bits, num_values):
+        """
+        :param bits: int in which bit i holds the value for ordinal i
+        :param num_values: number of values to unpack
+        :return: bytearray holding one 0/1 byte per value
+        """
+        if num_values == 0:
+            return bytearray()
+        return bytearray(format(bits, "0{0}b".format(num_values))[::-1].encode().translate(_FROM_DIGITS))
+
+    @staticmethod
+    def pack_bits(values):
+        """
+        :param values: bytes holding one 0/1 byte per value
+        :return: int in which bit i holds the value for ordinal i
+        """
+        if not values:
+            return 0
+        return int(bytes(values).translate(_TO_DIGITS)[::-1], 2)
+
+    def __init__(self, variables, values, index=None):
+        """
+        :param variables: variables determining the ordinal of each value
+        :param values: bytes-like object holding one 0/1 byte per variable
+        :param index: optional 'Variable -> ordinal' mapping for 'variables',
+            which allows valuations over the same variables to share a single mapping
+        """
+        if not isinstance(variables, list):
+            raise TypeError("'variables' must be a list.")
+        if not isinstance(values, (bytes, bytearray)):
+            raise TypeError("'values' must be a bytes-like object.")
+        if len(values) != len(variables):
+            raise ValueError("'values' must contain exactly one value per variable.")
+        if values.translate(None, b"\x00\x01"):
+            raise TypeError("'values' may only contain 0 and 1.")
+
+        if index is None:
+            if not all(isinstance(v, Variable) for v in variables):
+                raise TypeError("All elements of 'variables' must be Variable instances.")
+            index = {v: i for i, v in enumerate(variables)}
+        elif not isinstance(index, dict):
+            raise TypeError("'index' must be a dict.")
+
+        self._variables = variables
+        self._index = index
+        self._values = bytearray(values)
+        # Per-clause counters maintained by an IncrementalEvaluator; discarded whenever values change otherwise
+        self.clause_counters = None
+
+    def get_value_for_variable(self, variable):
+        if not isinstance(variable, Variable):
+            raise TypeError("'variable' must be a Variable instance.")
+
+        i = self._index.get(variable)
+        if i is None:
+            return None
+        return bool(self._values[i])
+
+    def set_value_for_variable(self, variable, value):
+        if not isinstance(variable, Variable):
+            raise TypeError("'variable' must be a Variable instance.")
+        if not isinstance(value, bool):
+            raise TypeError("'value' must be a bool.")
+
+        self._values[self._get_ordinal(variable)] = value
+        self.clause_counters = None
+
+    def get_value_for_literal(self, literal):
+        """
+        :param literal: literal to get truth value for
+        :return: truth value for literal
+        """
+        if not isinstance(literal, Literal):
+            raise TypeError("'literal' must be a Literal instance.")
+
+        i = self._index.get(literal.variable)
+        if i is None:
+            return not literal.positive
+        return bool(self._values[i]) == literal.positive
+
+    def set_value_for_literal(self, literal, value):
+        if not isinstance(literal, Literal):
+            raise TypeError("'literal' must be a Literal instance.")
+        if not isinstance(value, bool):
+            raise TypeError("'value' must be a bool.")
+
+        self._values[self._get_ordinal(literal.variable)] = value
+        self.clause_counters = None
+
+    def change_value_for_random_variable(self, rng=None):
+        """ Changes the value for a randomly selected variable.
+        :param rng: random.Random instance to draw from; the random module if None
+        """
+        self._values[(rng or random).randrange(len(self._values))] ^= 1
+        self.clause_counters = None
+
+    def get_values(self, start=0, stop=None):
+        """
+        :param start: ordinal of the first value to return
+        :param stop: ordinal after the last value to return; defaults to the number of variables
+        :return: bytearray holding the 0/1 values for ordinals 'start' up to 'stop'
+        """
+        return self._values[start:stop]
+
+    def set_values(self, start, values):
+        """ Overwrites the values starting at ordinal 'start' with 'values'.
+        :param start: ordinal of the first value to overwrite
+        :param values: bytes-like object holding 0/1 values
+        """
+        if not isinstance(values, (bytes, bytearray)):
+            raise TypeError("'values' must be a bytes-like object.")
+        if start < 0 or start + len(values) > len(self._values):
+            raise IndexError("'values' does not fit within this valuation.")
+
+        self._values[start:start + len(values)] = values
+        self.clause_counters = None
+
+    def flip_values(self, ordinals):
+        """ Negates the value for each of the given ordinals.
+        :param ordinals: iterable of variable ordinals
+        """
+        values = self._values
+        for i in ordinals:
+            values[i] ^= 1
+        self.clause_counters = None
+
+    def pack(self):
+        """
+        :return: bytes in which bit i holds the value for ordinal i
+        """
+        return self.pack_bits(self._values).to_bytes((len(self._values) + 7) // 8, "little")
+
+    def copy(self):
+        return self.from_trusted(self._variables, bytearray(self._values), self._index)
+
+    def _get_ordinal(self, variable):
+        i = self._index.get(variable)
+        if i is None:
+            raise ValueError("'variable' is not part of this valuation.")
+        return i
+
+    @property
+    def variables(self):
+        return self._variables
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def valuation(self):
+        """
+        :return: 'Variable -> bool' mapping, built from the stored values
+        """
+        return {v: bool(x) for v, x in zip(self._variables, self._values)}
+
+    def __len__(self):
+        return len(self._values)
@@ -0,0 +1,97 @@
+import random
+
+from algorithm.compact_valuation import CompactValuation
+
+
+class Crossover:
+    """ Base class of the crossover operators of the GA.
+        Each operator recombines all pairs of parents of a generation in a single call,
+        working directly on their genomes rather than on Valuation instances.
+    """
+
+    def recombine(self, pairs, num_variables, rng=None):
+        """
+        :param pairs: list of (genome1, genome2) tuples of parent genomes,
+            each a bytes-like object holding one 0/1 byte per variable
+        :param num_variables: number of variables in each genome
+        :param rng: random.Random instance to draw from; the random module if None
+        :return: list containing two child genomes (bytearrays) per pair, in the order of 'pairs';
+            the first child inherits primarily from the first parent, the second child from the second
+        """
+        raise NotImplementedError
+
+
+class NPointCrossover(Crossover):
+    """ Cuts the genomes at 'points' distinct random positions; the children alternately inherit the segments
+        between the cuts from either parent, starting with the first segment from their own parent.
+        As the segments are contiguous, the masked select between the parents is carried out as slice copies.
+    """
+
+    def __init__(self, points=3):
+        if points < 1:
+            raise ValueError("'points' must be at least 1.")
+        self.points = points
+
+    def get_cuts(self, num_variables, rng=None):
+        """
+        :param num_variables: number of variables in each genome
+        :param rng: random.Random instance to draw from; the random module if None
+        :return: sorted list of positions at which the children switch parents
+        """
+        cuts = range(1, num_variables)
+        return sorted((rng or random).sample(cuts, min(self.points, len(cuts))))
+
+    def recombine(self, pairs, num_variables, rng=None):
+        children = []
+        for genome1, genome2 in pairs:
+            child1 = bytearray()
+            child2 = bytearray()
+            start = 0
+            for cut in self.get_cuts(num_variables, rng) + [num_variables]:
+                child1 += genome1[start:cut]
+                child2 += genome2[start:cut]
+                genome1, genome2 = genome2, genome1
+                start = cut
+            children.append(child1)
+            children.append(child2)
+        return children
+
+
+class SinglePointCrossover(NPointCrossover):
+    """ Children inherit the values up to and including a random crossover index from their own parent,
+        and the remaining values from the other parent.
+    """
+
+    def __init__(self):
+        super().__init__(points=1)
+
+    def get_cuts(self, num_variables, rng=None):
+        return [(rng or random).randint(0, num_variables - 1) + 1]
+
+
+class TwoPointCrossover(NPointCrossover):
+    """ Children inherit a random middle segment from the other parent, and the rest from their own parent.
+    """
+
+    def __init__(self):
+        super().__init__(points=2)
+
+
+class UniformCrossover(Crossover):
+    """ Children inherit each value from either parent with equal probability.
+        Each genome is read as an int with one byte lane per variable, so that the select between the parents
+        happens for all variables at once: where the random mask is set, the children swap parents.
+    """
+
+    def recombine(self, pairs, num_variables, rng=None):
+        rng = rng or random
+        children = []
+        for genome1, genome2 in pairs:
+            mask = int.from_bytes(CompactValuation.unpack_bits(rng.getrandbits(num_variables), num_variables),
+                                  "little")
+            lanes1 = int.from_bytes(genome1, "little")
+            lanes2 = int.from_bytes(genome2, "little")
+            swapped = (lanes1 ^ lanes2) & mask
+            children.append(bytearray((lanes1 ^ swapped).to_bytes(num_variables, "little")))
+            children.append(bytearray((lanes2 ^ swapped).to_bytes(num_variables, "little")))
+        return children
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from hashlib import blake2b
+
+
+class FitnessCache:
+    """ Bounded LRU cache of fitness values, keyed by a 128-bit digest of the candidates' genomes.
+        Only the digest and the fitness are stored per entry, so that the cache can hold millions of entries.
+    """
+
+    # Approximate number of bytes taken by an entry: 16 byte digest, float and OrderedDict bookkeeping
+    ENTRY_SIZE = 192
+
+    def __init__(self, max_entries=None, memory_budget=64 * 1024 * 1024):
+        """
+        :param max_entries: maximum number of entries; derived from 'memory_budget' if not given
+        :param memory_budget: approximate maximum number of bytes taken by the entries, used if 'max_entries' is None
+        """
+        if max_entries is None:
+            if memory_budget < self.ENTRY_SIZE:
+                raise ValueError("'memory_budget' must allow for at least one entry.")
+            max_entries = memory_budget // self.ENTRY_SIZE
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1.")
+
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_key(genome):
+        """
+        :param genome: bytes-like object holding one 0/1 byte per variable
+        :return: digest identifying 'genome'
+        """
+        return blake2b(genome, digest_size=16).digest()
+
+    def get(self, key):
+        """
+        :param key: digest as returned by 'get_key'
+        :return: cached fitness for 'key', or None if it is not cached
+        """
+        fitness = self._entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key, fitness):
+        """
+        Caches 'fitness' for 'key', evicting the least recently used entry if the cache is full.
+        :param key: digest as returned by 'get_key'
+        :param fitness: fitness of the genome identified by 'key'
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = fitness
+
+    def clear(self):
+        """ Removes all entries and resets the counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
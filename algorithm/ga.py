@@ -1,86 +1,462 @@
+import logging
 import random
+from math import isnan, nan
 from operator import itemgetter
-
+from time import perf_counter
+
+from algorithm.checkpoint import Checkpoint, CheckpointWriter
+from algorithm.compact_valuation import CompactValuation
+from algorithm.crossover import Crossover, SinglePointCrossover
+from algorithm.fitness_cache import FitnessCache
+from algorithm.incremental_evaluator import IncrementalEvaluator
+from algorithm.local_search import LocalSearch
+from algorithm.mutation import Mutation, sample_positions
+from algorithm.observer import GenerationStats, get_diversity
+from algorithm.parallel_evaluator import ParallelEvaluator
+from algorithm.population_evaluator import PopulationEvaluator
+from algorithm.run_result import Incumbent, RunResult
+from algorithm.selection import RouletteSelection, Selection
+from algorithm.solution_stream import SolutionStream
 from algorithm.valuation import Valuation
 from sat.maxsat import MAXSAT
 
+logger = logging.getLogger(__name__)
+
 
 class GA:
     """ Genetic algorithm for the MAXSAT problem.
     """
 
-    def __init__(self, maxsat, max_iterations=25, population_size=16, fitness_threshold=0.75):
+    # Replacement strategies
+    GENERATIONAL = "generational"
+    STEADY_STATE = "steady_state"
+
+    # Candidates improved by local search in memetic mode
+    OFFSPRING = "offspring"
+    ELITE = "elite"
+
+    # Reasons for a run to terminate, as reported by RunResult.reason
+    FITNESS_REACHED = "fitness_reached"
+    MAX_ITERATIONS = "max_iterations"
+    CANCELLED = "cancelled"
+    TIME_LIMIT = "time_limit"
+    EVALUATION_BUDGET = "evaluation_budget"
+    STAGNATION = "stagnation"
+
+    def __init__(self, maxsat, max_iterations=25, population_size=16, fitness_threshold=0.75, incremental=False,
+                 workers=1, observers=None, selection=None, elitism=0, replacement=GENERATIONAL,
+                 steady_state_size=2, fitness_cache=None, local_search=None, local_search_target=OFFSPRING,
+                 checkpoint_path=None, checkpoint_interval=10, crossover=None, mutation=None, time_limit=None,
+                 max_evaluations=None, stagnation_limit=None, cancellation=None, rng=None):
         """
         Creates a genetic algorithm instance for the given MAXSAT problem.
         :param maxsat:
                 MAXSAT problem instance to solve
         :param max_iterations:
-                maximum number of iterations to execute before termination
+                maximum number of iterations to execute before termination, or None for no limit
         :param population_size:
                 size of candidate solution pool to maintain during execution
         :param fitness_threshold:
                 fitness value that, if reached during execution,
                 is considered sufficient and allows termination
+        :param incremental:
+                whether to keep per-clause counters for each candidate, so that the fitness of mutated
+                and recombined candidates is updated from their parents instead of being recomputed
+        :param workers:
+                number of processes to evaluate the population with;
+                populations too small to benefit are still evaluated serially
+        :param observers:
+                list of GenerationObserver instances to notify during 'run'
+        :param selection:
+                Selection scheme used to draw parents; fitness-proportional RouletteSelection by default
+        :param elitism:
+                number of fittest candidates carried over unchanged into the next generation,
+                when using GA.GENERATIONAL replacement
+        :param replacement:
+                GA.GENERATIONAL to replace the population (except for the elite) by children every generation,
+                GA.STEADY_STATE to only replace its 'steady_state_size' least fit candidates
+        :param steady_state_size:
+                number of children created per generation when using GA.STEADY_STATE replacement
+        :param fitness_cache:
+                optional FitnessCache, consulted before evaluating a candidate; it is cleared when self.maxsat changes
+        :param local_search:
+                optional LocalSearch for self.maxsat, which turns the GA into a memetic algorithm
+        :param local_search_target:
+                GA.OFFSPRING to improve every child by local search after mutation,
+                GA.ELITE to only improve the candidates that survive into the next generation,
+                which requires survivors: either elitism or GA.STEADY_STATE replacement
+        :param checkpoint_path:
+                optional path of a file to which the state of the run is written periodically,
+                from which it can be continued by 'resume'
+        :param checkpoint_interval:
+                number of generations between two checkpoints
+        :param crossover:
+                Crossover operator used to recombine the parents of each generation in a single call;
+                SinglePointCrossover by default. Parents that are not compact are recombined by 'create_offspring'
+        :param mutation:
+                Mutation operator determining the mutation rate of each generation and sampling the flips
+                of all children at once; a constant rate of 0.01 by default
+        :param time_limit:
+                optional number of seconds after which a run terminates
+        :param max_evaluations:
+                optional number of candidate evaluations after which a run terminates;
+                every candidate improved by local search counts as an evaluation, and so does each of its flips
+        :param stagnation_limit:
+                optional number of consecutive generations without improvement of the best fitness
+                after which a run terminates
+        :param cancellation:
+                optional cancellation token, such as a threading.Event or multiprocessing.Event;
+                a run terminates once its 'is_set' method returns True
+        :param rng:
+                random.Random instance from which all random decisions of the GA and its operators are drawn;
+                the global random module by default. Checkpoints hold its state
         """
         if not isinstance(maxsat, MAXSAT):
             raise TypeError("'maxsat' must be an instance of MAXSAT.")
+        if selection is not None and not isinstance(selection, Selection):
+            raise TypeError("'selection' must be a Selection instance.")
+        if crossover is not None and not isinstance(crossover, Crossover):
+            raise TypeError("'crossover' must be a Crossover instance.")
+        if mutation is not None and not isinstance(mutation, Mutation):
+            raise TypeError("'mutation' must be a Mutation instance.")
+        if fitness_cache is not None and not isinstance(fitness_cache, FitnessCache):
+            raise TypeError("'fitness_cache' must be a FitnessCache instance.")
+        if local_search is not None and not isinstance(local_search, LocalSearch):
+            raise TypeError("'local_search' must be a LocalSearch instance.")
+        if local_search_target not in (self.OFFSPRING, self.ELITE):
+            raise ValueError("'local_search_target' must be either GA.OFFSPRING or GA.ELITE.")
+        if local_search is not None and local_search_target == self.ELITE and replacement == self.GENERATIONAL \
+                and elitism == 0:
+            raise ValueError("'local_search_target' GA.ELITE requires 'elitism' or GA.STEADY_STATE replacement.")
+        if checkpoint_interval < 1:
+            raise ValueError("'checkpoint_interval' must be at least 1.")
+        if replacement not in (self.GENERATIONAL, self.STEADY_STATE):
+            raise ValueError("'replacement' must be either GA.GENERATIONAL or GA.STEADY_STATE.")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("'time_limit' must be positive.")
+        if max_evaluations is not None and max_evaluations < 1:
+            raise ValueError("'max_evaluations' must be at least 1.")
+        if stagnation_limit is not None and stagnation_limit < 1:
+            raise ValueError("'stagnation_limit' must be at least 1.")
+        if cancellation is not None and not callable(getattr(cancellation, "is_set", None)):
+            raise TypeError("'cancellation' must provide an 'is_set' method.")
 
         self._maxsat = maxsat
         self._population = []
+        self._evaluator = None
+        self._incremental_evaluator = None
+        self._checkpoint_writer = None
+        self._stop_requested = False
+        # Fitness of the candidates carried over from the previous generation
+        self._known_fitness = {}
 
         self.max_iterations = max_iterations
         self.population_size = population_size
         self.fitness_threshold = fitness_threshold
-        self.p_mutation = 0.01
-
-        print("Initialized GA with problem:\n{0}\n.".format(self.maxsat))
+        self.mutation = mutation or Mutation(0.01)
+        self.incremental = incremental
+        self.workers = workers
+        self.observers = list(observers) if observers else []
+        self.selection = selection or RouletteSelection()
+        self.crossover = crossover or SinglePointCrossover()
+        # Index of the generation being evolved, and the mutation rate applied to its children
+        self.generation = 0
+        self.mutation_rate = self.mutation.rate
+        self.elitism = elitism
+        self.replacement = replacement
+        self.steady_state_size = steady_state_size
+        self.fitness_cache = fitness_cache
+        self.local_search = local_search
+        self.local_search_target = local_search_target
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.stagnation_limit = stagnation_limit
+        self.cancellation = cancellation
+        self.rng = rng or random
+        # Number of candidates evaluated during the current run; candidates with known fitness are not counted again
+        self.num_evaluations = 0
+        # Time spent in each phase of the last call to 'generate_next_generation'
+        self.phase_times = {"selection": 0.0, "crossover": 0.0, "mutation": 0.0, "local_search": 0.0}
+
+        # The problem is only formatted if debug logging is enabled
+        logger.debug("Initialized GA with problem:\n%s\n.", self.maxsat)
 
     def run(self):
         """ Works toward a solution for the given problem until either the fitness criterion has been met
-            or the maximum number of iterations has been reached.
-            :return:    tuple containing the best solution,
+            or another termination criterion applies: the maximum number of iterations, the time limit,
+            the evaluation budget or the stagnation limit has been reached, or the run has been cancelled.
+            :return:    RunResult containing the best solution found,
                         its corresponding fitness value,
-                        and the number of iterations executed
+                        and the number of iterations executed,
+                        with the MaxSAT cost of the solution in its 'cost' attribute
+                        and the GA constant naming the termination criterion in its 'reason' attribute
+        """
+        return self._complete(self.iterate())
+
+    def iterate(self):
+        """ Generator form of 'run', which yields every improvement of the best solution as soon as the generation
+            in which it was found has been evaluated. The run proceeds only while the caller iterates,
+            and closing the generator ends it.
+            :return:    generator of Incumbent instances, whose return value is the RunResult 'run' would have returned
+        """
+        self._stop_requested = False
+        for observer in self.observers:
+            observer.on_start(self)
+
+        self._known_fitness = {}
+        self.num_evaluations = 0
+        self._population = self.generate_population()
+        return (yield from self._evolve(0, None, 0))
+
+    def stream(self, executor=None):
+        """ Starts 'iterate' in an executor, for use from asyncio code. Must be called from a running event loop.
+            :param executor: concurrent.futures.ThreadPoolExecutor to run the GA in; the loop's default if None
+            :return: SolutionStream, an asynchronous iterator over the improvements of the run
+        """
+        return SolutionStream(self.iterate(), self.stop, executor)
+
+    def resume(self, path):
+        """ Continues a run from a checkpoint written during 'run', exactly as the run itself would have continued.
+            The GA must have been created with the same problem and parameters as the one that wrote the checkpoint.
+            The time limit and the stagnation limit apply from the moment of resumption.
+            :param path: path of the checkpoint file
+            :return: RunResult, as returned by 'run'
         """
-        iteration = 0
+        checkpoint = Checkpoint.read(path)
+        if checkpoint.num_variables != len(self.maxsat.variables) or checkpoint.num_clauses != self.maxsat.num_clauses:
+            raise ValueError("Checkpoint was written for a different problem.")
+
+        self._stop_requested = False
+        for observer in self.observers:
+            observer.on_start(self)
+
+        variables = self.maxsat.variables
+        index = self.maxsat.variable_index
+        self.population = [CompactValuation.unpack(variables, genome, index) for genome in checkpoint.genomes]
+        self._known_fitness = {
+            candidate: fitness for candidate, fitness in zip(self.population, checkpoint.fitness) if not isnan(fitness)
+        }
+        self.num_evaluations = checkpoint.num_evaluations
+        self.rng.setstate(checkpoint.random_state)
+
         solution = None
-        fitness = 0
-
-        self.population = self.generate_population()
-        while fitness < self.fitness_threshold and iteration < self.max_iterations:
-            # Get fitness of all candidates in the population
-            candidate_fitness_map = self.get_population_fitness()
-            fittest_candidate = candidate_fitness_map[0]
-            solution = fittest_candidate[0]
-            fitness = fittest_candidate[1]
-            # Evolve population
-            self.population = self.generate_next_generation(candidate_fitness_map)
-            iteration += 1
-
-        print("Terminated at iteration: {0};\nSolution: {1};\nFitness: {2}.".format(iteration, solution, fitness))
-        return solution, fitness, iteration
+        if checkpoint.best_genome is not None:
+            solution = CompactValuation.unpack(variables, checkpoint.best_genome, index)
+        return self._complete(self._evolve(checkpoint.generation, solution, checkpoint.best_fitness))
+
+    @staticmethod
+    def _complete(improvements):
+        """
+        :param improvements: generator returned by 'iterate' or '_evolve'
+        :return: return value of 'improvements', once exhausted
+        """
+        while True:
+            try:
+                next(improvements)
+            except StopIteration as stop:
+                return stop.value
+
+    def _evolve(self, iteration, solution, fitness):
+        """ Evolves self.population, starting at generation 'iteration', until a termination criterion is met.
+            :param iteration: index of the generation self.population represents
+            :param solution: best solution found before generation 'iteration', if any
+            :param fitness: fitness of 'solution'
+            :return: generator of Incumbent instances, as returned by 'iterate'
+        """
+        deadline = perf_counter() + self.time_limit if self.time_limit is not None else None
+        stagnant_generations = 0
+        try:
+            while True:
+                reason = self.get_termination_reason(iteration, fitness, stagnant_generations, deadline)
+                if reason is not None:
+                    break
+                # Get fitness of all candidates in the population
+                start = perf_counter()
+                candidate_fitness_map = self.get_population_fitness()
+                evaluation_time = perf_counter() - start
+                fittest_candidate = candidate_fitness_map[0]
+                if solution is None or fittest_candidate[1] > fitness:
+                    solution = fittest_candidate[0]
+                    fitness = fittest_candidate[1]
+                    stagnant_generations = 0
+                    yield Incumbent(solution, fitness, iteration, self.maxsat.get_cost(solution))
+                else:
+                    stagnant_generations += 1
+                # Evolve population
+                self.generation = iteration
+                # Generations created by the GA itself are valid by construction, so the setter's checks are skipped
+                self._population = self.generate_next_generation(candidate_fitness_map)
+                if self.observers:
+                    self.notify_generation(iteration, candidate_fitness_map, evaluation_time)
+                iteration += 1
+                if self.checkpoint_path is not None and iteration % self.checkpoint_interval == 0:
+                    self.save_checkpoint(iteration, solution, fitness)
+        finally:
+            self.close()
+            # Also when the run raised or its generator was closed, so that observers release what they hold
+            self._finish(solution, fitness, iteration)
+
+        logger.info("Terminated at iteration: %d (%s);\nSolution: %s;\nFitness: %s.",
+                    iteration, reason, solution, fitness)
+        cost = self.maxsat.get_cost(solution) if solution is not None else None
+        return RunResult(solution, fitness, iteration, cost, reason)
+
+    def _finish(self, solution, fitness, iteration):
+        """ Notifies each observer that the run terminated.
+        """
+        for observer in self.observers:
+            observer.on_finish(self, solution, fitness, iteration)
+
+    def get_termination_reason(self, iteration, fitness, stagnant_generations, deadline):
+        """ Checks the termination criteria between two generations.
+            :param iteration: index of the generation about to be evaluated
+            :param fitness: fitness of the best solution found so far
+            :param stagnant_generations: number of consecutive generations that did not improve 'fitness'
+            :param deadline: perf_counter() value at which the time limit expires, or None
+            :return: GA constant naming the first criterion met, or None to continue
+        """
+        if fitness >= self.fitness_threshold:
+            return self.FITNESS_REACHED
+        if self.max_iterations is not None and iteration >= self.max_iterations:
+            return self.MAX_ITERATIONS
+        if self._stop_requested or (self.cancellation is not None and self.cancellation.is_set()):
+            return self.CANCELLED
+        if deadline is not None and perf_counter() >= deadline:
+            return self.TIME_LIMIT
+        if self.max_evaluations is not None and self.num_evaluations >= self.max_evaluations:
+            return self.EVALUATION_BUDGET
+        if self.stagnation_limit is not None and stagnant_generations >= self.stagnation_limit:
+            return self.STAGNATION
+        return None
+
+    def stop(self):
+        """ Requests the current run to terminate once the generation being evolved is complete,
+            for instance from a GenerationObserver. The run returns its result as usual, with reason GA.CANCELLED.
+        """
+        self._stop_requested = True
+
+    def notify_generation(self, generation, candidate_fitness_map, evaluation_time):
+        """ Passes the statistics of an evaluated generation to each observer.
+        :param generation: index of the generation
+        :param candidate_fitness_map: list of (Valuation, fitness) tuples, sorted in descending order on fitness
+        :param evaluation_time: time spent evaluating the generation, in seconds
+        """
+        genomes = [self.evaluator.get_genome(candidate) for candidate, _ in candidate_fitness_map]
+        stats = GenerationStats(
+            generation,
+            candidate_fitness_map[0][1],
+            sum(f for _, f in candidate_fitness_map) / len(candidate_fitness_map),
+            candidate_fitness_map[-1][1],
+            get_diversity(genomes, len(self.maxsat.variables)),
+            evaluation_time,
+            self.phase_times["selection"],
+            self.phase_times["crossover"],
+            self.phase_times["mutation"],
+            self.phase_times["local_search"]
+        )
+        for observer in self.observers:
+            observer.on_generation(self, stats)
+
+    def save_checkpoint(self, generation, solution, fitness):
+        """ Snapshots the state of the run and hands it to a background thread, which writes it to
+            self.checkpoint_path atomically.
+            :param generation: index of the generation self.population represents
+            :param solution: best solution found so far, if any
+            :param fitness: fitness of 'solution'
+        """
+        genome_size = (len(self.maxsat.variables) + 7) // 8
+        known_fitness = self._known_fitness
+        checkpoint = Checkpoint(
+            generation,
+            len(self.maxsat.variables),
+            self.maxsat.num_clauses,
+            [self._pack(candidate, genome_size) for candidate in self.population],
+            [known_fitness.get(candidate, nan) for candidate in self.population],
+            self.rng.getstate(),
+            self._pack(solution, genome_size) if solution is not None else None,
+            fitness,
+            self.num_evaluations
+        )
+        if self._checkpoint_writer is None:
+            self._checkpoint_writer = CheckpointWriter(self.checkpoint_path)
+        self._checkpoint_writer.submit(checkpoint)
+
+    def _pack(self, candidate, genome_size):
+        if self._is_compact(candidate):
+            return candidate.pack()
+        return CompactValuation.pack_bits(self.evaluator.get_genome(candidate)).to_bytes(genome_size, "little")
+
+    def close(self):
+        """ Releases the worker processes used for parallel evaluation, if any were started,
+            and waits for the last checkpoint to be written.
+        """
+        if isinstance(self._evaluator, ParallelEvaluator):
+            self._evaluator.close()
+        if self._checkpoint_writer is not None:
+            writer, self._checkpoint_writer = self._checkpoint_writer, None
+            writer.close()
 
     def generate_population(self):
         """ Generates a population of random candidate solutions.
-            :return: list of 'self.population_size' amount of Valuation instances
+            :return: list of 'self.population_size' amount of CompactValuation instances
         """
+        variables = self.maxsat.variables
+        index = self.maxsat.variable_index
         population = []
         for i in range(self.population_size):
-            population.append(Valuation.init_random_from_variables(self.maxsat.variables))
+            population.append(CompactValuation.init_random_from_variables(variables, index, self.rng))
         return population
 
+    def set_known_fitness(self, candidate_fitness):
+        """ Records the fitness of candidates that were evaluated before, such as candidates restored from their
+        packed form, so that 'get_population_fitness' does not evaluate them again.
+        Replaces the fitness values recorded so far.
+        :param candidate_fitness: iterable of (Valuation, fitness) tuples
+        """
+        self._known_fitness = dict(candidate_fitness)
+
     def get_population_fitness(self):
         """ Determines the fitness of each candidate solution present in self.population.
+        Candidates carried over from the previous generation keep their fitness, and so do candidates found
+        in self.fitness_cache; all others are scored in a single batched call to self.evaluator,
+        unless incremental evaluation is enabled, in which case the candidates' counters are used.
         :return: "Valuation -> fitness" mapping, sorted in descending order on fitness.
         """
-        candidate_fitness_map = {}
-
-        for candidate in self.population:
-            candidate_fitness = self.get_candidate_fitness(candidate)
-            candidate_fitness_map[candidate] = candidate_fitness
-        candidate_fitness_map = sorted(candidate_fitness_map.items(), key=itemgetter(1), reverse=True)
-
-        return candidate_fitness_map
+        known_fitness = self._known_fitness
+        candidates = [candidate for candidate in self.population if candidate not in known_fitness]
+        total_weight = self.maxsat.total_weight * 1.0
+
+        cache = self.fitness_cache
+        if cache is not None:
+            known_fitness = dict(known_fitness)
+            keys = {}
+            for candidate in candidates:
+                key = cache.get_key(self.evaluator.get_genome(candidate))
+                cached = cache.get(key)
+                if cached is None:
+                    keys[candidate] = key
+                else:
+                    known_fitness[candidate] = cached
+            candidates = list(keys)
+
+        if self.incremental and all(self._is_compact(candidate) for candidate in candidates):
+            evaluator = self.incremental_evaluator
+            scores = [evaluator.get_score(candidate) for candidate in candidates]
+        else:
+            scores = self.evaluator.get_scores(candidates)
+        self.num_evaluations += len(candidates)
+
+        fitness = dict(zip(candidates, (score / total_weight for score in scores)))
+        if cache is not None:
+            for candidate, key in keys.items():
+                cache.put(key, fitness[candidate])
+        candidate_fitness_map = [
+            (candidate, known_fitness[candidate] if candidate in known_fitness else fitness[candidate])
+            for candidate in self.population
+        ]
+        return sorted(candidate_fitness_map, key=itemgetter(1), reverse=True)
 
     def get_candidate_fitness(self, candidate):
         """
@@ -89,15 +465,27 @@ class GA:
         """
         if not isinstance(candidate, Valuation):
             raise TypeError("'candidate' must be a Valuation instance.")
+        cache = self.fitness_cache
+        if cache is not None:
+            key = cache.get_key(self.evaluator.get_genome(candidate))
+            fitness = cache.get(key)
+            if fitness is not None:
+                return fitness
         # Force division result to be a float by multiplying denominator with a float
-        return self.maxsat.get_num_satisfied_clauses(candidate) / (len(self.maxsat.clauses) * 1.0)
+        fitness = self.maxsat.get_satisfied_weight(candidate) / (self.maxsat.total_weight * 1.0)
+        if cache is not None:
+            cache.put(key, fitness)
+        return fitness
 
     def generate_next_generation(self, population):
         """
         Given a list of candidate solution with corresponding fitness values, creates the next generation of
         candidate solutions by recombining pairs of candidates in 'population' and mutating the resulting children.
-        Candidates are selected using the stochastic acceptance method, where the probability of a candidate
-        for being selected depends on its fitness.
+        All parents are drawn at once by self.selection, by default with a probability proportional to their fitness,
+        and recombined at once by self.crossover.
+        The fittest candidates that survive according to self.elitism or steady-state replacement
+        are carried over unchanged, together with their fitness.
+        In memetic mode, either the children or the survivors are then improved by self.local_search.
 
         :param population: list of (Valuation, fitness) tuples, sorted in descending order on fitness
         :return: list of Valuation instances
@@ -105,33 +493,76 @@ class GA:
         if not isinstance(population, list):
             raise TypeError("'population' must be a list.")
 
+        if self.replacement == self.STEADY_STATE:
+            num_survivors = max(self.population_size - self.steady_state_size, 0)
+        else:
+            num_survivors = min(self.elitism, self.population_size)
+        survivors = population[:num_survivors]
+        num_children = self.population_size - len(survivors)
+
         next_generation = []
-        max_fitness = population[0][1]
-
-        parent1 = None
-        parent2 = None
-        while len(next_generation) < self.population_size:
-            # Select first parent
-            while parent1 is None:
-                parent1_candidate = random.choice(population)
-                if random.randrange(0, 1) < (parent1_candidate[1] / max_fitness):
-                    parent1 = parent1_candidate[0]
-            # Select second parent
-            while parent2 is None:
-                parent2_candidate = random.choice(population)
-                if random.randrange(0, 1) < (parent2_candidate[1] / max_fitness):
-                    parent2 = parent2_candidate[0]
-            # Create offspring
-            offspring = self.create_offspring(parent1, parent2)
-            # Mutate offspring
-            for child in offspring:
-                self.mutate(child)
-
-            next_generation.extend(offspring)
-            parent1 = None
-            parent2 = None
-
-        return next_generation
+        selection_time = crossover_time = mutation_time = 0.0
+        # Without children, as when the survivors fill the population, no parents are needed
+        if num_children > 0:
+            start = perf_counter()
+            num_pairs = (num_children + 1) // 2
+            parents = self.selection.select([fitness for _, fitness in population], 2 * num_pairs, self.rng)
+            selection_time = perf_counter() - start
+
+            pairs = [(population[parents[2 * i]][0], population[parents[2 * i + 1]][0]) for i in range(num_pairs)]
+            start = perf_counter()
+            if all(self._is_compact(parent) for pair in pairs for parent in pair):
+                next_generation = self._recombine(pairs)
+            else:
+                for parent1, parent2 in pairs:
+                    next_generation.extend(self.create_offspring(parent1, parent2))
+            next_generation = next_generation[:num_children]
+            crossover_time = perf_counter() - start
+
+            start = perf_counter()
+            self.mutate_all(next_generation, population)
+            mutation_time = perf_counter() - start
+
+        start = perf_counter()
+        if self.local_search is not None and self.local_search_target == self.ELITE:
+            # Improve copies, so that the candidates of the evaluated generation keep matching their fitness
+            survivors = [(self._copy(candidate), fitness) for candidate, fitness in survivors]
+        self._known_fitness = dict(survivors)
+        if self.local_search is not None:
+            if self.local_search_target == self.OFFSPRING:
+                self.improve(next_generation)
+            else:
+                self.improve([candidate for candidate, _ in survivors])
+        local_search_time = perf_counter() - start
+
+        self.phase_times = {"selection": selection_time, "crossover": crossover_time, "mutation": mutation_time,
+                            "local_search": local_search_time}
+        return [candidate for candidate, _ in survivors] + next_generation
+
+    def improve(self, candidates):
+        """ Improves the given candidates in place by self.local_search and records their resulting fitness,
+        so that they are not evaluated again. Candidates that are not compact are left unchanged.
+        :param candidates: list of Valuation instances
+        """
+        total_weight = self.maxsat.total_weight * 1.0
+        num_flips = self.local_search.num_flips
+        for candidate in candidates:
+            if self._is_compact(candidate):
+                self._known_fitness[candidate] = self.local_search.improve(candidate, self.rng) / total_weight
+                self.num_evaluations += 1
+        # Every flip evaluates a neighbouring assignment
+        self.num_evaluations += self.local_search.num_flips - num_flips
+
+    def _copy(self, candidate):
+        """
+        :return: copy of candidate, along with its clause counters, if it is compact; candidate itself otherwise
+        """
+        if not self._is_compact(candidate):
+            return candidate
+        copy = candidate.copy()
+        if candidate.clause_counters is not None:
+            copy.clause_counters = candidate.clause_counters.copy()
+        return copy
 
     def create_offspring(self, parent1, parent2, crossover_index=None):
         """
@@ -151,11 +582,14 @@ class GA:
         :return:
             list of Valuation instances generated by recombining parent1 and parent2
         """
-        if not isinstance(parent1, Valuation) and isinstance(parent2, Valuation):
-            raise TypeError("'parent1' and 'parent'2 must be Valuation instances.")
+        if not (isinstance(parent1, Valuation) and isinstance(parent2, Valuation)):
+            raise TypeError("'parent1' and 'parent2' must be Valuation instances.")
         if crossover_index is not None and not isinstance(crossover_index, int):
             raise TypeError("'crossover_index' must be an int.")
 
+        if self._is_compact(parent1) and self._is_compact(parent2):
+            return self._create_compact_offspring(parent1, parent2, crossover_index)
+
         # Create valuations for offspring
         child1_valuation = {}
         child2_valuation = {}
@@ -163,7 +597,7 @@ class GA:
         variables = list(self.maxsat.variables)
         # Randomly pick crossover index
         if crossover_index is None:
-            crossover_index = random.randint(0, len(variables) - 1)
+            crossover_index = self.rng.randint(0, len(variables) - 1)
 
         # Up to and including crossover_index, copy parent1 to child1 and parent2 to child2
         for i in range(crossover_index + 1):
@@ -180,23 +614,113 @@ class GA:
 
         return [child1, child2]
 
-    def mutate(self, candidate):
+    def _create_compact_offspring(self, parent1, parent2, crossover_index):
+        """ Performs the recombination of 'create_offspring' on whole slices of the parents' values.
         """
-        Flips the value for each variable in the given Valuation instance with probability self.p_mutation.
+        values1 = parent1.values
+        values2 = parent2.values
+        if crossover_index is None:
+            crossover_index = self.rng.randint(0, len(values1) - 1)
+        split = crossover_index + 1
+
+        child1 = CompactValuation.from_trusted(parent1.variables, values1[:split] + values2[split:], parent1.index)
+        child2 = CompactValuation.from_trusted(parent1.variables, values2[:split] + values1[split:], parent1.index)
+
+        if self.incremental:
+            # Reuse the parents' counters for the segments the children inherit from them
+            self.incremental_evaluator.derive(child1, [parent1, parent2])
+            self.incremental_evaluator.derive(child2, [parent2, parent1])
+
+        return [child1, child2]
+
+    def _recombine(self, pairs):
+        """ Recombines all pairs of compact parents at once by self.crossover.
+        :param pairs: list of (parent1, parent2) tuples of CompactValuation instances
+        :return: list containing two CompactValuation children per pair
+        """
+        variables = self.maxsat.variables
+        index = self.maxsat.variable_index
+        genomes = self.crossover.recombine([(parent1.values, parent2.values) for parent1, parent2 in pairs],
+                                           len(variables), self.rng)
+        children = [CompactValuation.from_trusted(variables, genome, index) for genome in genomes]
+
+        if self.incremental:
+            # Reuse the parents' counters for the segments the children inherit from them
+            for i, (parent1, parent2) in enumerate(pairs):
+                self.incremental_evaluator.derive(children[2 * i], [parent1, parent2])
+                self.incremental_evaluator.derive(children[2 * i + 1], [parent2, parent1])
+        return children
+
+    def _is_compact(self, candidate):
+        """
+        :return: True if 'candidate' is a CompactValuation ordered by the variables of self.maxsat
+        """
+        return isinstance(candidate, CompactValuation) and candidate.index is self.maxsat.variable_index
+
+    def mutate_all(self, children, population):
+        """
+        Mutates all children of a generation at once: self.mutation determines the mutation rate
+        and samples the positions to flip over all children's values together.
+        :param children: list of Valuation instances to mutate
+        :param population: list of (Valuation, fitness) tuples the children were bred from
+        """
+        diversity = None
+        if self.mutation.uses_diversity:
+            genomes = [self.evaluator.get_genome(candidate) for candidate, _ in population]
+            diversity = get_diversity(genomes, len(self.maxsat.variables))
+        self.mutation_rate = rate = self.mutation.get_rate(self.generation, diversity)
+
+        if not all(self._is_compact(child) for child in children):
+            for child in children:
+                self.mutate(child, rate)
+            return
+
+        flips = self.mutation.sample(len(children), len(self.maxsat.variables), rate, self.rng)
+        for child, ordinals in zip(children, flips):
+            self._flip(child, ordinals)
+
+    def mutate(self, candidate, rate=None):
+        """
+        Flips the value for each variable in the given Valuation instance with probability 'rate'.
         :param candidate: Valuation instance to mutate
+        :param rate: mutation rate; self.p_mutation by default
         :return: updated Valuation instance
         """
         if not isinstance(candidate, Valuation):
             raise TypeError("'candidate' must be a Valuation instance.")
+        if rate is None:
+            rate = self.p_mutation
 
-        valuation = candidate.valuation
+        if isinstance(candidate, CompactValuation):
+            self._flip(candidate, sample_positions(len(candidate), rate, self.rng))
+            return candidate
 
-        for variable, value in valuation.items():
-            if random.uniform(0, 1) < self.p_mutation:
-                candidate.set_value_for_variable(variable, not value)
+        items = list(candidate.valuation.items())
+        for i in sample_positions(len(items), rate, self.rng):
+            variable, value = items[i]
+            candidate.set_value_for_variable(variable, not value)
 
         return candidate
 
+    def _flip(self, candidate, ordinals):
+        if not ordinals:
+            return
+        if self.incremental:
+            self.incremental_evaluator.flip(candidate, ordinals)
+        else:
+            candidate.flip_values(ordinals)
+
+    @property
+    def p_mutation(self):
+        """
+        :return: base mutation rate of self.mutation
+        """
+        return self.mutation.rate
+
+    @p_mutation.setter
+    def p_mutation(self, p_mutation):
+        self.mutation.rate = p_mutation
+
     @property
     def maxsat(self):
         return self._maxsat
@@ -205,7 +729,35 @@ class GA:
     def maxsat(self, maxsat):
         if not isinstance(maxsat, MAXSAT):
             raise TypeError("'maxsat' must be a maxsat instance.")
+        self.close()
         self._maxsat = maxsat
+        self._evaluator = None
+        self._incremental_evaluator = None
+        self._known_fitness = {}
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+
+    @property
+    def evaluator(self):
+        """
+        :return: PopulationEvaluator for self.maxsat, compiled on first use;
+            a ParallelEvaluator if more than one worker is configured
+        """
+        if self._evaluator is None:
+            if self.workers > 1:
+                self._evaluator = ParallelEvaluator(self.maxsat, self.workers)
+            else:
+                self._evaluator = PopulationEvaluator(self.maxsat)
+        return self._evaluator
+
+    @property
+    def incremental_evaluator(self):
+        """
+        :return: IncrementalEvaluator for self.maxsat, created on first use
+        """
+        if self._incremental_evaluator is None:
+            self._incremental_evaluator = IncrementalEvaluator(self.maxsat)
+        return self._incremental_evaluator
 
     @property
     def population(self):
@@ -0,0 +1,162 @@
+from array import array
+from itertools import compress
+from operator import xor
+
+from algorithm.compact_valuation import CompactValuation
+from sat.maxsat import MAXSAT
+
+
+class ClauseCounters:
+    """ Cached evaluation state of a single candidate: the number of true literals in each clause,
+        the resulting number of satisfied clauses and, for weighted problems, their total weight.
+    """
+
+    __slots__ = ("counts", "num_satisfied", "satisfied_weight")
+
+    def __init__(self, counts, num_satisfied, satisfied_weight=None):
+        self.counts = counts
+        self.num_satisfied = num_satisfied
+        self.satisfied_weight = satisfied_weight
+
+    def copy(self):
+        return ClauseCounters(array(self.counts.typecode, self.counts), self.num_satisfied, self.satisfied_weight)
+
+
+class IncrementalEvaluator:
+    """ Determines the number of satisfied clauses of CompactValuation instances incrementally.
+        Each candidate keeps ClauseCounters, which are updated through the variable-to-clause occurrence index
+        of the problem: flipping a variable costs O(occurrences of the variable) instead of O(clauses).
+    """
+
+    def __init__(self, maxsat):
+        if not isinstance(maxsat, MAXSAT):
+            raise TypeError("'maxsat' must be an instance of MAXSAT.")
+
+        self._maxsat = maxsat
+        self._clauses = maxsat.clause_store
+        self._occurrences = maxsat.occurrences
+        self._weights = maxsat.clause_weights
+        self._num_literals = len(self._clauses.literals)
+
+    def get_num_satisfied_clauses(self, candidate):
+        """
+        :param candidate: CompactValuation instance to evaluate
+        :return: number of clauses satisfied by candidate
+        """
+        if candidate.clause_counters is None:
+            candidate.clause_counters = self.count(candidate.values)
+        return candidate.clause_counters.num_satisfied
+
+    def get_score(self, candidate):
+        """
+        :param candidate: CompactValuation instance to evaluate
+        :return: score of candidate, as defined by MAXSAT.get_satisfied_weight
+        """
+        if candidate.clause_counters is None:
+            candidate.clause_counters = self.count(candidate.values)
+        if self._weights is None:
+            return candidate.clause_counters.num_satisfied
+        return candidate.clause_counters.satisfied_weight
+
+    def count(self, values):
+        """ Evaluates every clause from scratch.
+        :param values: bytes-like object holding one 0/1 byte per variable
+        :return: ClauseCounters for the given values
+        """
+        counts = array("i", bytes(4 * len(self._clauses)))
+        num_satisfied = 0
+        for i, clause in enumerate(self._clauses):
+            count = 0
+            for literal in clause:
+                if literal > 0:
+                    count += values[literal - 1]
+                else:
+                    count += 1 - values[-literal - 1]
+            counts[i] = count
+            if count:
+                num_satisfied += 1
+
+        satisfied_weight = None
+        if self._weights is not None:
+            satisfied_weight = sum(w for w, count in zip(self._weights, counts) if count)
+        return ClauseCounters(counts, num_satisfied, satisfied_weight)
+
+    def flip(self, candidate, ordinals):
+        """ Negates the values for the given ordinals and updates the candidate's counters accordingly.
+        :param candidate: CompactValuation instance to update
+        :param ordinals: iterable of variable ordinals to flip
+        """
+        if not isinstance(candidate, CompactValuation):
+            raise TypeError("'candidate' must be a CompactValuation instance.")
+
+        counters = candidate.clause_counters
+        if counters is None:
+            candidate.flip_values(ordinals)
+            return
+
+        ordinals = list(ordinals)
+        values = candidate.values
+        for i in ordinals:
+            values[i] ^= 1
+        self._update(counters, values, ordinals)
+
+    def derive(self, child, parents):
+        """
+        Derives the counters of 'child' from those of the parent it differs least from, by replaying the differing
+        values as flips. When replaying would touch more literals than a full evaluation does,
+        the child's counters are left to be computed on demand.
+
+        :param child: CompactValuation instance created by recombining 'parents'
+        :param parents: list of CompactValuation instances
+        """
+        values = child.values
+        best_parent = None
+        best_changes = None
+        best_cost = self._num_literals
+        for parent in parents:
+            if parent.clause_counters is None:
+                continue
+            changes = list(compress(range(len(values)), map(xor, values, parent.values)))
+            cost = sum(self._occurrences.get_length(i) for i in changes)
+            if cost < best_cost:
+                best_parent, best_changes, best_cost = parent, changes, cost
+
+        if best_parent is None:
+            child.clause_counters = None
+            return
+
+        counters = best_parent.clause_counters.copy()
+        self._update(counters, values, best_changes)
+        child.clause_counters = counters
+
+    def _update(self, counters, values, ordinals):
+        """ Updates 'counters' for variables whose value in 'values' has just been negated.
+        """
+        counts = counters.counts
+        num_satisfied = counters.num_satisfied
+        occurrences = self._occurrences
+        weights = self._weights
+        satisfied_weight = counters.satisfied_weight
+        for i in ordinals:
+            value = values[i] == 1
+            for reference in occurrences[i]:
+                # Clause reference j + 1 (-(j + 1)): the variable occurs positively (negatively) in clause j
+                clause = abs(reference) - 1
+                if (reference > 0) == value:
+                    counts[clause] += 1
+                    if counts[clause] == 1:
+                        num_satisfied += 1
+                        if weights is not None:
+                            satisfied_weight += weights[clause]
+                else:
+                    counts[clause] -= 1
+                    if counts[clause] == 0:
+                        num_satisfied -= 1
+                        if weights is not None:
+                            satisfied_weight -= weights[clause]
+        counters.num_satisfied = num_satisfied
+        counters.satisfied_weight = satisfied_weight
+
+    @property
+    def maxsat(self):
+        return self._maxsat
@@ -0,0 +1,216 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.ga import GA
+from algorithm.seed_sequence import SeedSequence
+from sat.maxsat import MAXSAT
+
+# GA of a worker process, created once by _initialize_worker
+_worker_ga = None
+
+
+def _initialize_worker(maxsat, population_size, fitness_threshold):
+    global _worker_ga
+    _worker_ga = GA(maxsat, population_size=population_size, fitness_threshold=fitness_threshold)
+
+
+def _run_epoch(island, packed_population, fitness, generations, seed):
+    """
+    Evolves the population of a single island for at most 'generations' generations.
+    :param island: index of the island
+    :param packed_population: list of ints in which bit i holds the value for variable ordinal i,
+        or None to start from a random population
+    :param fitness: list containing the fitness of each candidate of 'packed_population', or None for candidates
+        that were not evaluated yet, such as immigrants; None if 'packed_population' is None
+    :param generations: maximum number of generations to execute
+    :param seed: seed for the random number generator of this epoch
+    :return: tuple containing the island index, its packed population and corresponding fitness values
+        (sorted in descending order on fitness), the number of generations executed,
+        the number of fitness evaluations performed, and the best packed candidate found during the epoch
+        and its fitness, which the final population no longer holds if it was lost in a later generation
+    """
+    ga = _worker_ga
+    ga.rng = random.Random(seed)
+    variables = ga.maxsat.variables
+    index = ga.maxsat.variable_index
+
+    if packed_population is None:
+        ga.population = ga.generate_population()
+        ga.set_known_fitness([])
+    else:
+        ga.population = [
+            CompactValuation(variables, CompactValuation.unpack_bits(bits, len(variables)), index)
+            for bits in packed_population
+        ]
+        # Only the candidates that were not evaluated in the previous epoch are scored
+        ga.set_known_fitness((candidate, f) for candidate, f in zip(ga.population, fitness) if f is not None)
+
+    iterations = 0
+    ga.num_evaluations = 0
+    candidate_fitness_map = ga.get_population_fitness()
+    best, best_fitness = candidate_fitness_map[0]
+    while candidate_fitness_map[0][1] < ga.fitness_threshold and iterations < generations:
+        ga.population = ga.generate_next_generation(candidate_fitness_map)
+        candidate_fitness_map = ga.get_population_fitness()
+        iterations += 1
+        if candidate_fitness_map[0][1] > best_fitness:
+            best, best_fitness = candidate_fitness_map[0]
+
+    packed_population = [CompactValuation.pack_bits(candidate.values) for candidate, _ in candidate_fitness_map]
+    fitness = [f for _, f in candidate_fitness_map]
+    return island, packed_population, fitness, iterations, ga.num_evaluations, \
+        CompactValuation.pack_bits(best.values), best_fitness
+
+
+class IslandModel:
+    """ Island-model genetic algorithm for the MAXSAT problem.
+        Evolves several independent GA populations ('islands') in separate processes and,
+        every 'migration_interval' generations, copies the fittest candidates of each island
+        to its neighbours, where they replace the least fit candidates.
+        Migrants are exchanged as packed bit vectors.
+    """
+
+    RING = "ring"
+    FULLY_CONNECTED = "fully_connected"
+
+    def __init__(self, maxsat, islands=4, migration_interval=5, migration_size=2, topology=RING,
+                 max_iterations=100, population_size=16, fitness_threshold=0.75, workers=None, seed=None):
+        """
+        Creates an island model for the given MAXSAT problem.
+        :param maxsat:
+                MAXSAT problem instance to solve
+        :param islands:
+                number of populations to evolve
+        :param migration_interval:
+                number of generations between migrations
+        :param migration_size:
+                number of fittest candidates each island sends to each of its neighbours
+        :param topology:
+                IslandModel.RING to send migrants to the next island only,
+                IslandModel.FULLY_CONNECTED to send them to every other island
+        :param max_iterations:
+                maximum number of generations to execute per island
+        :param population_size:
+                size of the candidate solution pool of each island
+        :param fitness_threshold:
+                fitness value that, if reached by any island, allows termination
+        :param workers:
+                number of processes to use; defaults to one per island
+        :param seed:
+                seed from which the random number generators of the islands are derived, as accepted by SeedSequence
+        """
+        if not isinstance(maxsat, MAXSAT):
+            raise TypeError("'maxsat' must be an instance of MAXSAT.")
+        if topology not in (self.RING, self.FULLY_CONNECTED):
+            raise ValueError("'topology' must be either IslandModel.RING or IslandModel.FULLY_CONNECTED.")
+        if islands < 1:
+            raise ValueError("'islands' must be at least 1.")
+        if migration_interval < 1:
+            raise ValueError("'migration_interval' must be at least 1.")
+        if migration_size < 0:
+            raise ValueError("'migration_size' cannot be negative.")
+        if max_iterations < 0:
+            raise ValueError("'max_iterations' cannot be negative.")
+
+        self.maxsat = maxsat
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.max_iterations = max_iterations
+        self.population_size = population_size
+        self.fitness_threshold = fitness_threshold
+        self.workers = workers or islands
+        # Reject seeds SeedSequence cannot derive entropy from now rather than in 'run'
+        SeedSequence(seed)
+        self.seed = seed
+
+    def run(self):
+        """ Evolves all islands until any of them meets the fitness criterion
+            or the maximum number of iterations has been reached.
+            :return:    tuple containing the best solution over all islands,
+                        its corresponding fitness value,
+                        and a list containing a dict of statistics per island
+        """
+        # Each island draws the seeds of its epochs from its own sequence
+        sequences = SeedSequence(self.seed).spawn(self.islands)
+        populations = [None] * self.islands
+        fitness = [None] * self.islands
+        # Best packed candidate found by any island in any epoch, and its fitness
+        best = None
+        best_fitness = None
+        statistics = [
+            {"island": i, "best_fitness": 0.0, "generations": 0, "evaluations": 0, "immigrants": 0}
+            for i in range(self.islands)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_worker,
+            initargs=(self.maxsat, self.population_size, self.fitness_threshold)
+        ) as pool:
+            iteration = 0
+            while True:
+                generations = min(self.migration_interval, self.max_iterations - iteration)
+                futures = [
+                    pool.submit(_run_epoch, i, populations[i], fitness[i], generations,
+                                sequences[i].spawn(1)[0].generate_seed())
+                    for i in range(self.islands)
+                ]
+                for future in futures:
+                    island, packed_population, island_fitness, iterations, evaluations, epoch_best, \
+                        epoch_best_fitness = future.result()
+                    populations[island] = packed_population
+                    fitness[island] = island_fitness
+                    statistics[island]["best_fitness"] = max(statistics[island]["best_fitness"], epoch_best_fitness)
+                    if best_fitness is None or epoch_best_fitness > best_fitness:
+                        best, best_fitness = epoch_best, epoch_best_fitness
+                    statistics[island]["generations"] += iterations
+                    statistics[island]["evaluations"] += evaluations
+
+                iteration += generations
+                if iteration >= self.max_iterations or best_fitness >= self.fitness_threshold:
+                    break
+                self.migrate(populations, statistics, fitness)
+
+        variables = self.maxsat.variables
+        solution = CompactValuation(
+            variables,
+            CompactValuation.unpack_bits(best, len(variables)),
+            self.maxsat.variable_index
+        )
+        return solution, best_fitness, statistics
+
+    def migrate(self, populations, statistics, fitness=None):
+        """
+        Replaces the least fit candidates of each island by the fittest candidates of its neighbours.
+        :param populations: list containing, per island, a list of packed candidates sorted in descending order on fitness
+        :param statistics: list containing a dict of statistics per island
+        :param fitness: optional list containing, per island, the fitness of each of its candidates;
+            the fitness of the replaced candidates is set to None, so that the receiving island evaluates the arrivals
+        """
+        immigrants = [[] for _ in populations]
+        for island, population in enumerate(populations):
+            emigrants = population[:self.migration_size]
+            for target in self.get_migration_targets(island):
+                immigrants[target].extend(emigrants)
+
+        for island, population in enumerate(populations):
+            arrivals = immigrants[island][:len(population) - 1]
+            if arrivals:
+                population[len(population) - len(arrivals):] = arrivals
+                statistics[island]["immigrants"] += len(arrivals)
+                if fitness is not None:
+                    fitness[island][len(population) - len(arrivals):] = [None] * len(arrivals)
+
+    def get_migration_targets(self, island):
+        """
+        :param island: index of the island sending migrants
+        :return: list of indices of the islands receiving migrants from 'island'
+        """
+        if self.islands == 1:
+            return []
+        if self.topology == self.RING:
+            return [(island + 1) % self.islands]
+        return [i for i in range(self.islands) if i != island]
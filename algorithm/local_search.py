@@ -0,0 +1,295 @@
+import random
+from array import array
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.incremental_evaluator import ClauseCounters, IncrementalEvaluator
+from sat.maxsat import MAXSAT
+
+
+class LocalSearch:
+    """ Bounded WalkSAT or GSAT local search on CompactValuation instances, as used by the memetic mode of the GA.
+        For every variable it maintains its break count (number of clauses in which it is the only true literal)
+        and its make count (number of unsatisfied clauses it occurs in), updated through the occurrence index,
+        so that each flip costs O(occurrences of the variable) instead of a rescan of all clauses.
+        GSAT keeps the variables in buckets by score (make count minus break count), which a flip updates
+        for the variables sharing a clause with the flipped one, so that picking the best variable costs
+        O(distinct scores) instead of a scan of all variables.
+        For weighted problems, the counts are weighted by the clause weights of MAXSAT.clause_weights.
+        Clauses repeating a literal are searched without the repetitions, which would otherwise be counted
+        as several true literals. Clauses without literals are never picked to be satisfied, as no flip can
+        satisfy them, but their weight still counts against the score.
+    """
+
+    WALKSAT = "walksat"
+    GSAT = "gsat"
+
+    def __init__(self, maxsat, method=WALKSAT, max_flips=100, noise=0.5):
+        """
+        :param maxsat: MAXSAT instance whose clauses to satisfy
+        :param method: LocalSearch.WALKSAT or LocalSearch.GSAT
+        :param max_flips: maximum number of flips per call to 'improve'
+        :param noise: probability of a random walk step instead of a greedy one
+        """
+        if not isinstance(maxsat, MAXSAT):
+            raise TypeError("'maxsat' must be an instance of MAXSAT.")
+        if method not in (self.WALKSAT, self.GSAT):
+            raise ValueError("'method' must be either LocalSearch.WALKSAT or LocalSearch.GSAT.")
+        if max_flips < 0:
+            raise ValueError("'max_flips' cannot be negative.")
+        if not 0 <= noise <= 1:
+            raise ValueError("'noise' must be between 0 and 1.")
+
+        clauses = maxsat.clause_store
+        occurrences = maxsat.occurrences
+        # Indices of the clauses repeating a literal, whose counts differ between the problem and the search
+        self._repeated = [i for i, clause in enumerate(clauses) if len(set(clause)) < len(clause)]
+        if self._repeated:
+            problem = MAXSAT.from_clause_store(maxsat.variables, [tuple(dict.fromkeys(clause)) for clause in clauses])
+            clauses, occurrences = problem.clause_store, problem.occurrences
+
+        # Number of clauses without literals, which every assignment falsifies
+        self._num_empty = sum(1 for clause in clauses if not clause)
+
+        self._maxsat = maxsat
+        self._clauses = clauses
+        self._occurrences = occurrences
+        self._weights = maxsat.clause_weights
+        self._evaluator = IncrementalEvaluator(maxsat)
+
+        self.method = method
+        self.max_flips = max_flips
+        self.noise = noise
+        # Number of flips made so far, over all calls to 'improve'
+        self.num_flips = 0
+
+    def improve(self, candidate, rng=None):
+        """
+        Runs the local search from 'candidate' until every clause is satisfied or the flip budget is spent,
+        and leaves it at the best assignment found. Its clause counters are kept up to date.
+        :param candidate: CompactValuation instance sharing the problem's variable index; modified in place
+        :param rng: random.Random instance to draw from; the random module if None
+        :return: score of the improved candidate, as defined by MAXSAT.get_satisfied_weight
+        """
+        if not isinstance(candidate, CompactValuation) or candidate.index is not self._maxsat.variable_index:
+            raise TypeError("'candidate' must be a CompactValuation instance over the problem's variables.")
+
+        counters = candidate.clause_counters
+        counters = counters.copy() if counters is not None else self._evaluator.count(candidate.values)
+        if self._repeated:
+            self._recount(counters.counts, candidate.values, self._clauses)
+        state = _SearchState(self._clauses, self._occurrences, self._weights, candidate.values, counters.counts,
+                             self.method == self.GSAT)
+
+        best_unsatisfied_weight = state.unsatisfied_weight
+        best_flip = 0
+        trail = []
+        rng = rng or random
+        pick = self._pick_walksat if self.method == self.WALKSAT else self._pick_gsat
+        while state.unsatisfied and len(trail) < self.max_flips:
+            variable = pick(state, rng)
+            state.flip(variable)
+            trail.append(variable)
+            if state.unsatisfied_weight < best_unsatisfied_weight:
+                best_unsatisfied_weight, best_flip = state.unsatisfied_weight, len(trail)
+
+        # Undo the flips made after the best assignment was found
+        for variable in reversed(trail[best_flip:]):
+            state.flip(variable)
+        self.num_flips += len(trail) + len(trail) - best_flip
+        if self._repeated:
+            self._recount(state.counts, candidate.values, self._maxsat.clause_store)
+
+        num_satisfied = len(self._clauses) - len(state.unsatisfied) - self._num_empty
+        if self._weights is None:
+            candidate.clause_counters = ClauseCounters(state.counts, num_satisfied)
+            return num_satisfied
+        satisfied_weight = sum(w for w, count in zip(self._weights, state.counts) if count)
+        candidate.clause_counters = ClauseCounters(state.counts, num_satisfied, satisfied_weight)
+        return satisfied_weight
+
+    def _recount(self, counts, values, clauses):
+        """ Recounts the true literals of the clauses repeating a literal, as they occur in 'clauses'.
+        """
+        for i in self._repeated:
+            counts[i] = sum(values[literal - 1] if literal > 0 else 1 - values[-literal - 1] for literal in clauses[i])
+
+    def _pick_walksat(self, state, rng):
+        clause = self._clauses[rng.choice(state.unsatisfied)]
+        if rng.random() < self.noise:
+            return abs(rng.choice(clause)) - 1
+
+        breaks = state.breaks
+        best = None
+        for literal in clause:
+            variable = abs(literal) - 1
+            if breaks[variable] == 0:
+                # Flipping the variable does not break any clause
+                return variable
+            if best is None or breaks[variable] < breaks[best]:
+                best = variable
+        return best
+
+    def _pick_gsat(self, state, rng):
+        if rng.random() < self.noise:
+            return abs(rng.choice(self._clauses[rng.choice(state.unsatisfied)])) - 1
+
+        buckets = state.buckets
+        return rng.choice(buckets[max(buckets)])
+
+    @property
+    def maxsat(self):
+        return self._maxsat
+
+
+class _SearchState:
+    """ Break and make counts of a single assignment, and the set of clauses with literals it leaves unsatisfied.
+        Optionally, the score of every variable, and the variables by score.
+    """
+
+    __slots__ = ("clauses", "occurrences", "weights", "values", "counts", "breaks", "makes",
+                 "unsatisfied", "positions", "unsatisfied_weight", "scores", "buckets", "bucket_positions")
+
+    def __init__(self, clauses, occurrences, weights, values, counts, scored=False):
+        num_variables = len(values)
+        self.clauses = clauses
+        self.occurrences = occurrences
+        # Without weights, every clause weighs 1
+        self.weights = weights if weights is not None else _Unweighted()
+        self.values = values
+        self.counts = counts
+        typecode = "i" if weights is None else "d"
+        self.breaks = array(typecode, bytes(array(typecode).itemsize * num_variables))
+        self.makes = array(typecode, bytes(array(typecode).itemsize * num_variables))
+        # Unsatisfied clauses, with the position of each one in the list for O(1) removal
+        self.unsatisfied = []
+        self.positions = {}
+        self.unsatisfied_weight = 0
+
+        for i, clause in enumerate(clauses):
+            count = counts[i]
+            if not clause:
+                # No flip can satisfy the clause, so it is only accounted for in the unsatisfied weight
+                self.unsatisfied_weight += self.weights[i]
+            elif count == 0:
+                self._add_unsatisfied(i, clause)
+            elif count == 1:
+                self.breaks[self._get_true_variable(clause)] += self.weights[i]
+
+        self.scores = None
+        self.buckets = None
+        self.bucket_positions = None
+        if scored:
+            self.scores = [make - break_count for make, break_count in zip(self.makes, self.breaks)]
+            self.buckets = {}
+            self.bucket_positions = [0] * num_variables
+            for variable in range(num_variables):
+                self._add_to_bucket(variable)
+
+    def flip(self, variable):
+        """ Negates the value of 'variable' and updates the counts accordingly.
+        """
+        values = self.values
+        counts = self.counts
+        breaks = self.breaks
+        clauses = self.clauses
+        weights = self.weights
+        values[variable] ^= 1
+        value = values[variable] == 1
+
+        for reference in self.occurrences[variable]:
+            # Clause reference j + 1 (-(j + 1)): the variable occurs positively (negatively) in clause j
+            i = abs(reference) - 1
+            count = counts[i]
+            if (reference > 0) == value:
+                counts[i] = count + 1
+                if count == 0:
+                    self._remove_unsatisfied(i, clauses[i])
+                    breaks[variable] += weights[i]
+                elif count == 1:
+                    breaks[self._get_true_variable(clauses[i], variable)] -= weights[i]
+            else:
+                counts[i] = count - 1
+                if count == 1:
+                    breaks[variable] -= weights[i]
+                    self._add_unsatisfied(i, clauses[i])
+                elif count == 2:
+                    breaks[self._get_true_variable(clauses[i])] += weights[i]
+
+        if self.scores is not None:
+            self._update_scores(variable)
+
+    def _update_scores(self, variable):
+        """ Moves the variables whose score changed by flipping 'variable' to their new bucket.
+            Only variables sharing a clause with 'variable' can have a changed make or break count.
+        """
+        clauses = self.clauses
+        makes = self.makes
+        breaks = self.breaks
+        scores = self.scores
+        touched = {variable}
+        for reference in self.occurrences[variable]:
+            touched.update(abs(literal) - 1 for literal in clauses[abs(reference) - 1])
+        for other in touched:
+            score = makes[other] - breaks[other]
+            if score != scores[other]:
+                self._remove_from_bucket(other)
+                scores[other] = score
+                self._add_to_bucket(other)
+
+    def _add_to_bucket(self, variable):
+        bucket = self.buckets.setdefault(self.scores[variable], [])
+        self.bucket_positions[variable] = len(bucket)
+        bucket.append(variable)
+
+    def _remove_from_bucket(self, variable):
+        score = self.scores[variable]
+        bucket = self.buckets[score]
+        position = self.bucket_positions[variable]
+        last = bucket.pop()
+        if last != variable:
+            bucket[position] = last
+            self.bucket_positions[last] = position
+        if not bucket:
+            del self.buckets[score]
+
+    def _get_true_variable(self, clause, excluded=None):
+        """
+        :return: ordinal of a variable other than 'excluded' whose literal in 'clause' is true
+        """
+        values = self.values
+        for literal in clause:
+            variable = abs(literal) - 1
+            if variable != excluded and (values[variable] == 1) == (literal > 0):
+                return variable
+        return excluded
+
+    def _add_unsatisfied(self, i, clause):
+        self.positions[i] = len(self.unsatisfied)
+        self.unsatisfied.append(i)
+        weight = self.weights[i]
+        self.unsatisfied_weight += weight
+        makes = self.makes
+        for literal in clause:
+            makes[abs(literal) - 1] += weight
+
+    def _remove_unsatisfied(self, i, clause):
+        position = self.positions.pop(i)
+        last = self.unsatisfied.pop()
+        if last != i:
+            self.unsatisfied[position] = last
+            self.positions[last] = position
+        weight = self.weights[i]
+        self.unsatisfied_weight -= weight
+        makes = self.makes
+        for literal in clause:
+            makes[abs(literal) - 1] -= weight
+
+
+class _Unweighted:
+    """ Stands in for the clause weights of an unweighted problem.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, i):
+        return 1
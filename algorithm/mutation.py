@@ -0,0 +1,114 @@
+import random
+from math import log
+
+
+def sample_positions(count, probability, rng=None):
+    """
+    Selects each of 'count' positions independently with the given probability, by drawing the gaps between
+    selected positions from a geometric distribution: one random number per selected position
+    instead of one per position.
+
+    :param count: number of positions to select from
+    :param probability: probability of selecting each position
+    :param rng: random.Random instance to draw from; the random module if None
+    :return: sorted list of selected positions
+    """
+    if probability <= 0 or count <= 0:
+        return []
+    if probability >= 1:
+        return list(range(count))
+
+    draw = (rng or random).random
+    log_q = log(1.0 - probability)
+    positions = []
+    position = -1
+    while True:
+        # 1 - random() lies in (0, 1], so the logarithm is defined
+        position += 1 + int(log(1.0 - draw()) / log_q)
+        if position >= count:
+            return positions
+        positions.append(position)
+
+
+class Mutation:
+    """ Bit-flip mutation of a whole generation of children at once, with a constant mutation rate.
+        Subclasses adapt the rate per generation through 'get_rate'.
+    """
+
+    # Whether 'get_rate' depends on the diversity of the population, which is then measured every generation
+    uses_diversity = False
+
+    def __init__(self, rate=0.01):
+        """
+        :param rate: probability of flipping each value
+        """
+        self.rate = rate
+
+    def get_rate(self, generation, diversity=None):
+        """
+        :param generation: index of the generation whose children are mutated
+        :param diversity: diversity of the parent population, as determined by observer.get_diversity,
+            if 'uses_diversity' is set
+        :return: mutation rate for the generation
+        """
+        return self.rate
+
+    def sample(self, num_children, num_variables, rate, rng=None):
+        """
+        Samples the flips of all children at once, over the 'num_children x num_variables' matrix of their values.
+        :param num_children: number of children to mutate
+        :param num_variables: number of variables in each child
+        :param rate: probability of flipping each value
+        :param rng: random.Random instance to draw from; the random module if None
+        :return: list containing, for each child, the list of ordinals to flip
+        """
+        flips = [[] for _ in range(num_children)]
+        if num_variables == 0:
+            return flips
+        for position in sample_positions(num_children * num_variables, rate, rng):
+            child, ordinal = divmod(position, num_variables)
+            flips[child].append(ordinal)
+        return flips
+
+
+class DecayingMutation(Mutation):
+    """ Mutation whose rate decays exponentially from 'rate' to 'final_rate' over 'generations' generations,
+        shifting from exploration to exploitation; it stays at 'final_rate' afterwards.
+    """
+
+    def __init__(self, rate=0.05, final_rate=0.001, generations=100):
+        if rate <= 0 or final_rate <= 0:
+            raise ValueError("'rate' and 'final_rate' must be positive.")
+        if generations < 1:
+            raise ValueError("'generations' must be at least 1.")
+        super().__init__(rate)
+        self.final_rate = final_rate
+        self.generations = generations
+
+    def get_rate(self, generation, diversity=None):
+        progress = min(generation, self.generations) / float(self.generations)
+        return self.rate * (self.final_rate / self.rate) ** progress
+
+
+class DiversityAdaptiveMutation(Mutation):
+    """ Mutation whose rate grows as the population converges: 'rate' is scaled by the ratio of
+        'target_diversity' to the measured diversity and kept between 'min_rate' and 'max_rate'.
+        The rate only depends on the current population, so resuming a run from a checkpoint reproduces it.
+    """
+
+    uses_diversity = True
+
+    def __init__(self, rate=0.01, target_diversity=0.25, min_rate=0.001, max_rate=0.1):
+        if not 0 < target_diversity <= 1:
+            raise ValueError("'target_diversity' must be between 0 and 1.")
+        if min_rate > max_rate:
+            raise ValueError("'min_rate' cannot exceed 'max_rate'.")
+        super().__init__(rate)
+        self.target_diversity = target_diversity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+
+    def get_rate(self, generation, diversity=None):
+        if not diversity:
+            return self.max_rate
+        return min(self.max_rate, max(self.min_rate, self.rate * self.target_diversity / diversity))
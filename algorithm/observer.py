@@ -0,0 +1,155 @@
+import cProfile
+import logging
+import pstats
+import tracemalloc
+
+from algorithm.population_evaluator import transpose_genomes
+
+logger = logging.getLogger(__name__)
+
+
+def get_diversity(genomes, num_variables):
+    """
+    :param genomes: list of bytes-like objects holding one 0/1 byte per variable
+    :param num_variables: number of variables in each genome
+    :return: mean Hamming distance between two genomes drawn from 'genomes', as a fraction of 'num_variables'
+    """
+    population_size = len(genomes)
+    if population_size == 0 or num_variables == 0:
+        return 0.0
+
+    total = 0
+    for column in transpose_genomes(genomes, num_variables):
+        ones = bin(column).count("1")
+        total += ones * (population_size - ones)
+    return 2.0 * total / (population_size * population_size * num_variables)
+
+
+class GenerationStats:
+    """ Statistics of a single GA generation, as passed to GenerationObserver.on_generation.
+        Times are in seconds.
+    """
+
+    __slots__ = ("generation", "best_fitness", "mean_fitness", "worst_fitness", "diversity",
+                 "evaluation_time", "selection_time", "crossover_time", "mutation_time", "local_search_time")
+
+    def __init__(self, generation, best_fitness, mean_fitness, worst_fitness, diversity,
+                 evaluation_time, selection_time, crossover_time, mutation_time, local_search_time=0.0):
+        self.generation = generation
+        self.best_fitness = best_fitness
+        self.mean_fitness = mean_fitness
+        self.worst_fitness = worst_fitness
+        self.diversity = diversity
+        self.evaluation_time = evaluation_time
+        self.selection_time = selection_time
+        self.crossover_time = crossover_time
+        self.mutation_time = mutation_time
+        self.local_search_time = local_search_time
+
+    def __str__(self):
+        return ("Generation {0}: best {1:.4f}, mean {2:.4f}, worst {3:.4f}, diversity {4:.4f}; "
+                "evaluation {5:.6f}s, selection {6:.6f}s, crossover {7:.6f}s, mutation {8:.6f}s, "
+                "local search {9:.6f}s.").format(
+            self.generation, self.best_fitness, self.mean_fitness, self.worst_fitness, self.diversity,
+            self.evaluation_time, self.selection_time, self.crossover_time, self.mutation_time,
+            self.local_search_time
+        )
+
+
+class GenerationObserver:
+    """ Receives callbacks from GA.run. Subclasses override the callbacks they are interested in.
+    """
+
+    def on_start(self, ga):
+        """ Called before the initial population is generated.
+        :param ga: GA instance being run
+        """
+        pass
+
+    def on_generation(self, ga, stats):
+        """ Called once per generation, after it has been evaluated and the next one has been bred.
+        :param ga: GA instance being run
+        :param stats: GenerationStats of the generation
+        """
+        pass
+
+    def on_finish(self, ga, solution, fitness, iteration):
+        """ Called when the run terminates, with the values GA.run returns. Also called when the run is ended
+            by an error or by closing the generator of GA.iterate, with the best solution found so far.
+        """
+        pass
+
+
+class PhaseTimer(GenerationObserver):
+    """ Accumulates the time spent in each phase of the GA over a run.
+    """
+
+    def __init__(self):
+        self.generations = 0
+        self.evaluation_time = 0.0
+        self.selection_time = 0.0
+        self.crossover_time = 0.0
+        self.mutation_time = 0.0
+        self.local_search_time = 0.0
+
+    def on_start(self, ga):
+        self.__init__()
+
+    def on_generation(self, ga, stats):
+        self.generations += 1
+        self.evaluation_time += stats.evaluation_time
+        self.selection_time += stats.selection_time
+        self.crossover_time += stats.crossover_time
+        self.mutation_time += stats.mutation_time
+        self.local_search_time += stats.local_search_time
+
+    def __str__(self):
+        return ("{0} generations: evaluation {1:.6f}s, selection {2:.6f}s, crossover {3:.6f}s, mutation {4:.6f}s, "
+                "local search {5:.6f}s.").format(
+            self.generations, self.evaluation_time, self.selection_time, self.crossover_time, self.mutation_time,
+            self.local_search_time
+        )
+
+
+class LoggingObserver(GenerationObserver):
+    """ Logs the statistics of every generation.
+    """
+
+    def __init__(self, level=logging.INFO):
+        self.level = level
+
+    def on_generation(self, ga, stats):
+        logger.log(self.level, "%s", stats)
+
+
+class ProfilingObserver(GenerationObserver):
+    """ Profiles a whole GA run with cProfile and/or tracks its memory allocations with tracemalloc.
+        After the run, 'stats' holds the pstats.Stats of the profile,
+        and 'snapshot' and 'peak_memory' the tracemalloc snapshot and peak traced memory in bytes.
+    """
+
+    def __init__(self, profile=True, trace_memory=False):
+        self.profile = profile
+        self.trace_memory = trace_memory
+
+        self.stats = None
+        self.snapshot = None
+        self.peak_memory = None
+        self._profiler = None
+
+    def on_start(self, ga):
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def on_finish(self, ga, solution, fitness, iteration):
+        if self._profiler is not None:
+            self._profiler.disable()
+            self.stats = pstats.Stats(self._profiler)
+            self._profiler = None
+        if self.trace_memory:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
@@ -0,0 +1,85 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.population_evaluator import PopulationEvaluator, count_satisfied_clauses
+
+# Problem state of a worker process, set once by _initialize_worker
+_worker_clauses = None
+_worker_num_variables = None
+_worker_weights = None
+
+
+def _initialize_worker(clauses, num_variables, weights=None):
+    global _worker_clauses, _worker_num_variables, _worker_weights
+    _worker_clauses = clauses
+    _worker_num_variables = num_variables
+    _worker_weights = weights
+
+
+def _count_satisfied_clauses(packed_genomes, weighted=False):
+    """
+    :param packed_genomes: list of ints in which bit i holds the value for variable ordinal i
+    :param weighted: whether to determine the satisfied weight rather than the number of satisfied clauses
+    :return: list containing the number, or the total weight, of satisfied clauses for each genome
+    """
+    genomes = [CompactValuation.unpack_bits(bits, _worker_num_variables) for bits in packed_genomes]
+    weights = _worker_weights if weighted else None
+    return count_satisfied_clauses(_worker_clauses, genomes, _worker_num_variables, weights)
+
+
+class ParallelEvaluator(PopulationEvaluator):
+    """ PopulationEvaluator that distributes the population over a pool of worker processes.
+        The clause store and clause weights are shipped to each worker once, when it starts;
+        per call, only the candidates' values are sent, packed into bits.
+        Populations smaller than 'min_population_size' are evaluated in the calling process.
+    """
+
+    def __init__(self, maxsat, workers, min_population_size=64):
+        super().__init__(maxsat)
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("'workers' must be a positive int.")
+
+        self.workers = workers
+        self.min_population_size = min_population_size
+        self._pool = None
+
+    def _evaluate(self, genomes, weighted):
+        if self.workers == 1 or len(genomes) < self.min_population_size:
+            return super()._evaluate(genomes, weighted)
+
+        packed_genomes = [CompactValuation.pack_bits(genome) for genome in genomes]
+        chunk_size = -(-len(packed_genomes) // self.workers)
+        chunks = [packed_genomes[i:i + chunk_size] for i in range(0, len(packed_genomes), chunk_size)]
+
+        results = []
+        for counts in self.pool.map(_count_satisfied_clauses, chunks, repeat(weighted)):
+            results.extend(counts)
+        return results
+
+    @property
+    def pool(self):
+        """
+        :return: pool of worker processes, started on first use
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_initialize_worker,
+                initargs=(self.clauses, len(self.maxsat.variables), self.maxsat.clause_weights)
+            )
+        return self._pool
+
+    def close(self):
+        """ Shuts down the worker processes, if they were started.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,192 @@
+from operator import itemgetter
+
+from algorithm.compact_valuation import CompactValuation
+from sat.maxsat import MAXSAT
+
+
+def transpose_genomes(genomes, num_variables):
+    """
+    Converts a 'population x variables' matrix into one int per variable, in which bit p holds the value
+    of candidate p. Eight candidates at a time are interleaved into a single byte per variable,
+    so the conversion happens on whole rows rather than on individual values.
+
+    :param genomes: list of bytes-like objects holding one 0/1 byte per variable
+    :param num_variables: number of variables in each genome
+    :return: list containing one int per variable
+    """
+    columns = [0] * num_variables
+    for offset in range(0, len(genomes), 8):
+        lanes = 0
+        for bit, genome in enumerate(genomes[offset:offset + 8]):
+            lanes |= int.from_bytes(genome, "little") << bit
+        lanes = lanes.to_bytes(num_variables, "little")
+        if offset == 0:
+            columns = list(lanes)
+        else:
+            columns = [column | (lane << offset) for column, lane in zip(columns, lanes)]
+    return columns
+
+
+def count_satisfied_clauses(clauses, genomes, num_variables, weights=None):
+    """
+    Determines the number of satisfied clauses for every genome at once.
+    Each clause is evaluated for the whole population with a few bitwise operations on the transposed genomes,
+    after which the per-candidate counts are accumulated in bit planes (a vertical binary counter).
+    If weights are given, the total satisfied weight is determined instead. For integer weights, a single counter
+    suffices: the satisfied mask of a clause is added at the plane of every set bit of its weight.
+    Other weights fall back to one counter per distinct weight, whose counts are multiplied by it at the end.
+
+    :param clauses: ClauseStore, or a list of tuples of signed literals, where literal i + 1 (-(i + 1))
+        denotes that the variable with ordinal i occurs positively (negatively)
+    :param genomes: list of bytes-like objects holding one 0/1 byte per variable
+    :param num_variables: number of variables in each genome
+    :param weights: optional sequence containing the weight of each clause
+    :return: list containing the number, or the total weight, of satisfied clauses for each genome
+    """
+    population_size = len(genomes)
+    if population_size == 0:
+        return []
+
+    columns = transpose_genomes(genomes, num_variables)
+    full = (1 << population_size) - 1
+    # Lookup table indexed directly by signed literal: table[i + 1] holds the column of variable i,
+    # table[-(i + 1)] its complement
+    table = [0] + columns + [full ^ column for column in reversed(columns)]
+
+    if weights is not None and all(float(weight).is_integer() and weight >= 0 for weight in weights):
+        planes = []
+        for clause, weight in zip(clauses, weights):
+            carry = 0
+            for literal in clause:
+                carry |= table[literal]
+            if not carry:
+                continue
+            weight = int(weight)
+            k = 0
+            while weight:
+                if weight & 1:
+                    _add_to_planes(planes, carry, k)
+                weight >>= 1
+                k += 1
+        return _read_planes(planes, population_size)
+
+    if weights is not None:
+        counters = {}
+        for clause, weight in zip(clauses, weights):
+            carry = 0
+            for literal in clause:
+                carry |= table[literal]
+            planes = counters.get(weight)
+            if planes is None:
+                planes = counters[weight] = []
+            _add_to_planes(planes, carry)
+
+        totals = [0] * population_size
+        for weight, planes in counters.items():
+            for p, count in enumerate(_read_planes(planes, population_size)):
+                totals[p] += weight * count
+        return totals
+
+    planes = []
+    for clause in clauses:
+        carry = 0
+        for literal in clause:
+            carry |= table[literal]
+        # Add the satisfied mask to the bit planes
+        for k in range(len(planes)):
+            if not carry:
+                break
+            plane = planes[k]
+            planes[k] = plane ^ carry
+            carry &= plane
+        if carry:
+            planes.append(carry)
+
+    return _read_planes(planes, population_size)
+
+
+def _add_to_planes(planes, carry, start=0):
+    """ Adds 2 ** 'start' to the vertical binary counter in 'planes' for every bit set in 'carry'.
+    """
+    if len(planes) < start:
+        planes.extend([0] * (start - len(planes)))
+    for k in range(start, len(planes)):
+        if not carry:
+            return
+        plane = planes[k]
+        planes[k] = plane ^ carry
+        carry &= plane
+    if carry:
+        planes.append(carry)
+
+
+def _read_planes(planes, population_size):
+    """
+    :return: list containing the value of the vertical binary counter in 'planes' for each candidate
+    """
+    return [
+        sum(((plane >> p) & 1) << k for k, plane in enumerate(planes))
+        for p in range(population_size)
+    ]
+
+
+class PopulationEvaluator:
+    """ Scores a whole population of candidate solutions for a MAXSAT problem in one batched call.
+        Uses the clauses as stored once in signed-literal form by MAXSAT.clause_store.
+    """
+
+    def __init__(self, maxsat):
+        if not isinstance(maxsat, MAXSAT):
+            raise TypeError("'maxsat' must be an instance of MAXSAT.")
+
+        self._maxsat = maxsat
+        self._clauses = maxsat.clause_store
+
+    def get_genome(self, candidate):
+        """
+        :param candidate: Valuation instance
+        :return: bytes-like object holding the 0/1 value of candidate for each variable of the problem
+        """
+        if isinstance(candidate, CompactValuation) and candidate.index is self.maxsat.variable_index:
+            return candidate.values
+        return bytearray(bool(candidate.get_value_for_variable(v)) for v in self.maxsat.variables)
+
+    def get_num_satisfied_clauses(self, population):
+        """
+        :param population: list of Valuation instances
+        :return: list containing the number of clauses satisfied by each candidate
+        """
+        return self._evaluate([self.get_genome(candidate) for candidate in population], False)
+
+    def get_scores(self, population):
+        """
+        :param population: list of Valuation instances
+        :return: list containing the score of each candidate, as defined by MAXSAT.get_satisfied_weight
+        """
+        return self._evaluate([self.get_genome(candidate) for candidate in population], self.maxsat.is_weighted)
+
+    def get_population_fitness(self, population):
+        """
+        :param population: list of Valuation instances
+        :return: list of (Valuation, fitness) tuples, sorted in descending order on fitness
+        """
+        total_weight = self.maxsat.total_weight * 1.0
+        fitness = [score / total_weight for score in self.get_scores(population)]
+        return sorted(zip(population, fitness), key=itemgetter(1), reverse=True)
+
+    def _evaluate(self, genomes, weighted):
+        """
+        :param genomes: list of bytes-like objects holding one 0/1 byte per variable
+        :param weighted: whether to determine the satisfied weight rather than the number of satisfied clauses
+        :return: list containing the number, or the total weight, of satisfied clauses for each genome
+        """
+        weights = self.maxsat.clause_weights if weighted else None
+        return count_satisfied_clauses(self._clauses, genomes, len(self.maxsat.variables), weights)
+
+    @property
+    def maxsat(self):
+        return self._maxsat
+
+    @property
+    def clauses(self):
+        return self._clauses
@@ -0,0 +1,190 @@
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.ga import GA
+from algorithm.local_search import LocalSearch
+from algorithm.seed_sequence import SeedSequence
+from sat.maxsat import MAXSAT
+
+# Problem and shared cancellation flag of a worker process, set once by _initialize_worker
+_worker_maxsat = None
+_worker_cancelled = None
+
+
+def _initialize_worker(maxsat, cancelled):
+    global _worker_maxsat, _worker_cancelled
+    _worker_maxsat = maxsat
+    _worker_cancelled = cancelled
+
+
+def _get_initial_statistics(index):
+    """
+    :return: statistics of configuration 'index' before its run, as reported for runs that never started
+    """
+    return {"configuration": index, "status": Portfolio.CANCELLED, "best_fitness": 0.0, "generations": 0,
+            "evaluations": 0, "seconds": 0.0, "time_to_solution": None, "solution": None}
+
+
+def _run_configuration(index, configuration, fitness_threshold, deadline):
+    """
+    Runs the GA once with the given configuration, unless another run has already succeeded.
+    :param index: index of the configuration
+    :param configuration: dict of GA keyword arguments, optionally with a 'seed' and a 'p_mutation'
+    :param fitness_threshold: fitness threshold to use if the configuration does not define one
+    :param deadline: time.time() value at which to stop, or None
+    :return: dict of statistics of the run, including its solution packed into an int
+    """
+    configuration = dict(configuration)
+    statistics = _get_initial_statistics(index)
+    if _worker_cancelled.is_set():
+        return statistics
+    if deadline is not None:
+        time_limit = deadline - time.time()
+        if time_limit <= 0:
+            statistics["status"] = Portfolio.TIMEOUT
+            return statistics
+        configuration["time_limit"] = min(time_limit, configuration.get("time_limit") or time_limit)
+
+    seed = configuration.pop("seed", None)
+    p_mutation = configuration.pop("p_mutation", None)
+    configuration.setdefault("fitness_threshold", fitness_threshold)
+    local_search = configuration.get("local_search")
+    if isinstance(local_search, LocalSearch):
+        # The local search was pickled apart from the problem, so it is rebuilt over the worker's copy
+        configuration["local_search"] = LocalSearch(_worker_maxsat, local_search.method, local_search.max_flips,
+                                                    local_search.noise)
+
+    ga = GA(_worker_maxsat, cancellation=_worker_cancelled, rng=random.Random(seed), **configuration)
+    if p_mutation is not None:
+        ga.p_mutation = p_mutation
+
+    start = time.perf_counter()
+    result = ga.run()
+    solution, fitness, iteration = result
+    seconds = time.perf_counter() - start
+
+    if result.reason == GA.FITNESS_REACHED:
+        # Cancel the other runs right away, rather than once the parent process has collected this result
+        _worker_cancelled.set()
+        statistics["status"] = Portfolio.SOLVED
+        statistics["time_to_solution"] = seconds
+    else:
+        statistics["status"] = _STATUSES.get(result.reason, Portfolio.EXHAUSTED)
+    statistics.update(best_fitness=fitness, generations=iteration, evaluations=ga.num_evaluations, seconds=seconds)
+    if solution is not None:
+        statistics["solution"] = CompactValuation.pack_bits(ga.evaluator.get_genome(solution))
+    return statistics
+
+
+class Portfolio:
+    """ Runs a portfolio of GA configurations concurrently in a pool of worker processes.
+        As soon as any run reaches its fitness threshold, or once the time budget has been spent,
+        all other runs are stopped at the end of their current generation.
+    """
+
+    # Outcome of a single run
+    SOLVED = "solved"
+    EXHAUSTED = "exhausted"
+    CANCELLED = "cancelled"
+    TIMEOUT = "timeout"
+
+    def __init__(self, maxsat, configurations, fitness_threshold=1.0, time_budget=None, workers=None, seed=None):
+        """
+        Creates a portfolio for the given MAXSAT problem.
+        :param maxsat:
+                MAXSAT problem instance to solve
+        :param configurations:
+                list of dicts of GA keyword arguments, such as 'population_size' or 'max_iterations';
+                each may also define a 'seed' for its run and a 'p_mutation'
+        :param fitness_threshold:
+                fitness value that, if reached by any run, stops all runs;
+                configurations may override it with their own 'fitness_threshold'
+        :param time_budget:
+                optional number of seconds after which all runs are stopped
+        :param workers:
+                number of processes to use; defaults to one per configuration
+        :param seed:
+                seed from which the seeds of the configurations that do not define one are derived,
+                as accepted by SeedSequence
+        """
+        if not isinstance(maxsat, MAXSAT):
+            raise TypeError("'maxsat' must be an instance of MAXSAT.")
+        if not isinstance(configurations, list) or not all(isinstance(c, dict) for c in configurations):
+            raise TypeError("'configurations' must be a list of dicts.")
+        if not configurations:
+            raise ValueError("'configurations' must contain at least one configuration.")
+
+        self.maxsat = maxsat
+        self.configurations = configurations
+        self.fitness_threshold = fitness_threshold
+        self.time_budget = time_budget
+        self.workers = workers or len(configurations)
+        # Reject seeds SeedSequence cannot derive entropy from now rather than in 'run'
+        SeedSequence(seed)
+        self.seed = seed
+
+    def run(self):
+        """ Runs all configurations until one of them meets its fitness criterion, the time budget is spent,
+            or every run has reached its maximum number of iterations.
+            :return:    tuple containing the best solution over all runs,
+                        its corresponding fitness value,
+                        and a list containing a dict of statistics per configuration
+        """
+        sequences = SeedSequence(self.seed).spawn(len(self.configurations))
+        configurations = []
+        for configuration, sequence in zip(self.configurations, sequences):
+            configuration = dict(configuration)
+            configuration.setdefault("seed", sequence.generate_seed())
+            configurations.append(configuration)
+        deadline = time.time() + self.time_budget if self.time_budget is not None else None
+
+        context = multiprocessing.get_context()
+        cancelled = context.Event()
+        statistics = [None] * len(configurations)
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(self.maxsat, cancelled)
+        ) as pool:
+            futures = {
+                pool.submit(_run_configuration, i, configuration, self.fitness_threshold, deadline): i
+                for i, configuration in enumerate(configurations)
+            }
+            try:
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    result = future.result()
+                    statistics[result["configuration"]] = result
+                    if result["status"] == self.SOLVED:
+                        cancelled.set()
+                        for pending in futures:
+                            pending.cancel()
+            except BaseException:
+                # Stop the remaining runs rather than waiting for them on leaving the pool
+                cancelled.set()
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+        for i, result in enumerate(statistics):
+            if result is None:
+                statistics[i] = _get_initial_statistics(i)
+
+        winner = max((result for result in statistics if result["solution"] is not None),
+                     key=lambda result: result["best_fitness"], default=None)
+        if winner is None:
+            return None, 0.0, statistics
+
+        variables = self.maxsat.variables
+        solution = CompactValuation(variables, CompactValuation.unpack_bits(winner["solution"], len(variables)),
+                                    self.maxsat.variable_index)
+        return solution, winner["best_fitness"], statistics
+
+
+# Status of a run that did not solve the problem, by the reason it terminated for
+_STATUSES = {GA.CANCELLED: Portfolio.CANCELLED, GA.TIME_LIMIT: Portfolio.TIMEOUT}
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from hashlib import blake2b
+
+
+class ProblemCache:
+    """ Bounded LRU cache of compiled MAXSAT instances, keyed by a 128-bit digest of the content they were built from.
+        A compiled instance has its variable index, clause store and occurrence index built already;
+        instances that only differ in their weights are derived from it through MAXSAT.with_weights.
+    """
+
+    def __init__(self, max_entries=32):
+        """
+        :param max_entries: maximum number of problems to keep
+        """
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1.")
+
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_key(*parts):
+        """
+        :param parts: bytes-like objects making up the content of a problem, such as its DIMACS text
+        :return: digest identifying the content
+        """
+        digest = blake2b(digest_size=16)
+        for part in parts:
+            # Prefix each part with its length, so that different splits of the same bytes differ
+            digest.update(len(part).to_bytes(8, "little"))
+            digest.update(part)
+        return digest.digest()
+
+    @staticmethod
+    def compile(maxsat):
+        """
+        Builds the structures derived from the problem's variables and clauses, which are otherwise built on first use.
+        :param maxsat: MAXSAT instance
+        :return: 'maxsat'
+        """
+        maxsat.variable_index
+        maxsat.clause_store
+        maxsat.occurrences
+        maxsat.clause_weights
+        return maxsat
+
+    def get(self, key):
+        """
+        :param key: digest as returned by 'get_key'
+        :return: cached MAXSAT instance for 'key', or None if it is not cached
+        """
+        maxsat = self._entries.get(key)
+        if maxsat is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return maxsat
+
+    def put(self, key, maxsat):
+        """
+        Caches 'maxsat' for 'key', evicting the least recently used entry if the cache is full.
+        :param key: digest as returned by 'get_key'
+        :param maxsat: compiled MAXSAT instance built from the content identified by 'key'
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = maxsat
+
+    def clear(self):
+        """ Removes all entries and resets the counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
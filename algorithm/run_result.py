@@ -0,0 +1,22 @@
+from collections import namedtuple
+
+
+class RunResult(namedtuple("RunResult", ["solution", "fitness", "iteration"])):
+    """ Result of GA.run. Unpacks like the (solution, fitness, iteration) tuple GA.run used to return;
+        'cost' holds the MaxSAT cost of the solution, as determined by MAXSAT.get_cost,
+        and 'reason' the GA constant naming the termination criterion that ended the run.
+    """
+
+    def __new__(cls, solution, fitness, iteration, cost=None, reason=None):
+        result = super().__new__(cls, solution, fitness, iteration)
+        result.cost = cost
+        result.reason = reason
+        return result
+
+
+class Incumbent(namedtuple("Incumbent", ["solution", "fitness", "generation", "cost"])):
+    """ Improvement of the best solution of a run, as yielded by GA.iterate:
+        the solution, its fitness, the index of the generation in which it was found and its MaxSAT cost.
+    """
+
+    __slots__ = ()
@@ -0,0 +1,57 @@
+import os
+import random
+from hashlib import blake2b
+
+
+class SeedSequence:
+    """ Derives seeds for independent random number generators from a single root seed,
+        in the manner of numpy.random.SeedSequence: every node of the tree of sequences is identified by the root
+        entropy and its spawn key (the path of child indices leading to it), and its seed is a hash of both.
+        Seeds of different nodes are unrelated, and a node always yields the same seed,
+        whichever nodes were spawned or used before.
+    """
+
+    def __init__(self, entropy=None, spawn_key=()):
+        """
+        :param entropy: seed of the root of the tree: any value random.seed accepts, that is an int, float, str,
+            bytes or bytearray; drawn from the operating system if None. Values other than non-negative ints
+            are hashed into one
+        :param spawn_key: tuple of child indices identifying this node; empty for the root
+        """
+        if entropy is None:
+            entropy = int.from_bytes(os.urandom(16), "little")
+        if not isinstance(entropy, (int, float, str, bytes, bytearray)):
+            raise TypeError("'entropy' must be an int, float, str, bytes or bytearray.")
+        if not isinstance(entropy, int) or entropy < 0:
+            # The type name keeps, for instance, the str '1' apart from the int 1
+            key = repr((type(entropy).__name__, entropy)).encode()
+            entropy = int.from_bytes(blake2b(key, digest_size=16).digest(), "little")
+
+        self.entropy = entropy
+        self.spawn_key = tuple(spawn_key)
+        # Number of children spawned so far, which determines the index of the next child
+        self.num_children = 0
+
+    def spawn(self, count):
+        """
+        :param count: number of child sequences to create
+        :return: list of 'count' SeedSequence instances, distinct from all children spawned before
+        """
+        children = [
+            SeedSequence(self.entropy, self.spawn_key + (i,))
+            for i in range(self.num_children, self.num_children + count)
+        ]
+        self.num_children += count
+        return children
+
+    def generate_seed(self):
+        """
+        :return: 256-bit int seed of this node
+        """
+        return int.from_bytes(blake2b(repr((self.entropy, self.spawn_key)).encode(), digest_size=32).digest(), "little")
+
+    def create_rng(self):
+        """
+        :return: random.Random instance seeded by 'generate_seed'
+        """
+        return random.Random(self.generate_seed())
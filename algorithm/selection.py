@@ -0,0 +1,150 @@
+import random
+
+
+def build_alias_table(weights):
+    """
+    Builds a Walker alias table, which allows drawing index i with probability weights[i] / sum(weights) in O(1).
+    If all weights are zero, every index is equally likely.
+
+    :param weights: list of non-negative weights
+    :return: tuple of a list of acceptance probabilities and a list of alias indices
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    if total <= 0:
+        return [1.0] * n, list(range(n))
+
+    scaled = [w * n / total for w in weights]
+    probabilities = [1.0] * n
+    aliases = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        i = small.pop()
+        j = large.pop()
+        probabilities[i] = scaled[i]
+        aliases[i] = j
+        scaled[j] -= 1.0 - scaled[i]
+        if scaled[j] < 1.0:
+            small.append(j)
+        else:
+            large.append(j)
+    # Whatever remains has a scaled weight of 1, up to rounding errors
+    return probabilities, aliases
+
+
+def sample_alias_table(probabilities, aliases, count, rng=None):
+    """
+    :param probabilities: acceptance probabilities as returned by 'build_alias_table'
+    :param aliases: alias indices as returned by 'build_alias_table'
+    :param count: number of indices to draw
+    :param rng: random.Random instance to draw from; the random module if None
+    :return: list of 'count' indices
+    """
+    rng = rng or random
+    n = len(probabilities)
+    selected = []
+    for _ in range(count):
+        i = rng.randrange(n)
+        selected.append(i if rng.random() < probabilities[i] else aliases[i])
+    return selected
+
+
+class Selection:
+    """ Base class of the parent selection schemes of the GA.
+        Each scheme draws all parents of a generation in a single call.
+    """
+
+    def select(self, fitness, count, rng=None):
+        """
+        :param fitness: list of fitness values of the population, sorted in descending order
+        :param count: number of parents to draw
+        :param rng: random.Random instance to draw from; the random module if None
+        :return: list of 'count' indices into 'fitness'
+        """
+        raise NotImplementedError
+
+
+class RouletteSelection(Selection):
+    """ Fitness-proportional selection, drawing from a Walker alias table built once per generation.
+    """
+
+    def select(self, fitness, count, rng=None):
+        probabilities, aliases = build_alias_table(fitness)
+        return sample_alias_table(probabilities, aliases, count, rng)
+
+
+class StochasticUniversalSampling(Selection):
+    """ Fitness-proportional selection with evenly spaced pointers from a single random offset,
+        which keeps the number of times each candidate is drawn close to its expected value.
+        The selected indices are shuffled, so that parents are paired randomly.
+    """
+
+    def select(self, fitness, count, rng=None):
+        if count == 0:
+            return []
+        rng = rng or random
+        n = len(fitness)
+        total = float(sum(fitness))
+        if total <= 0:
+            fitness = [1.0] * n
+            total = float(n)
+
+        spacing = total / count
+        pointer = rng.uniform(0, spacing)
+        selected = []
+        cumulative = 0.0
+        i = -1
+        for _ in range(count):
+            while cumulative <= pointer and i < n - 1:
+                i += 1
+                cumulative += fitness[i]
+            selected.append(i)
+            pointer += spacing
+
+        rng.shuffle(selected)
+        return selected
+
+
+class TournamentSelection(Selection):
+    """ Draws each parent as the fittest of 'size' candidates picked uniformly at random (with replacement).
+    """
+
+    def __init__(self, size=2):
+        if size < 1:
+            raise ValueError("'size' must be at least 1.")
+        self.size = size
+
+    def select(self, fitness, count, rng=None):
+        rng = rng or random
+        n = len(fitness)
+        size = range(self.size)
+        # As fitness is sorted in descending order, the fittest candidate has the lowest index
+        return [min(rng.randrange(n) for _ in size) for _ in range(count)]
+
+
+class RankSelection(Selection):
+    """ Linear ranking selection: the probability of a candidate depends only on its rank.
+        'pressure' (between 1 and 2) is the expected number of times the fittest candidate is drawn per draw
+        of the average candidate; 1 means uniform selection.
+    """
+
+    def __init__(self, pressure=1.5):
+        if not 1 <= pressure <= 2:
+            raise ValueError("'pressure' must be between 1 and 2.")
+        self.pressure = pressure
+        self._alias_table = None
+
+    def select(self, fitness, count, rng=None):
+        n = len(fitness)
+        # The weights only depend on the population size, so the table is reused between generations
+        if self._alias_table is None or len(self._alias_table[0]) != n:
+            s = self.pressure
+            weights = [
+                (2 - s) + 2 * (s - 1) * (n - 1 - rank) / (n - 1) if n > 1 else 1.0
+                for rank in range(n)
+            ]
+            self._alias_table = build_alias_table(weights)
+        probabilities, aliases = self._alias_table
+        return sample_alias_table(probabilities, aliases, count, rng)
@@ -0,0 +1,79 @@
+import asyncio
+
+# Marks the end of the improvements in the queue of a SolutionStream
+_DONE = object()
+
+
+class SolutionStream:
+    """ Asynchronous iterator over the improvements of a GA run that proceeds in an executor, as returned by GA.stream.
+        The run does not depend on the iteration: a caller may stop iterating and answer with 'best'
+        while the search continues, and later collect the final result or cancel the run.
+        The improvements are meant to be consumed by a single task.
+    """
+
+    def __init__(self, improvements, stop, executor=None):
+        """
+        Starts the run. Must be called from a running event loop.
+        :param improvements: generator of Incumbent instances, as returned by GA.iterate
+        :param stop: function requesting the run to terminate, such as GA.stop
+        :param executor: executor to run the generator in; the loop's default executor if None
+        """
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._stop = stop
+        self._cancelled = False
+        # Most recent improvement delivered to the event loop
+        self.best = None
+        self._future = self._loop.run_in_executor(executor, self._run, improvements)
+
+    def _run(self, improvements):
+        """ Exhausts 'improvements' in the executor, handing each one to the event loop.
+            :return: return value of 'improvements'
+        """
+        try:
+            while True:
+                try:
+                    incumbent = next(improvements)
+                except StopIteration as stop:
+                    return stop.value
+                self._loop.call_soon_threadsafe(self._publish, incumbent)
+                if self._cancelled:
+                    # The run may not have started yet when 'cancel' was called, and reset the request on starting
+                    self._stop()
+        finally:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, _DONE)
+
+    def _publish(self, incumbent):
+        self.best = incumbent
+        self._queue.put_nowait(incumbent)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        incumbent = await self._queue.get()
+        if incumbent is _DONE:
+            # Keep the marker for later calls, and raise the error of the run, if any
+            self._queue.put_nowait(_DONE)
+            await self._future
+            raise StopAsyncIteration
+        return incumbent
+
+    async def result(self):
+        """
+        Waits for the run to terminate.
+        :return: RunResult of the run
+        """
+        return await self._future
+
+    def cancel(self):
+        """ Requests the run to terminate after its current generation; 'result' then reports the best solution found.
+        """
+        self._cancelled = True
+        self._stop()
+
+    def done(self):
+        """
+        :return: whether the run has terminated
+        """
+        return self._future.done()
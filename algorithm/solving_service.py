@@ -0,0 +1,261 @@
+import asyncio
+import os
+import random
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithm.ga import GA
+from algorithm.problem_cache import ProblemCache
+from sat.clause_store import ClauseStore
+from sat.dimacs import read_dimacs
+from sat.maxsat import MAXSAT
+from sat.variable import Variable
+
+# Compiled problems of a worker process, created once by _initialize_worker
+_worker_cache = None
+
+
+def _initialize_worker(cache_size):
+    global _worker_cache
+    _worker_cache = ProblemCache(cache_size)
+
+
+def _parse(problem):
+    """
+    :param problem: DIMACS text, or a (number of variables, offsets, literals) tuple holding the bytes
+        of the arrays of a ClauseStore
+    :return: MAXSAT instance
+    """
+    if isinstance(problem, str):
+        return read_dimacs(problem.splitlines())
+
+    num_variables, offsets, literals = problem
+    clause_store = ClauseStore.from_arrays(array("q", offsets), array("i", literals))
+    return MAXSAT.from_clause_store([Variable(str(i)) for i in range(1, num_variables + 1)], clause_store)
+
+
+def _solve_job(key, problem, weights, hard, configuration, seed, deadline):
+    """
+    Solves a single job in a worker process, taking its problem from the worker's cache if it was compiled before.
+    :param key: digest identifying 'problem', as returned by ProblemCache.get_key
+    :param problem: problem in a form accepted by '_parse', or None if the worker is expected to have it cached
+    :param weights: weights replacing those of the problem, if either 'weights' or 'hard' is not None
+    :param hard: hard flags replacing those of the problem, if either 'weights' or 'hard' is not None
+    :param configuration: dict of GA keyword arguments
+    :param seed: seed for the random number generator
+    :param deadline: time.time() value at which to stop, or None
+    :return: JobResult, or None if 'problem' is None and the worker has not cached it
+    """
+    start = time.perf_counter()
+    maxsat = _worker_cache.get(key)
+    cached = maxsat is not None
+    if not cached:
+        if problem is None:
+            return None
+        maxsat = ProblemCache.compile(_parse(problem))
+        _worker_cache.put(key, maxsat)
+    if weights is not None or hard is not None:
+        maxsat = maxsat.with_weights(weights, hard)
+
+    configuration = dict(configuration)
+    if deadline is not None:
+        time_limit = deadline - time.time()
+        if time_limit <= 0:
+            return JobResult(None, 0.0, None, 0, SolvingService.EXPIRED, cached, time.perf_counter() - start)
+        configuration["time_limit"] = min(time_limit, configuration.get("time_limit") or time_limit)
+
+    ga = GA(maxsat, rng=random.Random(seed), **configuration)
+    solution, fitness, iteration = result = ga.run()
+
+    model = None
+    if solution is not None:
+        model = tuple(i + 1 if value else -(i + 1) for i, value in enumerate(ga.evaluator.get_genome(solution)))
+    return JobResult(model, fitness, result.cost, iteration, result.reason, cached, time.perf_counter() - start)
+
+
+class JobResult(namedtuple("JobResult", ["model", "fitness", "cost", "iteration", "reason", "cached", "seconds"])):
+    """ Result of a job of a SolvingService:
+            - model: tuple of signed literals, where i + 1 (-(i + 1)) means that the variable with ordinal i is true
+              (false), or None if the job expired before it was started
+            - fitness, cost, iteration and reason: as reported by GA.run
+            - cached: whether the compiled problem was taken from the cache of the worker
+            - seconds: time spent on the job by the worker
+    """
+
+    __slots__ = ()
+
+
+class SolvingService:
+    """ Local service solving MAXSAT problems with the GA, with an asyncio front end and a process pool back end.
+        Each worker process has its own queue, and jobs are routed to a worker by the key of their problem,
+        so that all jobs on the same problem run on the same worker. Each worker keeps a ProblemCache of compiled
+        problems, keyed by content, so that repeated and re-weighted problems are neither parsed nor compiled again.
+        The service mirrors the keys cached by each worker, and sends a problem along with a job only if the worker
+        does not have it yet. 'submit' blocks callers while 'max_pending' jobs are waiting to be started.
+        As jobs are routed by problem, jobs on the same problem run one after the other, even while other workers idle.
+    """
+
+    # Reason of a job whose deadline passed before it was started
+    EXPIRED = "expired"
+
+    def __init__(self, workers=None, max_pending=64, cache_size=32, configuration=None):
+        """
+        :param workers: number of worker processes; one per CPU by default
+        :param max_pending: maximum number of jobs waiting to be started
+        :param cache_size: maximum number of compiled problems kept by each worker
+        :param configuration: dict of GA keyword arguments applied to every job
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("'workers' must be at least 1.")
+        if max_pending < 1:
+            raise ValueError("'max_pending' must be at least 1.")
+        if cache_size < 1:
+            raise ValueError("'cache_size' must be at least 1.")
+
+        self.workers = workers
+        self.max_pending = max_pending
+        self.cache_size = cache_size
+        self.configuration = dict(configuration) if configuration else {}
+
+        # Per worker: a single-process pool, a queue of jobs and the keys of the problems it has cached
+        self._pools = None
+        self._queues = None
+        self._cached_keys = None
+        self._slots = None
+        self._dispatchers = []
+
+    async def start(self):
+        """ Starts the worker processes. Must be called from the event loop the service is used from.
+        """
+        if self._pools is not None:
+            return
+        workers = self.workers or os.cpu_count()
+        self._pools = [
+            ProcessPoolExecutor(max_workers=1, initializer=_initialize_worker, initargs=(self.cache_size,))
+            for _ in range(workers)
+        ]
+        self._queues = [asyncio.Queue() for _ in range(workers)]
+        self._cached_keys = [ProblemCache(self.cache_size) for _ in range(workers)]
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._dispatchers = [asyncio.ensure_future(self._dispatch(worker)) for worker in range(workers)]
+
+    async def close(self):
+        """ Waits for the submitted jobs to finish and stops the worker processes.
+        """
+        if self._pools is None:
+            return
+        for queue in self._queues:
+            await queue.join()
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        for pool in self._pools:
+            pool.shutdown()
+        self._pools = None
+        self._dispatchers = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+    async def submit(self, problem, weights=None, hard=None, deadline=None, configuration=None, seed=None):
+        """
+        Queues a job, waiting for room in the queue if it is full.
+        :param problem: MAXSAT instance, or DIMACS CNF or WCNF text
+        :param weights: optional list containing the weight of each clause; if 'weights' or 'hard' is given,
+            both replace the weights and hard flags of the problem
+        :param hard: optional list containing, for each clause, whether it is a hard constraint
+        :param deadline: optional number of seconds from now after which the job stops with the best solution found;
+            a job that has not started by then expires
+        :param configuration: dict of GA keyword arguments for this job, overriding those of the service
+        :param seed: optional seed for the random number generator of the job
+        :return: asyncio.Future of the JobResult of the job
+        """
+        if self._pools is None:
+            raise ValueError("The service has not been started.")
+
+        if isinstance(problem, MAXSAT):
+            if weights is None and hard is None:
+                weights, hard = problem.weights, problem.hard
+            # Only the clauses are sent, as the weights are passed on separately
+            clause_store = problem.clause_store
+            num_variables = len(problem.variables)
+            offsets = clause_store.offsets.tobytes()
+            literals = clause_store.literals.tobytes()
+            key = ProblemCache.get_key(num_variables.to_bytes(8, "little"), offsets, literals)
+            problem = (num_variables, offsets, literals)
+        elif isinstance(problem, str):
+            key = ProblemCache.get_key(problem.encode())
+        else:
+            raise TypeError("'problem' must be a MAXSAT instance or DIMACS text.")
+
+        job_configuration = dict(self.configuration)
+        if configuration:
+            job_configuration.update(configuration)
+        absolute_deadline = time.time() + deadline if deadline is not None else None
+
+        future = asyncio.get_running_loop().create_future()
+        await self._slots.acquire()
+        worker = self.get_worker(key)
+        self._queues[worker].put_nowait(((key, problem, weights, hard, job_configuration, seed, absolute_deadline),
+                                         future))
+        return future
+
+    async def solve(self, problem, weights=None, hard=None, deadline=None, configuration=None, seed=None):
+        """
+        Queues a job and waits for its result; takes the same arguments as 'submit'.
+        :return: JobResult of the job
+        """
+        return await (await self.submit(problem, weights, hard, deadline, configuration, seed))
+
+    def get_worker(self, key):
+        """
+        :param key: digest identifying a problem, as returned by ProblemCache.get_key
+        :return: index of the worker that runs the jobs on the problem
+        """
+        return int.from_bytes(key[:8], "little") % len(self._pools)
+
+    @property
+    def pending(self):
+        """
+        :return: number of jobs waiting to be started
+        """
+        return sum(queue.qsize() for queue in self._queues) if self._queues is not None else 0
+
+    async def _dispatch(self, worker):
+        """ Hands the queued jobs of a worker process to it, one at a time, until cancelled by 'close'.
+        :param worker: index of the worker
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queues[worker]
+        cached_keys = self._cached_keys[worker]
+        while True:
+            job, future = await queue.get()
+            self._slots.release()
+            try:
+                if future.cancelled():
+                    continue
+                deadline = job[-1]
+                if deadline is not None and time.time() >= deadline:
+                    future.set_result(JobResult(None, 0.0, None, 0, self.EXPIRED, False, 0.0))
+                    continue
+                key = job[0]
+                # The worker processes jobs in the order they are handed to it, so its cache holds the same keys
+                result = None
+                if cached_keys.get(key) is not None:
+                    result = await loop.run_in_executor(self._pools[worker], _solve_job, key, None, *job[2:])
+                if result is None:
+                    result = await loop.run_in_executor(self._pools[worker], _solve_job, *job)
+                cached_keys.put(key, True)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            finally:
+                queue.task_done()
@@ -0,0 +1,91 @@
+import os
+import random
+import tempfile
+import unittest
+from math import isnan, nan
+
+from algorithm.checkpoint import Checkpoint, CheckpointWriter, write_atomically
+from algorithm.ga import GA
+from sat.problem_generator import ProblemGenerator
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.checkpoint")
+        self.maxsat = ProblemGenerator(seed=0).generate_random_ksat(50)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_checkpoint(self):
+        random.seed(1)
+        return Checkpoint(3, 10, 42, [b"\x01\x02", b"\xff\x03"], [0.5, nan], random.getstate(), b"\x01\x00", 0.75, 7)
+
+    def test_checkpoint_survives_round_trip(self):
+        checkpoint = Checkpoint.from_bytes(self.create_checkpoint().to_bytes())
+
+        self.assertEqual((3, 10, 42, 7), (checkpoint.generation, checkpoint.num_variables,
+                                          checkpoint.num_clauses, checkpoint.num_evaluations))
+        self.assertEqual([b"\x01\x02", b"\xff\x03"], checkpoint.genomes)
+        self.assertEqual(0.5, checkpoint.fitness[0])
+        self.assertTrue(isnan(checkpoint.fitness[1]))
+        self.assertEqual(random.getstate(), checkpoint.random_state)
+        self.assertEqual((b"\x01\x00", 0.75), (checkpoint.best_genome, checkpoint.best_fitness))
+
+    def test_reading_other_data_fails(self):
+        self.assertRaises(ValueError, lambda: Checkpoint.from_bytes(b"not a checkpoint"))
+
+    def test_write_atomically_leaves_no_temporary_file(self):
+        write_atomically(self.path, b"first")
+        write_atomically(self.path, b"second")
+
+        with open(self.path, "rb") as f:
+            self.assertEqual(b"second", f.read())
+        self.assertEqual(["run.checkpoint"], os.listdir(self.directory.name))
+
+    def test_writer_writes_last_submitted_checkpoint(self):
+        writer = CheckpointWriter(self.path)
+        checkpoint = self.create_checkpoint()
+        writer.submit(checkpoint)
+        checkpoint.generation = 4
+        writer.submit(checkpoint)
+        writer.close()
+
+        self.assertEqual(4, Checkpoint.read(self.path).generation)
+
+    def test_resumed_run_matches_uninterrupted_run(self):
+        random.seed(0)
+        ga = GA(self.maxsat, max_iterations=11, fitness_threshold=1.1, elitism=2,
+                checkpoint_path=self.path, checkpoint_interval=4)
+        solution, fitness, iteration = ga.run()
+        state = random.getstate()
+        self.assertEqual(8, Checkpoint.read(self.path).generation)
+
+        random.seed(1)
+        resumed = GA(self.maxsat, max_iterations=11, fitness_threshold=1.1, elitism=2).resume(self.path)
+
+        self.assertEqual(solution.values, resumed.solution.values)
+        self.assertEqual((fitness, iteration), (resumed.fitness, resumed.iteration))
+        self.assertEqual(state, random.getstate())
+
+    def test_resumed_run_with_rng_matches_uninterrupted_run(self):
+        rng = random.Random(0)
+        ga = GA(self.maxsat, max_iterations=11, fitness_threshold=1.1, checkpoint_path=self.path,
+                checkpoint_interval=4, rng=rng)
+        solution, _, _ = ga.run()
+
+        resumed_rng = random.Random(1)
+        resumed = GA(self.maxsat, max_iterations=11, fitness_threshold=1.1, rng=resumed_rng).resume(self.path)
+
+        self.assertEqual(solution.values, resumed.solution.values)
+        self.assertEqual(rng.getstate(), resumed_rng.getstate())
+
+    def test_resume_with_different_problem_fails(self):
+        random.seed(0)
+        GA(self.maxsat, max_iterations=2, fitness_threshold=1.1, checkpoint_path=self.path,
+           checkpoint_interval=1).run()
+
+        ga = GA(ProblemGenerator(seed=0).generate_random_ksat(40))
+        self.assertRaises(ValueError, lambda: ga.resume(self.path))
@@ -0,0 +1,111 @@
+import unittest
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.valuation import Valuation
+from sat.literal import Literal
+from sat.variable import Variable
+
+
+class TestCompactValuation(unittest.TestCase):
+
+    def setUp(self):
+        self.variable = Variable('a')
+        self.variables = [self.variable, Variable('b'), Variable('c')]
+
+    def test_create_with_invalid_values_type_fails(self):
+        self.assertRaises(TypeError, lambda: CompactValuation(self.variables, [0, 1, 0]))
+
+    def test_create_with_invalid_values_fails(self):
+        self.assertRaises(TypeError, lambda: CompactValuation(self.variables, bytearray([0, 2, 0])))
+
+    def test_create_with_wrong_number_of_values_fails(self):
+        self.assertRaises(ValueError, lambda: CompactValuation(self.variables, bytearray([0, 1])))
+
+    def test_from_trusted_takes_ownership_of_values(self):
+        values = bytearray([0, 1, 0])
+        index = {v: i for i, v in enumerate(self.variables)}
+        v = CompactValuation.from_trusted(self.variables, values, index)
+
+        self.assertIs(values, v.values)
+        self.assertTrue(v.get_value_for_variable(self.variables[1]))
+
+    def test_copy_does_not_share_values(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        copy = v.copy()
+        copy.flip_values([0])
+
+        self.assertEqual(bytearray([0, 1, 0]), v.values)
+        self.assertIs(v.index, copy.index)
+
+    def test_create_is_valuation(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        self.assertTrue(isinstance(v, Valuation))
+
+    def test_valuation_returns_mapping(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        self.assertEqual({self.variables[0]: False, self.variables[1]: True, self.variables[2]: False}, v.valuation)
+
+    def test_get_value_for_variable_returns_correct_value(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        self.assertEqual(True, v.get_value_for_variable(self.variables[1]))
+
+    def test_get_value_for_unknown_variable_returns_none(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        self.assertIsNone(v.get_value_for_variable(Variable('d')))
+
+    def test_set_value_for_variable_sets_value(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        v.set_value_for_variable(self.variable, True)
+        self.assertEqual(True, v.get_value_for_variable(self.variable))
+
+    def test_get_value_for_negated_literal_returns_correct_value(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        self.assertEqual(True, v.get_value_for_literal(Literal(self.variable, positive=False)))
+
+    def test_set_value_for_literal_sets_value(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        l = Literal(self.variable)
+        v.set_value_for_literal(l, True)
+        self.assertEqual(True, v.get_value_for_literal(l))
+
+    def test_from_valuation_copies_values(self):
+        mapping = {self.variables[0]: True, self.variables[1]: False, self.variables[2]: True}
+        v = CompactValuation.from_valuation(Valuation(mapping), self.variables)
+        self.assertEqual(mapping, v.valuation)
+
+    def test_get_values_returns_slice(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 1]))
+        self.assertEqual(bytearray([1, 1]), v.get_values(1))
+
+    def test_set_values_overwrites_slice(self):
+        v = CompactValuation(self.variables, bytearray([0, 0, 0]))
+        v.set_values(1, bytearray([1, 1]))
+        self.assertEqual(bytearray([0, 1, 1]), v.values)
+
+    def test_set_values_beyond_end_fails(self):
+        v = CompactValuation(self.variables, bytearray([0, 0, 0]))
+        self.assertRaises(IndexError, lambda: v.set_values(2, bytearray([1, 1])))
+
+    def test_flip_values_flips_given_ordinals(self):
+        v = CompactValuation(self.variables, bytearray([0, 1, 0]))
+        v.flip_values([0, 1])
+        self.assertEqual(bytearray([1, 0, 0]), v.values)
+
+    def test_pack_and_unpack_round_trip(self):
+        variables = [Variable(c) for c in 'abcdefghijk']
+        v = CompactValuation.init_random_from_variables(variables)
+        packed = v.pack()
+
+        self.assertEqual(2, len(packed))
+        self.assertEqual(v.values, CompactValuation.unpack(variables, packed).values)
+
+    def test_init_random_creates_valuation_of_correct_length(self):
+        v = CompactValuation.init_random_from_variables(self.variables)
+        self.assertEqual(len(self.variables), len(v.valuation))
+
+    def test_change_random_variable_changes_exactly_one_variable(self):
+        v = CompactValuation.init_random_from_variables(self.variables)
+        original_values = v.get_values()
+        v.change_value_for_random_variable()
+
+        self.assertEqual(1, sum(a != b for a, b in zip(original_values, v.values)))
@@ -0,0 +1,68 @@
+import random
+import unittest
+
+from algorithm.crossover import NPointCrossover, SinglePointCrossover, TwoPointCrossover, UniformCrossover
+from algorithm.ga import GA
+from sat.problem_generator import ProblemGenerator
+
+
+class TestCrossover(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        self.num_variables = 40
+        self.pairs = [
+            (bytearray(random.getrandbits(1) for _ in range(self.num_variables)),
+             bytearray(random.getrandbits(1) for _ in range(self.num_variables)))
+            for _ in range(10)
+        ]
+
+    def count_switches(self, child, parent1, parent2):
+        """ Counts how often 'child' switches between inheriting from 'parent1' and 'parent2',
+            considering only positions where the parents differ.
+        """
+        sources = [value == a for value, a, b in zip(child, parent1, parent2) if a != b]
+        return sum(1 for previous, current in zip(sources, sources[1:]) if previous != current)
+
+    def assert_children_are_complementary(self, crossover):
+        children = crossover.recombine(self.pairs, self.num_variables)
+        self.assertEqual(2 * len(self.pairs), len(children))
+        for (parent1, parent2), child1, child2 in zip(self.pairs, children[::2], children[1::2]):
+            self.assertEqual(self.num_variables, len(child1))
+            for a, b, c, d in zip(parent1, parent2, child1, child2):
+                self.assertEqual({a, b} if a != b else {a}, {c, d})
+        return children
+
+    def test_single_point_crossover_inherits_prefix_from_own_parent(self):
+        children = self.assert_children_are_complementary(SinglePointCrossover())
+        for (parent1, parent2), child1 in zip(self.pairs, children[::2]):
+            self.assertEqual(parent1[0], child1[0])
+            self.assertLessEqual(self.count_switches(child1, parent1, parent2), 1)
+
+    def test_two_point_crossover_switches_parents_at_most_twice(self):
+        children = self.assert_children_are_complementary(TwoPointCrossover())
+        for (parent1, parent2), child1 in zip(self.pairs, children[::2]):
+            self.assertLessEqual(self.count_switches(child1, parent1, parent2), 2)
+
+    def test_n_point_crossover_switches_parents_at_most_n_times(self):
+        children = self.assert_children_are_complementary(NPointCrossover(points=5))
+        for (parent1, parent2), child1 in zip(self.pairs, children[::2]):
+            self.assertLessEqual(self.count_switches(child1, parent1, parent2), 5)
+
+    def test_uniform_crossover_produces_complementary_children(self):
+        self.assert_children_are_complementary(UniformCrossover())
+
+    def test_create_n_point_crossover_without_points_fails(self):
+        self.assertRaises(ValueError, lambda: NPointCrossover(points=0))
+
+    def test_ga_with_uniform_crossover_preserves_values_of_identical_parents(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        ga = GA(maxsat, crossover=UniformCrossover())
+        parent = ga.generate_population()[0]
+
+        for child in ga._recombine([(parent, parent)]):
+            self.assertEqual(parent.values, child.values)
+
+    def test_create_ga_with_invalid_crossover_fails(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        self.assertRaises(TypeError, lambda: GA(maxsat, crossover="uniform"))
@@ -0,0 +1,63 @@
+import random
+import unittest
+
+from algorithm.fitness_cache import FitnessCache
+from algorithm.ga import GA
+from sat.problem_generator import ProblemGenerator
+
+
+class TestFitnessCache(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        self.maxsat = ProblemGenerator(seed=0).generate_random_ksat(40)
+
+    def test_cache_returns_stored_fitness(self):
+        cache = FitnessCache(max_entries=4)
+        key = cache.get_key(bytes([0, 1, 1, 0]))
+        cache.put(key, 0.5)
+
+        self.assertEqual(0.5, cache.get(key))
+        self.assertEqual(1, cache.hits)
+        self.assertIsNone(cache.get(cache.get_key(bytes([1, 1, 1, 0]))))
+        self.assertEqual(1, cache.misses)
+
+    def test_cache_evicts_least_recently_used_entry(self):
+        cache = FitnessCache(max_entries=2)
+        keys = [cache.get_key(bytes([i])) for i in range(3)]
+        cache.put(keys[0], 0.1)
+        cache.put(keys[1], 0.2)
+        cache.get(keys[0])
+        cache.put(keys[2], 0.3)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.evictions)
+        self.assertIn(keys[0], cache)
+        self.assertNotIn(keys[1], cache)
+
+    def test_memory_budget_bounds_number_of_entries(self):
+        self.assertEqual(10, FitnessCache(memory_budget=10 * FitnessCache.ENTRY_SIZE).max_entries)
+        self.assertRaises(ValueError, lambda: FitnessCache(memory_budget=1))
+        self.assertRaises(ValueError, lambda: FitnessCache(max_entries=0))
+
+    def test_ga_does_not_evaluate_cached_candidates_again(self):
+        cache = FitnessCache(max_entries=1000)
+        ga = GA(self.maxsat, fitness_cache=cache)
+        ga.population = ga.generate_population()
+        candidate_fitness_map = ga.get_population_fitness()
+        evaluations = ga.num_evaluations
+
+        ga.population = [candidate.copy() for candidate in ga.population]
+
+        self.assertEqual(sorted(f for _, f in candidate_fitness_map), sorted(f for _, f in ga.get_population_fitness()))
+        self.assertEqual(evaluations, ga.num_evaluations)
+        self.assertEqual(ga.population_size, cache.hits)
+
+    def test_ga_clears_cache_when_problem_changes(self):
+        cache = FitnessCache(max_entries=1000)
+        ga = GA(self.maxsat, fitness_cache=cache)
+        ga.population = ga.generate_population()
+        ga.get_population_fitness()
+
+        ga.maxsat = ProblemGenerator(seed=1).generate_random_ksat(40)
+        self.assertEqual(0, len(cache))
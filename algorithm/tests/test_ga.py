@@ -1,6 +1,10 @@
+import random
+import threading
 import unittest
 
 from algorithm.ga import GA
+from algorithm.observer import GenerationObserver
+from algorithm.selection import StochasticUniversalSampling
 from algorithm.valuation import Valuation
 from sat.problem_generator import ProblemGenerator
 from sat.variable import Variable
@@ -188,3 +192,213 @@ class TestGA(unittest.TestCase):
             all(child2.get_value_for_variable(v) == valuation1.get_value_for_variable(v)
                 for v in variables[crossover_index + 1:])
         )
+
+    def test_create_offspring_recombines_compact_valuations_at_crossover_point(self):
+        population = self.rand_ga.generate_population()
+        parent1, parent2 = population[0], population[1]
+        crossover_index = int(len(self.rand_maxsat.variables) / 2)
+
+        child1, child2 = self.rand_ga.create_offspring(parent1, parent2, crossover_index=crossover_index)
+
+        self.assertEqual(parent1.values[:crossover_index + 1] + parent2.values[crossover_index + 1:], child1.values)
+        self.assertEqual(parent2.values[:crossover_index + 1] + parent1.values[crossover_index + 1:], child2.values)
+
+    def test_mutate_flips_every_compact_value_with_certain_mutation(self):
+        candidate = self.rand_ga.generate_population()[0]
+        original_values = candidate.get_values()
+        self.rand_ga.p_mutation = 1.1
+
+        self.rand_ga.mutate(candidate)
+        self.assertTrue(all(a != b for a, b in zip(original_values, candidate.values)))
+
+    def test_incremental_fitness_matches_batched_fitness_after_evolution(self):
+        ga = GA(self.rand_maxsat, incremental=True)
+        ga.population = ga.generate_population()
+        ga.population = ga.generate_next_generation(ga.get_population_fitness())
+        ga.population = ga.generate_next_generation(ga.get_population_fitness())
+
+        self.assertEqual(
+            sorted(f for _, f in ga.evaluator.get_population_fitness(ga.population)),
+            sorted(f for _, f in ga.get_population_fitness())
+        )
+
+    def test_elitism_carries_fittest_candidates_over_unchanged(self):
+        ga = GA(self.rand_maxsat, elitism=2)
+        ga.population = ga.generate_population()
+        candidate_fitness_map = ga.get_population_fitness()
+        elite = [(candidate, candidate.get_values()) for candidate, _ in candidate_fitness_map[:2]]
+
+        ga.population = ga.generate_next_generation(candidate_fitness_map)
+
+        self.assertEqual(ga.population_size, len(ga.population))
+        for candidate, values in elite:
+            self.assertIn(candidate, ga.population)
+            self.assertEqual(values, candidate.get_values())
+
+    def test_get_population_fitness_only_evaluates_new_candidates(self):
+        ga = GA(self.rand_maxsat, elitism=3)
+        ga.population = ga.generate_population()
+        ga.population = ga.generate_next_generation(ga.get_population_fitness())
+        ga.num_evaluations = 0
+
+        candidate_fitness_map = ga.get_population_fitness()
+
+        self.assertEqual(ga.population_size - 3, ga.num_evaluations)
+        self.assertEqual(
+            sorted(f for _, f in ga.evaluator.get_population_fitness(ga.population)),
+            sorted(f for _, f in candidate_fitness_map)
+        )
+
+    def test_steady_state_replacement_replaces_least_fit_candidates(self):
+        ga = GA(self.rand_maxsat, population_size=10, replacement=GA.STEADY_STATE, steady_state_size=3)
+        ga.population = ga.generate_population()
+        candidate_fitness_map = ga.get_population_fitness()
+
+        next_generation = ga.generate_next_generation(candidate_fitness_map)
+
+        self.assertEqual(10, len(next_generation))
+        self.assertEqual([candidate for candidate, _ in candidate_fitness_map[:7]], next_generation[:7])
+
+    def test_create_ga_with_unknown_replacement_fails(self):
+        self.assertRaises(ValueError, lambda: GA(self.rand_maxsat, replacement="unknown"))
+
+    def test_run_reports_cost_of_solution(self):
+        solution, fitness, iteration = result = GA(self.rand_maxsat).run()
+        self.assertEqual(self.rand_maxsat.get_cost(solution), result.cost)
+
+    def test_fitness_of_weighted_problem_is_fraction_of_total_weight(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        maxsat.weights = [1 + i % 4 for i in range(maxsat.num_clauses)]
+        maxsat.hard = [i % 10 == 0 for i in range(maxsat.num_clauses)]
+        ga = GA(maxsat, incremental=True)
+        ga.population = ga.generate_population()
+
+        for candidate, fitness in ga.get_population_fitness():
+            self.assertAlmostEqual(maxsat.get_satisfied_weight(candidate) / maxsat.total_weight, fitness)
+            self.assertAlmostEqual(ga.get_candidate_fitness(candidate), fitness)
+
+    def test_stop_ends_run_after_current_generation(self):
+        class StopAfterThreeGenerations(GenerationObserver):
+            def on_generation(self, ga, stats):
+                if stats.generation == 2:
+                    ga.stop()
+
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1, positive=True)]), Clause([Literal(v1, positive=False)])])
+        ga = GA(maxsat, observers=[StopAfterThreeGenerations()])
+
+        _, _, iteration = ga.run()
+        self.assertEqual(3, iteration)
+        _, _, iteration = ga.run()
+        self.assertEqual(3, iteration)
+
+    def test_run_reports_reaching_fitness_threshold(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1)])])
+
+        result = GA(maxsat).run()
+        self.assertEqual(GA.FITNESS_REACHED, result.reason)
+
+    def test_run_reports_reaching_max_iterations(self):
+        result = GA(self.unsatisfiable_maxsat(), max_iterations=5).run()
+        self.assertEqual((5, GA.MAX_ITERATIONS), (result.iteration, result.reason))
+
+    def test_run_stops_at_time_limit(self):
+        result = GA(self.unsatisfiable_maxsat(), max_iterations=None, time_limit=0.05).run()
+        self.assertEqual(GA.TIME_LIMIT, result.reason)
+        self.assertEqual(0.5, result.fitness)
+
+    def test_run_stops_once_evaluation_budget_is_spent(self):
+        ga = GA(self.unsatisfiable_maxsat(), max_iterations=None, population_size=10, max_evaluations=35)
+
+        result = ga.run()
+        self.assertEqual((4, GA.EVALUATION_BUDGET), (result.iteration, result.reason))
+        self.assertEqual(40, ga.num_evaluations)
+
+    def test_run_stops_after_stagnation_limit(self):
+        # Every candidate has the best fitness, so no generation after the first one improves it
+        result = GA(self.unsatisfiable_maxsat(), max_iterations=None, stagnation_limit=3).run()
+        self.assertEqual((4, GA.STAGNATION), (result.iteration, result.reason))
+
+    def test_run_stops_once_cancellation_token_is_set(self):
+        cancellation = threading.Event()
+        cancellation.set()
+
+        result = GA(self.unsatisfiable_maxsat(), cancellation=cancellation).run()
+        self.assertEqual((0, GA.CANCELLED), (result.iteration, result.reason))
+        self.assertIsNone(result.solution)
+
+    def test_run_returns_best_solution_found_rather_than_last_one(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        fitness = []
+
+        class FitnessRecorder(GenerationObserver):
+            def on_generation(self, ga, stats):
+                fitness.append(stats.best_fitness)
+
+        result = GA(maxsat, max_iterations=20, fitness_threshold=1.0, observers=[FitnessRecorder()]).run()
+        self.assertEqual(max(fitness), result.fitness)
+        self.assertEqual(maxsat.get_num_satisfied_clauses(result.solution) / maxsat.num_clauses, result.fitness)
+
+    def test_create_ga_with_invalid_termination_criteria_fails(self):
+        self.assertRaises(ValueError, lambda: GA(self.rand_maxsat, time_limit=0))
+        self.assertRaises(ValueError, lambda: GA(self.rand_maxsat, max_evaluations=0))
+        self.assertRaises(ValueError, lambda: GA(self.rand_maxsat, stagnation_limit=0))
+        self.assertRaises(TypeError, lambda: GA(self.rand_maxsat, cancellation=True))
+
+    @staticmethod
+    def unsatisfiable_maxsat():
+        v1 = Variable('a')
+        return MAXSAT([v1], [Clause([Literal(v1, positive=True)]), Clause([Literal(v1, positive=False)])])
+
+    def test_iterate_yields_improving_incumbents(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        improvements = GA(maxsat, max_iterations=20, fitness_threshold=1.0).iterate()
+
+        incumbents = []
+        while True:
+            try:
+                incumbents.append(next(improvements))
+            except StopIteration as stop:
+                result = stop.value
+                break
+
+        self.assertEqual(0, incumbents[0].generation)
+        for previous, incumbent in zip(incumbents, incumbents[1:]):
+            self.assertLess(previous.fitness, incumbent.fitness)
+            self.assertLess(previous.generation, incumbent.generation)
+        self.assertIs(incumbents[-1].solution, result.solution)
+        self.assertEqual(maxsat.get_cost(incumbents[-1].solution), incumbents[-1].cost)
+
+    def test_closing_iterate_ends_run(self):
+        ga = GA(self.unsatisfiable_maxsat(), max_iterations=None)
+        improvements = ga.iterate()
+
+        next(improvements)
+        improvements.close()
+        self.assertEqual(0, ga.generation)
+
+    def test_runs_with_equally_seeded_rngs_match(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        results = [
+            GA(maxsat, max_iterations=10, fitness_threshold=1.1, rng=random.Random(3)).run() for _ in range(2)
+        ]
+
+        self.assertEqual(results[0].solution.values, results[1].solution.values)
+        self.assertEqual(results[0].fitness, results[1].fitness)
+
+    def test_run_does_not_use_global_random_state_with_rng(self):
+        state = random.getstate()
+        GA(self.rand_maxsat, max_iterations=3, rng=random.Random(0)).run()
+        self.assertEqual(state, random.getstate())
+
+    def test_generation_without_children_keeps_survivors(self):
+        for ga in (GA(self.rand_maxsat, population_size=4, elitism=4, max_iterations=3, fitness_threshold=1.1),
+                   GA(self.rand_maxsat, population_size=4, replacement=GA.STEADY_STATE, steady_state_size=0,
+                      max_iterations=3, fitness_threshold=1.1, selection=StochasticUniversalSampling())):
+            population = ga.generate_population()
+            ga.population = population
+            next_generation = ga.generate_next_generation(ga.get_population_fitness())
+
+            self.assertEqual(set(population), set(next_generation))
+            self.assertEqual(3, ga.run().iteration)
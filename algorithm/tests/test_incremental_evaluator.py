@@ -0,0 +1,80 @@
+import unittest
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.incremental_evaluator import IncrementalEvaluator
+from sat.problem_generator import ProblemGenerator
+
+
+class TestIncrementalEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.maxsat = ProblemGenerator().generate_problem()
+        self.evaluator = IncrementalEvaluator(self.maxsat)
+
+    def create_candidate(self):
+        return CompactValuation.init_random_from_variables(self.maxsat.variables, self.maxsat.variable_index)
+
+    def test_create_with_invalid_argument_fails(self):
+        self.assertRaises(TypeError, lambda: IncrementalEvaluator([]))
+
+    def test_get_num_satisfied_clauses_matches_clause_evaluation(self):
+        candidate = self.create_candidate()
+        self.assertEqual(
+            self.maxsat.get_num_satisfied_clauses(candidate),
+            self.evaluator.get_num_satisfied_clauses(candidate)
+        )
+
+    def test_flip_updates_counters(self):
+        candidate = self.create_candidate()
+        self.evaluator.get_num_satisfied_clauses(candidate)
+
+        self.evaluator.flip(candidate, [0, 2])
+
+        self.assertIsNotNone(candidate.clause_counters)
+        self.assertEqual(list(self.evaluator.count(candidate.values).counts), list(candidate.clause_counters.counts))
+        self.assertEqual(
+            self.maxsat.get_num_satisfied_clauses(candidate),
+            self.evaluator.get_num_satisfied_clauses(candidate)
+        )
+
+    def test_flip_values_discards_counters(self):
+        candidate = self.create_candidate()
+        self.evaluator.get_num_satisfied_clauses(candidate)
+
+        candidate.flip_values([0])
+        self.assertIsNone(candidate.clause_counters)
+
+    def test_derive_reuses_parent_counters(self):
+        parent1 = self.create_candidate()
+        parent2 = self.create_candidate()
+        self.evaluator.get_num_satisfied_clauses(parent1)
+        self.evaluator.get_num_satisfied_clauses(parent2)
+        # Child differs from parent1 in a single value
+        child = parent1.copy()
+        child.values[1] ^= 1
+
+        self.evaluator.derive(child, [parent1, parent2])
+
+        self.assertIsNotNone(child.clause_counters)
+        self.assertEqual(
+            self.maxsat.get_num_satisfied_clauses(child),
+            self.evaluator.get_num_satisfied_clauses(child)
+        )
+
+    def test_derive_without_parent_counters_leaves_counters_unset(self):
+        parent = self.create_candidate()
+        child = parent.copy()
+
+        self.evaluator.derive(child, [parent])
+        self.assertIsNone(child.clause_counters)
+
+    def test_flip_updates_satisfied_weight(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        maxsat.weights = [1 + i % 4 for i in range(maxsat.num_clauses)]
+        maxsat.hard = [i % 10 == 0 for i in range(maxsat.num_clauses)]
+        evaluator = IncrementalEvaluator(maxsat)
+        candidate = CompactValuation.init_random_from_variables(maxsat.variables, maxsat.variable_index)
+        evaluator.get_score(candidate)
+
+        evaluator.flip(candidate, [0, 5, 17])
+        self.assertEqual(maxsat.get_satisfied_weight(candidate), evaluator.get_score(candidate))
@@ -0,0 +1,110 @@
+import unittest
+
+from algorithm import island_model
+from algorithm.compact_valuation import CompactValuation
+from algorithm.island_model import IslandModel
+from sat.clause import Clause
+from sat.literal import Literal
+from sat.maxsat import MAXSAT
+from sat.problem_generator import ProblemGenerator
+from sat.variable import Variable
+
+
+class TestIslandModel(unittest.TestCase):
+
+    def setUp(self):
+        self.rand_maxsat = ProblemGenerator().generate_problem()
+
+    def test_create_with_invalid_topology_fails(self):
+        self.assertRaises(ValueError, lambda: IslandModel(self.rand_maxsat, topology="star"))
+
+    def test_create_with_invalid_seed_fails(self):
+        self.assertRaises(TypeError, lambda: IslandModel(self.rand_maxsat, seed=[1]))
+
+    def test_run_with_str_seed_achieves_fitness_of_one(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1)])])
+
+        _, fitness, _ = IslandModel(maxsat, islands=2, seed="islands").run()
+        self.assertEqual(1, fitness)
+
+    def test_ring_topology_sends_to_next_island(self):
+        model = IslandModel(self.rand_maxsat, islands=3)
+        self.assertEqual([0], model.get_migration_targets(2))
+
+    def test_fully_connected_topology_sends_to_all_other_islands(self):
+        model = IslandModel(self.rand_maxsat, islands=3, topology=IslandModel.FULLY_CONNECTED)
+        self.assertEqual([0, 2], model.get_migration_targets(1))
+
+    def test_migrate_replaces_least_fit_candidates(self):
+        model = IslandModel(self.rand_maxsat, islands=2, migration_size=1)
+        populations = [[1, 2, 3], [4, 5, 6]]
+        statistics = [{"immigrants": 0}, {"immigrants": 0}]
+
+        model.migrate(populations, statistics)
+
+        self.assertEqual([[1, 2, 4], [4, 5, 1]], populations)
+        self.assertEqual(1, statistics[0]["immigrants"])
+
+    def test_run_achieves_fitness_of_one(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1)])])
+
+        solution, fitness, statistics = IslandModel(maxsat, islands=2, seed=1).run()
+
+        self.assertEqual(1, fitness)
+        self.assertTrue(solution.get_value_for_variable(v1))
+        self.assertEqual(2, len(statistics))
+
+    def test_epoch_returns_best_candidate_found(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        island_model._initialize_worker(maxsat, 8, 1.1)
+
+        _, _, fitness, _, _, best, best_fitness = island_model._run_epoch(0, None, None, 10, 1)
+
+        self.assertGreaterEqual(best_fitness, fitness[0])
+        solution = CompactValuation(maxsat.variables, CompactValuation.unpack_bits(best, 30), maxsat.variable_index)
+        self.assertEqual(best_fitness, maxsat.get_num_satisfied_clauses(solution) / maxsat.num_clauses)
+
+    def test_epoch_only_evaluates_candidates_without_fitness(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        island_model._initialize_worker(maxsat, 8, 1.1)
+        _, population, fitness, _, _, _, _ = island_model._run_epoch(0, None, None, 3, 1)
+        fitness[-2:] = [None, None]
+
+        _, _, _, iterations, evaluations, _, _ = island_model._run_epoch(0, population, fitness, 0, 2)
+
+        self.assertEqual(0, iterations)
+        self.assertEqual(2, evaluations)
+
+    def test_migrate_clears_fitness_of_replaced_candidates(self):
+        model = IslandModel(self.rand_maxsat, islands=2, migration_size=1)
+        populations = [[1, 2, 3], [4, 5, 6]]
+        fitness = [[0.9, 0.8, 0.7], [0.6, 0.5, 0.4]]
+
+        model.migrate(populations, [{"immigrants": 0}, {"immigrants": 0}], fitness)
+
+        self.assertEqual([[0.9, 0.8, None], [0.6, 0.5, None]], fitness)
+
+    def test_create_with_invalid_migration_parameters_fails(self):
+        self.assertRaises(ValueError, lambda: IslandModel(self.rand_maxsat, migration_interval=0))
+        self.assertRaises(ValueError, lambda: IslandModel(self.rand_maxsat, migration_size=-1))
+        self.assertRaises(ValueError, lambda: IslandModel(self.rand_maxsat, max_iterations=-1))
+
+    def test_run_returns_best_fitness_of_any_epoch(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+
+        solution, fitness, statistics = IslandModel(maxsat, islands=2, max_iterations=12, migration_interval=3,
+                                                    population_size=8, fitness_threshold=1.1, seed=2).run()
+
+        self.assertEqual(max(s["best_fitness"] for s in statistics), fitness)
+        self.assertEqual(fitness, maxsat.get_num_satisfied_clauses(solution) / maxsat.num_clauses)
+
+    def test_run_stops_after_max_iterations(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1, positive=True)]), Clause([Literal(v1, positive=False)])])
+
+        _, fitness, statistics = IslandModel(maxsat, islands=2, max_iterations=7, migration_interval=3).run()
+
+        self.assertEqual(0.5, fitness)
+        self.assertTrue(all(s["generations"] == 7 for s in statistics))
@@ -0,0 +1,189 @@
+import random
+import unittest
+
+from algorithm.ga import GA
+from algorithm.incremental_evaluator import IncrementalEvaluator
+from algorithm.compact_valuation import CompactValuation
+from algorithm.local_search import LocalSearch, _SearchState
+from algorithm.valuation import Valuation
+from sat.dimacs import read_dimacs
+from sat.maxsat import MAXSAT
+from sat.problem_generator import ProblemGenerator
+from sat.variable import Variable
+
+
+class TestLocalSearch(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        self.maxsat = ProblemGenerator(seed=0).generate_random_ksat(60, planted=True)
+        self.ga = GA(self.maxsat)
+
+    def assert_counters_are_consistent(self, candidate, num_satisfied):
+        counters = IncrementalEvaluator(self.maxsat).count(candidate.values)
+        self.assertEqual(counters.num_satisfied, num_satisfied)
+        self.assertEqual(list(counters.counts), list(candidate.clause_counters.counts))
+        self.assertEqual(num_satisfied, candidate.clause_counters.num_satisfied)
+
+    def test_walksat_does_not_worsen_candidate(self):
+        candidate = self.ga.generate_population()[0]
+        before = self.maxsat.get_num_satisfied_clauses(candidate)
+
+        num_satisfied = LocalSearch(self.maxsat, max_flips=50).improve(candidate)
+
+        self.assertGreaterEqual(num_satisfied, before)
+        self.assert_counters_are_consistent(candidate, num_satisfied)
+
+    def test_gsat_does_not_worsen_candidate(self):
+        candidate = self.ga.generate_population()[0]
+        before = self.maxsat.get_num_satisfied_clauses(candidate)
+
+        num_satisfied = LocalSearch(self.maxsat, method=LocalSearch.GSAT, max_flips=50, noise=0.2).improve(candidate)
+
+        self.assertGreaterEqual(num_satisfied, before)
+        self.assert_counters_are_consistent(candidate, num_satisfied)
+
+    def test_walksat_solves_planted_instance(self):
+        candidate = self.ga.generate_population()[0]
+        self.assertEqual(self.maxsat.num_clauses, LocalSearch(self.maxsat, max_flips=10000).improve(candidate))
+
+    def test_zero_flip_budget_leaves_candidate_unchanged(self):
+        candidate = self.ga.generate_population()[0]
+        values = candidate.get_values()
+
+        LocalSearch(self.maxsat, max_flips=0).improve(candidate)
+        self.assertEqual(values, candidate.get_values())
+
+    def test_improve_non_compact_candidate_fails(self):
+        candidate = Valuation.init_random_from_variables(self.maxsat.variables)
+        self.assertRaises(TypeError, lambda: LocalSearch(self.maxsat).improve(candidate))
+
+    def test_create_local_search_with_invalid_parameters_fails(self):
+        self.assertRaises(ValueError, lambda: LocalSearch(self.maxsat, method="unknown"))
+        self.assertRaises(ValueError, lambda: LocalSearch(self.maxsat, noise=1.5))
+        self.assertRaises(ValueError, lambda: LocalSearch(self.maxsat, max_flips=-1))
+
+    def test_memetic_ga_records_fitness_of_improved_offspring(self):
+        ga = GA(self.maxsat, local_search=LocalSearch(self.maxsat, max_flips=20))
+        ga.population = ga.generate_population()
+        ga.population = ga.generate_next_generation(ga.get_population_fitness())
+        ga.num_evaluations = 0
+
+        candidate_fitness_map = ga.get_population_fitness()
+
+        self.assertEqual(0, ga.num_evaluations)
+        self.assertEqual(
+            sorted(f for _, f in ga.evaluator.get_population_fitness(ga.population)),
+            sorted(f for _, f in candidate_fitness_map)
+        )
+
+    def test_memetic_ga_improves_elite(self):
+        ga = GA(self.maxsat, elitism=2, local_search=LocalSearch(self.maxsat, max_flips=10000),
+                local_search_target=GA.ELITE)
+        ga.population = ga.generate_population()
+        ga.population = ga.generate_next_generation(ga.get_population_fitness())
+
+        self.assertEqual(1.0, ga.get_population_fitness()[0][1])
+
+    def test_elite_local_search_leaves_evaluated_generation_unchanged(self):
+        ga = GA(self.maxsat, elitism=2, local_search=LocalSearch(self.maxsat, max_flips=10000),
+                local_search_target=GA.ELITE)
+        ga.population = ga.generate_population()
+        candidate_fitness_map = ga.get_population_fitness()
+        values = [candidate.get_values() for candidate, _ in candidate_fitness_map]
+
+        ga.generate_next_generation(candidate_fitness_map)
+
+        self.assertEqual(values, [candidate.get_values() for candidate, _ in candidate_fitness_map])
+        for candidate, fitness in candidate_fitness_map:
+            self.assertEqual(fitness, self.maxsat.get_num_satisfied_clauses(candidate) / self.maxsat.num_clauses)
+
+    def test_local_search_on_weighted_problem_returns_satisfied_weight(self):
+        self.maxsat.weights = [1 + i % 4 for i in range(self.maxsat.num_clauses)]
+        self.maxsat.hard = [i % 10 == 0 for i in range(self.maxsat.num_clauses)]
+        candidate = GA(self.maxsat).generate_population()[0]
+        before = self.maxsat.get_satisfied_weight(candidate)
+
+        score = LocalSearch(self.maxsat, max_flips=50).improve(candidate)
+
+        self.assertGreaterEqual(score, before)
+        self.assertEqual(self.maxsat.get_satisfied_weight(candidate), score)
+        self.assertEqual(score, candidate.clause_counters.satisfied_weight)
+
+    def assert_state_is_consistent(self, state, clauses, values):
+        """ Compares the counts of 'state' to counts computed from scratch. """
+        true_variables = [
+            {abs(literal) - 1 for literal in clause if values[abs(literal) - 1] == (literal > 0)} for clause in clauses
+        ]
+        breaks = [0] * len(values)
+        makes = [0] * len(values)
+        for clause, variables in zip(clauses, true_variables):
+            if len(variables) == 1:
+                breaks[next(iter(variables))] += 1
+            elif not variables:
+                for literal in set(clause):
+                    makes[abs(literal) - 1] += 1
+        self.assertEqual(breaks, list(state.breaks))
+        self.assertEqual(makes, list(state.makes))
+        if state.buckets is not None:
+            for variable in range(len(values)):
+                self.assertEqual(makes[variable] - breaks[variable], state.scores[variable])
+                self.assertIn(variable, state.buckets[state.scores[variable]])
+            self.assertEqual(len(values), sum(len(bucket) for bucket in state.buckets.values()))
+
+    def test_search_state_scores_follow_flips(self):
+        candidate = self.ga.generate_population()[0]
+        counts = IncrementalEvaluator(self.maxsat).count(candidate.values).counts
+        state = _SearchState(self.maxsat.clause_store, self.maxsat.occurrences, None, candidate.values, counts, True)
+
+        rng = random.Random(1)
+        for _ in range(100):
+            state.flip(rng.randrange(len(candidate)))
+        self.assert_state_is_consistent(state, list(self.maxsat.clause_store), candidate.values)
+
+    def test_repeated_literals_are_counted_once(self):
+        variables = [Variable(str(i)) for i in range(1, 4)]
+        maxsat = MAXSAT.from_clause_store(variables, [(1, 1, 2), (-1, -1), (2, 3, 3), (-2, -3)])
+        local_search = LocalSearch(maxsat, method=LocalSearch.GSAT, max_flips=20, noise=0.0)
+
+        for values in ([1, 0, 0], [0, 1, 1], [1, 1, 0]):
+            candidate = CompactValuation(variables, bytearray(values), maxsat.variable_index)
+            score = local_search.improve(candidate, random.Random(0))
+
+            self.assertEqual(maxsat.get_num_satisfied_clauses(candidate), score)
+            counters = IncrementalEvaluator(maxsat).count(candidate.values)
+            self.assertEqual(list(counters.counts), list(candidate.clause_counters.counts))
+
+    def test_local_search_counts_towards_evaluations(self):
+        ga = GA(self.maxsat, local_search=LocalSearch(self.maxsat, max_flips=20))
+        ga.population = ga.generate_population()
+        ga.num_evaluations = 0
+        flips = ga.local_search.num_flips
+
+        ga.generate_next_generation(ga.get_population_fitness())
+
+        self.assertEqual(2 * ga.population_size + ga.local_search.num_flips - flips, ga.num_evaluations)
+
+    def test_elite_local_search_without_survivors_fails(self):
+        local_search = LocalSearch(self.maxsat)
+        self.assertRaises(ValueError, lambda: GA(self.maxsat, local_search=local_search, local_search_target=GA.ELITE))
+        GA(self.maxsat, local_search=local_search, local_search_target=GA.ELITE, replacement=GA.STEADY_STATE)
+
+    def test_memetic_ga_solves_problem_with_empty_clause(self):
+        maxsat = read_dimacs("p cnf 3 3\n1 2 0\n-1 3 0\n0\n".splitlines())
+        for method in (LocalSearch.WALKSAT, LocalSearch.GSAT):
+            ga = GA(maxsat, max_iterations=3, fitness_threshold=1.1,
+                    local_search=LocalSearch(maxsat, method=method, max_flips=10), rng=random.Random(0))
+            result = ga.run()
+
+            self.assertAlmostEqual(2 / 3, result.fitness)
+            self.assertEqual(1, result.cost)
+
+    def test_local_search_on_weighted_problem_with_empty_clause_counts_its_weight(self):
+        maxsat = read_dimacs("p wcnf 2 3 10\n10 1 2 0\n3 0\n2 -1 0\n".splitlines())
+        candidate = GA(maxsat).generate_population()[0]
+
+        score = LocalSearch(maxsat, max_flips=20).improve(candidate, random.Random(0))
+
+        self.assertEqual(maxsat.get_satisfied_weight(candidate), score)
+        self.assertEqual(maxsat.hard_weight + 2, score)
@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from algorithm.ga import GA
+from algorithm.mutation import DecayingMutation, DiversityAdaptiveMutation, Mutation, sample_positions
+from algorithm.observer import get_diversity
+from sat.problem_generator import ProblemGenerator
+
+
+class TestMutation(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+
+    def test_sample_positions_selects_expected_fraction(self):
+        positions = sample_positions(100000, 0.01)
+
+        self.assertAlmostEqual(1000, len(positions), delta=150)
+        self.assertEqual(sorted(set(positions)), positions)
+        self.assertTrue(all(0 <= i < 100000 for i in positions))
+
+    def test_sample_positions_draws_from_given_rng(self):
+        self.assertEqual(sample_positions(1000, 0.1, random.Random(4)), sample_positions(1000, 0.1, random.Random(4)))
+
+    def test_sample_positions_with_certain_probability_selects_all(self):
+        self.assertEqual([0, 1, 2], sample_positions(3, 1.1))
+
+    def test_sample_positions_with_zero_probability_selects_none(self):
+        self.assertEqual([], sample_positions(100, 0))
+
+    def test_sample_splits_flips_over_children(self):
+        flips = Mutation().sample(4, 10, 1.0)
+        self.assertEqual([list(range(10))] * 4, flips)
+
+    def test_decaying_mutation_moves_from_rate_to_final_rate(self):
+        mutation = DecayingMutation(rate=0.1, final_rate=0.001, generations=10)
+
+        self.assertAlmostEqual(0.1, mutation.get_rate(0))
+        self.assertAlmostEqual(0.01, mutation.get_rate(5))
+        self.assertAlmostEqual(0.001, mutation.get_rate(10))
+        self.assertAlmostEqual(0.001, mutation.get_rate(50))
+
+    def test_diversity_adaptive_mutation_raises_rate_for_converged_population(self):
+        mutation = DiversityAdaptiveMutation(rate=0.01, target_diversity=0.2, min_rate=0.001, max_rate=0.05)
+
+        self.assertAlmostEqual(0.01, mutation.get_rate(0, 0.2))
+        self.assertAlmostEqual(0.02, mutation.get_rate(0, 0.1))
+        self.assertAlmostEqual(0.05, mutation.get_rate(0, 0.0))
+        self.assertAlmostEqual(0.005, mutation.get_rate(0, 0.4))
+
+    def test_ga_applies_rate_of_mutation_schedule(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(40)
+        ga = GA(maxsat, mutation=DiversityAdaptiveMutation(target_diversity=0.5))
+        ga.population = ga.generate_population()
+        diversity = get_diversity([candidate.values for candidate in ga.population], len(maxsat.variables))
+        ga.generate_next_generation(ga.get_population_fitness())
+
+        self.assertEqual(ga.mutation.get_rate(0, diversity), ga.mutation_rate)
+
+    def test_create_ga_with_invalid_mutation_fails(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(40)
+        self.assertRaises(TypeError, lambda: GA(maxsat, mutation=0.01))
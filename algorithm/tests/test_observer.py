@@ -0,0 +1,109 @@
+import io
+import sys
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+
+from algorithm.ga import GA
+from algorithm.local_search import LocalSearch
+from algorithm.observer import GenerationObserver, PhaseTimer, ProfilingObserver, get_diversity
+from sat.problem_generator import ProblemGenerator
+
+
+class RecordingObserver(GenerationObserver):
+
+    def __init__(self):
+        self.events = []
+        self.stats = []
+
+    def on_start(self, ga):
+        self.events.append("start")
+
+    def on_generation(self, ga, stats):
+        self.events.append("generation")
+        self.stats.append(stats)
+
+    def on_finish(self, ga, solution, fitness, iteration):
+        self.events.append("finish")
+
+
+class TestObserver(unittest.TestCase):
+
+    def setUp(self):
+        self.rand_maxsat = ProblemGenerator().generate_problem()
+
+    def test_diversity_of_identical_genomes_is_zero(self):
+        self.assertEqual(0.0, get_diversity([bytearray([1, 0]), bytearray([1, 0])], 2))
+
+    def test_diversity_of_complementary_genomes(self):
+        # Two of the four ordered pairs differ in every variable
+        self.assertEqual(0.5, get_diversity([bytearray([1, 0]), bytearray([0, 1])], 2))
+
+    def test_observer_is_notified_once_per_generation(self):
+        observer = RecordingObserver()
+        ga = GA(self.rand_maxsat, max_iterations=3, fitness_threshold=1.1, observers=[observer])
+        ga.run()
+
+        self.assertEqual(["start", "generation", "generation", "generation", "finish"], observer.events)
+        self.assertEqual([0, 1, 2], [stats.generation for stats in observer.stats])
+
+    def test_generation_stats_are_consistent(self):
+        observer = RecordingObserver()
+        GA(self.rand_maxsat, max_iterations=2, fitness_threshold=1.1, observers=[observer]).run()
+
+        for stats in observer.stats:
+            self.assertTrue(stats.worst_fitness <= stats.mean_fitness <= stats.best_fitness)
+            self.assertTrue(0 <= stats.diversity <= 1)
+            self.assertTrue(stats.evaluation_time >= 0 and stats.mutation_time >= 0)
+
+    def test_phase_timer_accumulates_generations(self):
+        timer = PhaseTimer()
+        GA(self.rand_maxsat, max_iterations=4, fitness_threshold=1.1, observers=[timer]).run()
+
+        self.assertEqual(4, timer.generations)
+        self.assertTrue(timer.selection_time > 0)
+
+    def test_profiling_observer_captures_profile_and_memory(self):
+        observer = ProfilingObserver(profile=True, trace_memory=True)
+        GA(self.rand_maxsat, max_iterations=2, observers=[observer]).run()
+
+        self.assertIsNotNone(observer.stats)
+        self.assertTrue(observer.peak_memory > 0)
+
+    def test_profiling_stops_when_run_raises(self):
+        class FailingObserver(GenerationObserver):
+            def on_generation(self, ga, stats):
+                raise RuntimeError("observer failed")
+
+        observer = ProfilingObserver(profile=True, trace_memory=True)
+        ga = GA(self.rand_maxsat, max_iterations=3, fitness_threshold=1.1, observers=[observer, FailingObserver()])
+
+        self.assertRaises(RuntimeError, ga.run)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNotNone(observer.stats)
+        if hasattr(sys, "monitoring"):
+            self.assertIsNone(sys.monitoring.get_tool(sys.monitoring.PROFILER_ID))
+
+    def test_observers_finish_when_iterate_is_closed(self):
+        observer = RecordingObserver()
+        improvements = GA(self.rand_maxsat, max_iterations=None, fitness_threshold=1.1,
+                          observers=[observer]).iterate()
+
+        next(improvements)
+        improvements.close()
+        self.assertEqual("finish", observer.events[-1])
+
+    def test_generation_stats_include_local_search_time(self):
+        observer = RecordingObserver()
+        timer = PhaseTimer()
+        GA(self.rand_maxsat, max_iterations=2, fitness_threshold=1.1, observers=[observer, timer],
+           local_search=LocalSearch(self.rand_maxsat, max_flips=5)).run()
+
+        self.assertTrue(all(stats.local_search_time > 0 for stats in observer.stats))
+        self.assertEqual(sum(stats.local_search_time for stats in observer.stats), timer.local_search_time)
+
+    def test_run_does_not_print(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            GA(self.rand_maxsat, max_iterations=2).run()
+        self.assertEqual("", output.getvalue())
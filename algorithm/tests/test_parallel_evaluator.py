@@ -0,0 +1,31 @@
+import unittest
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.parallel_evaluator import ParallelEvaluator
+from algorithm.population_evaluator import PopulationEvaluator
+from sat.problem_generator import ProblemGenerator
+
+
+class TestParallelEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.maxsat = ProblemGenerator().generate_problem()
+        self.population = [
+            CompactValuation.init_random_from_variables(self.maxsat.variables, self.maxsat.variable_index)
+            for _ in range(12)
+        ]
+
+    def test_create_with_invalid_workers_fails(self):
+        self.assertRaises(ValueError, lambda: ParallelEvaluator(self.maxsat, 0))
+
+    def test_small_population_is_evaluated_without_pool(self):
+        with ParallelEvaluator(self.maxsat, 2, min_population_size=64) as evaluator:
+            evaluator.get_num_satisfied_clauses(self.population)
+            self.assertIsNone(evaluator._pool)
+
+    def test_get_num_satisfied_clauses_matches_serial_evaluation(self):
+        with ParallelEvaluator(self.maxsat, 2, min_population_size=1) as evaluator:
+            self.assertEqual(
+                PopulationEvaluator(self.maxsat).get_num_satisfied_clauses(self.population),
+                evaluator.get_num_satisfied_clauses(self.population)
+            )
@@ -0,0 +1,95 @@
+import random
+import unittest
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.population_evaluator import PopulationEvaluator, count_satisfied_clauses, transpose_genomes
+from algorithm.valuation import Valuation
+from sat.clause import Clause
+from sat.literal import Literal
+from sat.maxsat import MAXSAT
+from sat.problem_generator import ProblemGenerator
+from sat.variable import Variable
+
+
+class TestPopulationEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.v1 = Variable('a')
+        self.v2 = Variable('b')
+        self.v3 = Variable('c')
+        # Clauses of different lengths
+        self.maxsat = MAXSAT([self.v1, self.v2, self.v3], [
+            Clause([Literal(self.v1)]),
+            Clause([Literal(self.v2, positive=False), Literal(self.v3)]),
+            Clause([Literal(self.v1, positive=False), Literal(self.v2), Literal(self.v3, positive=False)]),
+        ])
+        self.evaluator = PopulationEvaluator(self.maxsat)
+
+    def test_create_with_invalid_argument_fails(self):
+        self.assertRaises(TypeError, lambda: PopulationEvaluator([]))
+
+    def test_create_with_unknown_variable_fails(self):
+        maxsat = MAXSAT([self.v1], [Clause([Literal(self.v2)])])
+        self.assertRaises(ValueError, lambda: PopulationEvaluator(maxsat))
+
+    def test_transpose_genomes_interleaves_candidates(self):
+        genomes = [bytearray([1, 0]), bytearray([1, 1])]
+        self.assertEqual([0b11, 0b10], transpose_genomes(genomes, 2))
+
+    def test_count_satisfied_clauses_of_empty_population_is_empty(self):
+        self.assertEqual([], count_satisfied_clauses([(1,)], [], 1))
+
+    def test_get_num_satisfied_clauses_matches_clause_evaluation(self):
+        population = [
+            Valuation({self.v1: a, self.v2: b, self.v3: c})
+            for a in (False, True) for b in (False, True) for c in (False, True)
+        ]
+        self.assertEqual(
+            [self.maxsat.get_num_satisfied_clauses(v) for v in population],
+            self.evaluator.get_num_satisfied_clauses(population)
+        )
+
+    def test_get_num_satisfied_clauses_matches_clause_evaluation_for_large_population(self):
+        maxsat = ProblemGenerator().generate_problem()
+        population = [
+            CompactValuation.init_random_from_variables(maxsat.variables, maxsat.variable_index)
+            for _ in range(37)
+        ]
+        self.assertEqual(
+            [maxsat.get_num_satisfied_clauses(v) for v in population],
+            PopulationEvaluator(maxsat).get_num_satisfied_clauses(population)
+        )
+
+    def test_get_population_fitness_is_sorted_in_descending_order(self):
+        population = [
+            Valuation({self.v1: False, self.v2: True, self.v3: False}),
+            Valuation({self.v1: True, self.v2: False, self.v3: False}),
+        ]
+        fitness = self.evaluator.get_population_fitness(population)
+
+        self.assertEqual([population[1], population[0]], [candidate for candidate, _ in fitness])
+        self.assertEqual([1.0, 1 / 3.0], [f for _, f in fitness])
+
+    def test_get_scores_of_weighted_problem_matches_satisfied_weight(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+        maxsat.weights = [1 + i % 4 for i in range(maxsat.num_clauses)]
+        maxsat.hard = [i % 10 == 0 for i in range(maxsat.num_clauses)]
+        population = [
+            CompactValuation.init_random_from_variables(maxsat.variables, maxsat.variable_index) for _ in range(20)
+        ]
+        self.assertEqual(
+            [maxsat.get_satisfied_weight(v) for v in population],
+            PopulationEvaluator(maxsat).get_scores(population)
+        )
+
+    def test_count_satisfied_clauses_with_distinct_weights_matches_satisfied_weight(self):
+        rng = random.Random(1)
+        clauses = [tuple(rng.choice((-1, 1)) * rng.randint(1, 30) for _ in range(3)) for _ in range(120)]
+        genomes = [bytes(rng.randint(0, 1) for _ in range(30)) for _ in range(20)]
+        for weights in ([1000 + 37 * i for i in range(len(clauses))], [0.5 + i for i in range(len(clauses))]):
+            expected = [
+                sum(weight for clause, weight in zip(clauses, weights)
+                    if any((literal > 0) == bool(genome[abs(literal) - 1]) for literal in clause))
+                for genome in genomes
+            ]
+            self.assertEqual(expected, count_satisfied_clauses(clauses, genomes, 30, weights))
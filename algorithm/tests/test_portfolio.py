@@ -0,0 +1,77 @@
+import unittest
+
+from algorithm.local_search import LocalSearch
+from algorithm.portfolio import Portfolio
+from sat.clause import Clause
+from sat.literal import Literal
+from sat.maxsat import MAXSAT
+from sat.problem_generator import ProblemGenerator
+from sat.variable import Variable
+
+
+class TestPortfolio(unittest.TestCase):
+
+    def setUp(self):
+        self.rand_maxsat = ProblemGenerator().generate_problem()
+
+    def test_create_without_configurations_fails(self):
+        self.assertRaises(ValueError, lambda: Portfolio(self.rand_maxsat, []))
+
+    def test_create_with_invalid_configurations_fails(self):
+        self.assertRaises(TypeError, lambda: Portfolio(self.rand_maxsat, {"population_size": 8}))
+
+    def test_create_with_invalid_seed_fails(self):
+        self.assertRaises(TypeError, lambda: Portfolio(self.rand_maxsat, [{}], seed=[1]))
+
+    def test_run_with_negative_seed_achieves_fitness_of_one(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1)])])
+
+        _, fitness, _ = Portfolio(maxsat, [{}], seed=-3).run()
+        self.assertEqual(1, fitness)
+
+    def test_run_achieves_fitness_of_one(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1)])])
+
+        solution, fitness, statistics = Portfolio(maxsat, [{}, {"population_size": 4}], seed=1).run()
+
+        self.assertEqual(1, fitness)
+        self.assertTrue(solution.get_value_for_variable(v1))
+        self.assertEqual(2, len(statistics))
+        self.assertIn(Portfolio.SOLVED, [s["status"] for s in statistics])
+
+    def test_run_cancels_other_configurations_once_solved(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(60, planted=True)
+        configurations = [
+            {"population_size": 8, "max_iterations": 10 ** 6, "fitness_threshold": 1.0},
+            {"population_size": 8, "max_iterations": 10 ** 6, "local_search": LocalSearch(maxsat, max_flips=500)},
+        ]
+
+        solution, fitness, statistics = Portfolio(maxsat, configurations, workers=2, seed=1).run()
+
+        self.assertEqual(1, fitness)
+        self.assertEqual(maxsat.num_clauses, maxsat.get_num_satisfied_clauses(solution))
+        self.assertEqual(Portfolio.SOLVED, statistics[1]["status"])
+        self.assertIsNotNone(statistics[1]["time_to_solution"])
+        self.assertIn(statistics[0]["status"], (Portfolio.CANCELLED, Portfolio.SOLVED))
+
+    def test_run_stops_once_time_budget_is_spent(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1, positive=True)]), Clause([Literal(v1, positive=False)])])
+        configurations = [{"max_iterations": 10 ** 9}, {"max_iterations": 10 ** 9}]
+
+        _, fitness, statistics = Portfolio(maxsat, configurations, time_budget=0.2, seed=1).run()
+
+        self.assertEqual(0.5, fitness)
+        self.assertTrue(all(s["status"] == Portfolio.TIMEOUT for s in statistics))
+
+    def test_run_reports_exhausted_configurations(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1, positive=True)]), Clause([Literal(v1, positive=False)])])
+
+        _, _, statistics = Portfolio(maxsat, [{"max_iterations": 7}], seed=1).run()
+
+        self.assertEqual(Portfolio.EXHAUSTED, statistics[0]["status"])
+        self.assertEqual(7, statistics[0]["generations"])
+        self.assertEqual(7 * 16, statistics[0]["evaluations"])
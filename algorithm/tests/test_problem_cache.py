@@ -0,0 +1,41 @@
+import unittest
+
+from algorithm.problem_cache import ProblemCache
+from sat.problem_generator import ProblemGenerator
+
+
+class TestProblemCache(unittest.TestCase):
+
+    def setUp(self):
+        self.maxsat = ProblemGenerator(seed=0).generate_random_ksat(10)
+
+    def test_cache_returns_stored_problem(self):
+        cache = ProblemCache(max_entries=2)
+        key = cache.get_key(b"p cnf 1 1\n1 0\n")
+        cache.put(key, self.maxsat)
+
+        self.assertIs(self.maxsat, cache.get(key))
+        self.assertEqual(1, cache.hits)
+        self.assertIsNone(cache.get(cache.get_key(b"p cnf 1 1\n-1 0\n")))
+        self.assertEqual(1, cache.misses)
+
+    def test_cache_evicts_least_recently_used_entry(self):
+        cache = ProblemCache(max_entries=2)
+        keys = [cache.get_key(bytes([i])) for i in range(3)]
+        for key in keys:
+            cache.put(key, self.maxsat)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.evictions)
+        self.assertNotIn(keys[0], cache)
+
+    def test_key_depends_on_split_of_parts(self):
+        self.assertNotEqual(ProblemCache.get_key(b"ab", b"c"), ProblemCache.get_key(b"a", b"bc"))
+
+    def test_compile_builds_derived_structures(self):
+        maxsat = ProblemCache.compile(self.maxsat)
+        self.assertIsNotNone(maxsat._occurrences)
+        self.assertIsNotNone(maxsat._variable_index)
+
+    def test_create_with_invalid_size_fails(self):
+        self.assertRaises(ValueError, lambda: ProblemCache(max_entries=0))
@@ -0,0 +1,44 @@
+import unittest
+
+from algorithm.seed_sequence import SeedSequence
+
+
+class TestSeedSequence(unittest.TestCase):
+
+    def test_same_entropy_generates_same_seed(self):
+        self.assertEqual(SeedSequence(7).generate_seed(), SeedSequence(7).generate_seed())
+        self.assertNotEqual(SeedSequence(7).generate_seed(), SeedSequence(8).generate_seed())
+
+    def test_children_have_distinct_seeds(self):
+        root = SeedSequence(0)
+        seeds = [child.generate_seed() for child in root.spawn(3) + root.spawn(2)]
+
+        self.assertEqual(5, len(set(seeds)))
+        self.assertNotIn(root.generate_seed(), seeds)
+        self.assertEqual([(0,), (1,), (2,)], [child.spawn_key for child in SeedSequence(0).spawn(3)])
+
+    def test_child_seed_does_not_depend_on_other_children(self):
+        root = SeedSequence(3)
+        first, second = root.spawn(2)
+        first.spawn(10)
+
+        self.assertEqual(SeedSequence(3, (1,)).generate_seed(), second.generate_seed())
+        self.assertEqual(SeedSequence(3, (0, 10)).generate_seed(), first.spawn(1)[0].generate_seed())
+
+    def test_create_rng_is_reproducible(self):
+        self.assertEqual(SeedSequence(5).create_rng().random(), SeedSequence(5).create_rng().random())
+
+    def test_create_without_entropy_draws_entropy(self):
+        self.assertNotEqual(SeedSequence().entropy, SeedSequence().entropy)
+
+    def test_create_with_any_random_seed_derives_entropy(self):
+        seeds = [-1, 1.5, "1", b"1", bytearray(b"1"), 1]
+        entropies = [SeedSequence(seed).entropy for seed in seeds]
+
+        self.assertEqual(len(seeds), len(set(entropies)))
+        self.assertTrue(all(entropy >= 0 for entropy in entropies))
+        self.assertEqual(SeedSequence("seed").generate_seed(), SeedSequence("seed").generate_seed())
+
+    def test_create_with_invalid_entropy_fails(self):
+        self.assertRaises(TypeError, lambda: SeedSequence([1]))
+        self.assertRaises(TypeError, lambda: SeedSequence((1, 2)))
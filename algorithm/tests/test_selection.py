@@ -0,0 +1,66 @@
+import random
+import unittest
+from collections import Counter
+
+from algorithm.ga import GA
+from algorithm.selection import (RankSelection, RouletteSelection, StochasticUniversalSampling, TournamentSelection,
+                                 build_alias_table, sample_alias_table)
+from sat.problem_generator import ProblemGenerator
+
+
+class TestSelection(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        self.fitness = [0.6, 0.3, 0.1, 0.0]
+
+    def test_alias_table_reproduces_weights(self):
+        probabilities, aliases = build_alias_table(self.fitness)
+        counts = Counter(sample_alias_table(probabilities, aliases, 20000))
+
+        self.assertAlmostEqual(0.6, counts[0] / 20000.0, delta=0.02)
+        self.assertAlmostEqual(0.1, counts[2] / 20000.0, delta=0.02)
+        self.assertEqual(0, counts[3])
+
+    def test_alias_table_of_zero_weights_is_uniform(self):
+        probabilities, aliases = build_alias_table([0, 0, 0])
+        self.assertEqual({0, 1, 2}, set(sample_alias_table(probabilities, aliases, 100)))
+
+    def test_roulette_selection_draws_requested_number_of_parents(self):
+        self.assertEqual(7, len(RouletteSelection().select(self.fitness, 7)))
+
+    def test_stochastic_universal_sampling_selects_expected_counts(self):
+        counts = Counter(StochasticUniversalSampling().select(self.fitness, 10))
+        self.assertEqual(6, counts[0])
+        self.assertEqual(3, counts[1])
+        self.assertEqual(1, counts[2])
+
+    def test_stochastic_universal_sampling_of_zero_fitness_is_uniform(self):
+        counts = Counter(StochasticUniversalSampling().select([0.0, 0.0], 4))
+        self.assertEqual(2, counts[0])
+
+    def test_selection_of_no_parents_is_empty(self):
+        for selection in (RouletteSelection(), StochasticUniversalSampling(), TournamentSelection(), RankSelection()):
+            self.assertEqual([], selection.select(self.fitness, 0))
+
+    def test_tournament_selection_never_selects_worst_with_large_tournament(self):
+        selected = TournamentSelection(size=50).select(self.fitness, 20)
+        self.assertNotIn(3, selected)
+
+    def test_tournament_with_invalid_size_fails(self):
+        self.assertRaises(ValueError, lambda: TournamentSelection(size=0))
+
+    def test_rank_selection_prefers_fitter_ranks(self):
+        counts = Counter(RankSelection(pressure=2).select(self.fitness, 10000))
+        self.assertTrue(counts[0] > counts[1] > counts[2] > counts[3])
+
+    def test_rank_selection_with_invalid_pressure_fails(self):
+        self.assertRaises(ValueError, lambda: RankSelection(pressure=3))
+
+    def test_ga_with_invalid_selection_fails(self):
+        self.assertRaises(TypeError, lambda: GA(ProblemGenerator().generate_problem(), selection="roulette"))
+
+    def test_ga_uses_given_selection(self):
+        ga = GA(ProblemGenerator().generate_problem(), selection=TournamentSelection(3), population_size=6)
+        ga.population = ga.generate_population()
+        self.assertEqual(6, len(ga.generate_next_generation(ga.get_population_fitness())))
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from algorithm.ga import GA
+from algorithm.observer import GenerationObserver
+from sat.clause import Clause
+from sat.literal import Literal
+from sat.maxsat import MAXSAT
+from sat.problem_generator import ProblemGenerator
+from sat.variable import Variable
+
+
+class TestSolutionStream(unittest.TestCase):
+
+    def setUp(self):
+        self.rand_maxsat = ProblemGenerator(seed=0).generate_random_ksat(30)
+
+    def test_stream_yields_improvements_and_result(self):
+        async def consume():
+            stream = GA(self.rand_maxsat, max_iterations=20, fitness_threshold=1.0).stream()
+            incumbents = [incumbent async for incumbent in stream]
+            return incumbents, stream.best, await stream.result()
+
+        incumbents, best, result = asyncio.run(consume())
+
+        self.assertEqual(sorted(incumbents, key=lambda incumbent: incumbent.fitness), incumbents)
+        self.assertIs(incumbents[-1], best)
+        self.assertIs(best.solution, result.solution)
+
+    def test_search_continues_after_caller_stops_iterating(self):
+        async def consume():
+            stream = GA(self.rand_maxsat, max_iterations=50, fitness_threshold=1.0).stream()
+            first = await stream.__anext__()
+            return first, await stream.result()
+
+        first, result = asyncio.run(consume())
+
+        self.assertEqual(0, first.generation)
+        self.assertEqual(50, result.iteration)
+
+    def test_cancel_stops_run(self):
+        v1 = Variable('a')
+        maxsat = MAXSAT([v1], [Clause([Literal(v1, positive=True)]), Clause([Literal(v1, positive=False)])])
+
+        async def consume():
+            stream = GA(maxsat, max_iterations=None).stream()
+            stream.cancel()
+            return await stream.result()
+
+        result = asyncio.run(consume())
+
+        self.assertEqual(GA.CANCELLED, result.reason)
+        self.assertEqual(0.5, result.fitness)
+
+    def test_stream_raises_error_of_run(self):
+        class FailingObserver(GenerationObserver):
+            def on_generation(self, ga, stats):
+                raise RuntimeError("observer failed")
+
+        async def consume():
+            stream = GA(self.rand_maxsat, observers=[FailingObserver()]).stream()
+            return [incumbent async for incumbent in stream]
+
+        self.assertRaises(RuntimeError, lambda: asyncio.run(consume()))
@@ -0,0 +1,114 @@
+import asyncio
+import unittest
+
+from algorithm import solving_service
+from algorithm.ga import GA
+from algorithm.problem_cache import ProblemCache
+from algorithm.solving_service import SolvingService
+from algorithm.valuation import Valuation
+from sat.problem_generator import ProblemGenerator
+
+TEXT = "p wcnf 3 3 10\n10 1 2 0\n2 -1 0\n1 -2 3 0\n"
+
+
+class TestSolvingService(unittest.TestCase):
+
+    def setUp(self):
+        self.maxsat = ProblemGenerator(seed=0).generate_random_ksat(20)
+
+    def solve(self, jobs, **kwargs):
+        """
+        :param jobs: list of dicts of keyword arguments for SolvingService.submit
+        :return: list of the JobResult of each job
+        """
+        async def run():
+            async with SolvingService(**kwargs) as service:
+                futures = [await service.submit(**job) for job in jobs]
+                return [await future for future in futures]
+
+        return asyncio.run(run())
+
+    def test_solve_dimacs_text(self):
+        result, = self.solve([{"problem": TEXT, "seed": 1}], workers=1, configuration={"fitness_threshold": 1.0})
+
+        self.assertEqual(1.0, result.fitness)
+        self.assertEqual(0, result.cost)
+        self.assertEqual(GA.FITNESS_REACHED, result.reason)
+        self.assertEqual(3, len(result.model))
+
+    def test_repeated_and_reweighted_problems_are_taken_from_cache(self):
+        weights = list(range(1, self.maxsat.num_clauses + 1))
+        jobs = [{"problem": TEXT}, {"problem": TEXT}, {"problem": self.maxsat},
+                {"problem": self.maxsat, "weights": weights}]
+
+        results = self.solve(jobs, workers=1)
+
+        self.assertEqual([False, True, False, True], [result.cached for result in results])
+
+    def test_repeated_problems_are_parsed_once_with_several_workers(self):
+        texts = ["p cnf 3 2\n{} 2 0\n-1 3 0\n".format(i) for i in (1, -1, 2, -2, 3, -3)]
+        jobs = [{"problem": text, "seed": i} for i in range(3) for text in texts]
+
+        results = self.solve(jobs, workers=3, configuration={"max_iterations": 2})
+
+        self.assertEqual(len(texts), sum(not result.cached for result in results))
+        self.assertTrue(all(result.cached for result in results[len(texts):]))
+
+    def test_jobs_on_same_problem_are_routed_to_same_worker(self):
+        async def run():
+            async with SolvingService(workers=4) as service:
+                keys = [ProblemCache.get_key(bytes([i])) for i in range(32)]
+                workers = [service.get_worker(key) for key in keys]
+                return workers, [service.get_worker(key) for key in keys]
+
+        workers, repeated = asyncio.run(run())
+        self.assertEqual(workers, repeated)
+        self.assertEqual({0, 1, 2, 3}, set(workers))
+
+    def test_job_without_problem_is_refused_on_cache_miss(self):
+        solving_service._initialize_worker(1)
+        key = ProblemCache.get_key(TEXT.encode())
+
+        self.assertIsNone(solving_service._solve_job(key, None, None, None, {"max_iterations": 1}, 0, None))
+        self.assertFalse(solving_service._solve_job(key, TEXT, None, None, {"max_iterations": 1}, 0, None).cached)
+        self.assertTrue(solving_service._solve_job(key, None, None, None, {"max_iterations": 1}, 0, None).cached)
+
+    def test_model_matches_cost_of_reweighted_problem(self):
+        weights = list(range(1, self.maxsat.num_clauses + 1))
+        result, = self.solve([{"problem": self.maxsat, "weights": weights}], workers=1)
+
+        problem = self.maxsat.with_weights(weights)
+        valuation = Valuation({problem.variables[abs(literal) - 1]: literal > 0 for literal in result.model})
+        self.assertEqual(problem.get_cost(valuation), result.cost)
+
+    def test_job_stops_at_deadline(self):
+        configuration = {"max_iterations": None, "fitness_threshold": 2.0}
+        result, = self.solve([{"problem": self.maxsat, "deadline": 0.2}], workers=1, configuration=configuration)
+
+        self.assertEqual(GA.TIME_LIMIT, result.reason)
+        self.assertIsNotNone(result.model)
+
+    def test_job_expires_if_deadline_passes_while_queued(self):
+        configuration = {"max_iterations": None, "fitness_threshold": 2.0}
+        jobs = [{"problem": self.maxsat, "deadline": 0.2}, {"problem": self.maxsat, "deadline": 0.01}]
+
+        results = self.solve(jobs, workers=1, configuration=configuration)
+
+        self.assertEqual(SolvingService.EXPIRED, results[1].reason)
+        self.assertIsNone(results[1].model)
+
+    def test_submit_waits_while_queue_is_full(self):
+        async def run():
+            async with SolvingService(workers=1, max_pending=1, configuration={"max_iterations": 5}) as service:
+                await service.submit(self.maxsat)
+                await service.submit(self.maxsat)
+                blocked = asyncio.ensure_future(service.submit(self.maxsat))
+                await asyncio.sleep(0)
+                was_blocked = not blocked.done()
+                await (await blocked)
+                return was_blocked
+
+        self.assertTrue(asyncio.run(run()))
+
+    def test_submit_invalid_problem_fails(self):
+        self.assertRaises(TypeError, lambda: self.solve([{"problem": [(1, 2)]}], workers=1))
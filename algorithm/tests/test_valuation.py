@@ -23,6 +23,15 @@ class TestValuation(unittest.TestCase):
     def test_create_with_invalid_value_fails(self):
         self.assertRaises(TypeError, lambda l: Valuation({Variable('a'): 1}))
 
+    def test_from_trusted_holds_mapping(self):
+        mapping = {self.variable: True}
+        self.assertIs(mapping, Valuation.from_trusted(mapping).valuation)
+
+    def test_init_random_assigns_every_variable(self):
+        v = Valuation.init_random_from_variables(self.variables)
+        self.assertEqual(set(self.variables), set(v.valuation))
+        self.assertTrue(all(isinstance(value, bool) for value in v.valuation.values()))
+
     def test_create_with_variables_creates_valuation(self):
         mapping = {Variable('a'): False}
         v = Valuation(mapping)
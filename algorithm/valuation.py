@@ -9,14 +9,32 @@ class Valuation:
     """
 
     @classmethod
-    def init_random_from_variables(cls, variables):
+    def init_random_from_variables(cls, variables, rng=None):
+        """
+        :param variables: list of Variable instances
+        :param rng: random.Random instance to draw from; the random module if None
+        :return: valuation assigning a random value to each variable
+        """
         if not isinstance(variables, list):
             raise TypeError("'variables' must be a list.")
         if not all(isinstance(v, Variable) for v in variables):
             raise TypeError("'All elements of 'variables' must be Variable instances.'")
 
-        valuation = {v: bool(random.getrandbits(1)) for v in variables}
-        return cls(valuation)
+        # Draw all values at once, as the bits of a single number
+        bits = (rng or random).getrandbits(len(variables)) if variables else 0
+        return cls.from_trusted({v: bool(bits >> i & 1) for i, v in enumerate(variables)})
+
+    @classmethod
+    def from_trusted(cls, valuation):
+        """
+        Creates a valuation like the constructor, without checking the types of the keys and values of 'valuation',
+        for mappings that are valid by construction.
+        :param valuation: 'Variable -> bool' dict
+        :return: valuation holding 'valuation'
+        """
+        instance = cls.__new__(cls)
+        instance._valuation = valuation
+        return instance
 
     def __init__(self, valuation):
         if not isinstance(valuation, dict):
@@ -63,10 +81,11 @@ class Valuation:
 
         self.valuation[literal.variable] = value
 
-    def change_value_for_random_variable(self):
+    def change_value_for_random_variable(self, rng=None):
         """ Changes the value for a randomly selected variable.
+        :param rng: random.Random instance to draw from; the random module if None
         """
-        variable = random.choice(list(self.valuation))
+        variable = (rng or random).choice(list(self.valuation))
         current_value = self.get_value_for_variable(variable)
         self.set_value_for_variable(variable, not current_value)
 
@@ -0,0 +1,268 @@
+""" Throughput and solution-quality benchmarks for the genetic algorithm.
+
+Runs GA.run over a matrix of random 3-SAT instance sizes and population sizes, generated from fixed seeds,
+plus micro-benchmarks of the GA's hot operations and of the validation its trusted construction path skips,
+and emits the results as JSON.
+
+Usage:
+    python -m benchmarks.ga_benchmark --output current.json [--baseline baseline.json]
+    python -m benchmarks.ga_benchmark --compare baseline.json current.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from time import perf_counter
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.ga import GA
+from sat.problem_generator import ProblemGenerator
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Metrics for which a higher value is better; for all other metrics, lower is better
+HIGHER_IS_BETTER = {"generations_per_second", "evaluations_per_second", "final_fitness",
+                    "saved_seconds_per_generation"}
+
+
+class _InstrumentedGA(GA):
+    """ GA that records when the target fitness was first reached.
+    """
+
+    def __init__(self, maxsat, target_fitness, **kwargs):
+        super().__init__(maxsat, **kwargs)
+        self.target_fitness = target_fitness
+        self.start_time = None
+        self.time_to_target = None
+
+    def get_population_fitness(self):
+        candidate_fitness_map = super().get_population_fitness()
+        if self.time_to_target is None and candidate_fitness_map[0][1] >= self.target_fitness:
+            self.time_to_target = perf_counter() - self.start_time
+        return candidate_fitness_map
+
+
+def create_problem(num_variables, num_clauses, seed):
+    return ProblemGenerator(seed=seed).generate_random_ksat(num_variables, num_clauses)
+
+
+def get_peak_rss_kb():
+    """
+    :return: peak resident set size of this process in KiB, or None where the resource module is unavailable
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports ru_maxrss in bytes, Linux and the BSDs in KiB
+    if sys.platform == "darwin":
+        return peak // 1024
+    return peak
+
+
+def run_configuration(num_variables, num_clauses, population_size, seed, max_iterations, target_fitness):
+    """
+    Runs GA.run once on a random 3-SAT instance.
+    :return: dict of the configuration and its measured metrics
+    """
+    maxsat = create_problem(num_variables, num_clauses, seed)
+    ga = _InstrumentedGA(maxsat, target_fitness, max_iterations=max_iterations,
+                         population_size=population_size, fitness_threshold=1.0, rng=random.Random(seed))
+
+    ga.start_time = perf_counter()
+    _, fitness, iteration = ga.run()
+    seconds = perf_counter() - ga.start_time
+
+    return {
+        "name": "run/variables={0},clauses={1},population={2}".format(num_variables, num_clauses, population_size),
+        "num_variables": num_variables,
+        "num_clauses": num_clauses,
+        "population_size": population_size,
+        "seconds": seconds,
+        "generations_per_second": iteration / seconds,
+        "evaluations_per_second": ga.num_evaluations / seconds,
+        "time_to_target": ga.time_to_target,
+        "final_fitness": fitness,
+        "peak_rss_kb": get_peak_rss_kb(),
+    }
+
+
+def run_micro_benchmarks(num_variables, num_clauses, seed, repeat=3):
+    """
+    Times the GA operations executed for every candidate in every generation.
+    :return: list of dicts, each containing the name of an operation and its time per call
+    """
+    maxsat = create_problem(num_variables, num_clauses, seed)
+    ga = GA(maxsat, rng=random.Random(seed))
+    parent1, parent2 = ga.generate_population()[:2]
+
+    operations = {
+        "create_offspring": lambda: ga.create_offspring(parent1, parent2),
+        "mutate": lambda: ga.mutate(parent1),
+        "get_num_satisfied_clauses": lambda: maxsat.get_num_satisfied_clauses(parent1),
+    }
+
+    results = []
+    for operation, function in operations.items():
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+        results.append({
+            "name": "micro/{0}/variables={1},clauses={2}".format(operation, num_variables, num_clauses),
+            "seconds_per_call": seconds,
+        })
+    return results
+
+
+def run_validation_benchmark(num_variables, num_clauses, population_size, seed, repeat=3):
+    """
+    Times building a generation of children from their genomes and assigning it as the population of a GA,
+    once through the validating constructor and population setter, and once through the trusted path the GA uses.
+    Both paths copy the genomes, as the constructor does, so that their difference is the time spent on validation.
+    The time of copying the genomes, which the GA also saves by handing its fresh genomes to the valuations,
+    is reported separately.
+    :return: dict of the configuration and the time per generation of either path and of the copies
+    """
+    maxsat = create_problem(num_variables, num_clauses, seed)
+    ga = GA(maxsat, population_size=population_size, rng=random.Random(seed))
+    variables = maxsat.variables
+    index = maxsat.variable_index
+    genomes = [candidate.values for candidate in ga.generate_population()]
+
+    def checked():
+        ga.population = [CompactValuation(variables, genome, index) for genome in genomes]
+
+    def trusted():
+        # The GA assigns its own generations to the population without going through the setter
+        return [CompactValuation.from_trusted(variables, bytearray(genome), index) for genome in genomes]
+
+    def copy():
+        return [bytearray(genome) for genome in genomes]
+
+    seconds = {}
+    for path, function in (("checked", checked), ("trusted", trusted), ("copy", copy)):
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        seconds[path] = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    return {
+        "name": "validation/variables={0},clauses={1},population={2}".format(num_variables, num_clauses,
+                                                                            population_size),
+        "checked_seconds_per_generation": seconds["checked"],
+        "trusted_seconds_per_generation": seconds["trusted"],
+        "saved_seconds_per_generation": seconds["checked"] - seconds["trusted"],
+        "copy_seconds_per_generation": seconds["copy"],
+    }
+
+
+def run_benchmarks(variables, ratios, populations, seed, max_iterations, target_fitness):
+    """
+    Runs every configuration of the matrix in a fresh process, so that peak RSS and timings are not affected
+    by earlier configurations, followed by the micro-benchmarks for each instance size.
+    :return: dict holding the environment and a list of results
+    """
+    results = []
+    for num_variables, ratio, population_size in product(variables, ratios, populations):
+        num_clauses = int(round(ratio * num_variables))
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results.append(pool.submit(run_configuration, num_variables, num_clauses, population_size,
+                                       seed, max_iterations, target_fitness).result())
+
+    for num_variables, ratio in product(variables, ratios):
+        results.extend(run_micro_benchmarks(num_variables, int(round(ratio * num_variables)), seed))
+
+    for num_variables, ratio, population_size in product(variables, ratios, populations):
+        results.append(run_validation_benchmark(num_variables, int(round(ratio * num_variables)), population_size,
+                                                seed))
+
+    return {
+        "python": platform.python_version(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(baseline, current, tolerance=0.1):
+    """
+    :param baseline: benchmark results as returned by 'run_benchmarks'
+    :param current: benchmark results as returned by 'run_benchmarks'
+    :param tolerance: relative change a metric may get worse by before being flagged
+    :return: list of messages describing each regression of 'current' with respect to 'baseline'
+    """
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        reference = baseline_results.get(result["name"])
+        if reference is None:
+            continue
+        for metric, value in result.items():
+            old = reference.get(metric)
+            if metric in ("name", "seconds") or not isinstance(old, (int, float)) or isinstance(old, bool):
+                continue
+            if value is None:
+                regressions.append("{0}: {1} was {2}, is now missing".format(result["name"], metric, old))
+                continue
+            if not isinstance(value, (int, float)) or value == old:
+                continue
+
+            if metric in HIGHER_IS_BETTER:
+                worse = value < old * (1 - tolerance)
+            else:
+                worse = value > old * (1 + tolerance)
+            if worse:
+                regressions.append("{0}: {1} went from {2:.6g} to {3:.6g}".format(result["name"], metric, old, value))
+
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmarks GA throughput and solution quality.")
+    parser.add_argument("--variables", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--ratios", type=float, nargs="+", default=[4.26])
+    parser.add_argument("--populations", type=int, nargs="+", default=[16, 64])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-iterations", type=int, default=25)
+    parser.add_argument("--target-fitness", type=float, default=0.95)
+    parser.add_argument("--output", help="file to write the results to, instead of stdout")
+    parser.add_argument("--baseline", help="results to compare the new results against")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="only compare two stored result files")
+    arguments = parser.parse_args(arguments)
+
+    if arguments.compare:
+        with open(arguments.compare[0]) as f:
+            baseline = json.load(f)
+        with open(arguments.compare[1]) as f:
+            current = json.load(f)
+    else:
+        current = run_benchmarks(arguments.variables, arguments.ratios, arguments.populations, arguments.seed,
+                                 arguments.max_iterations, arguments.target_fitness)
+        if arguments.output:
+            with open(arguments.output, "w") as f:
+                json.dump(current, f, indent=2)
+        else:
+            json.dump(current, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        baseline = None
+        if arguments.baseline:
+            with open(arguments.baseline) as f:
+                baseline = json.load(f)
+
+    if baseline is None:
+        return 0
+    regressions = compare(baseline, current, arguments.tolerance)
+    for regression in regressions:
+        sys.stderr.write("REGRESSION {0}\n".format(regression))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
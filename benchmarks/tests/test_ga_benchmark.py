@@ -0,0 +1,63 @@
+import sys
+import unittest
+from unittest import mock
+
+from benchmarks import ga_benchmark
+from benchmarks.ga_benchmark import compare, run_configuration, run_micro_benchmarks, run_validation_benchmark
+
+
+class TestGABenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = {"results": [
+            {"name": "run/a", "generations_per_second": 100.0, "peak_rss_kb": 1000, "time_to_target": 1.0},
+            {"name": "micro/b", "seconds_per_call": 0.001},
+        ]}
+
+    def test_run_configuration_reports_metrics(self):
+        result = run_configuration(20, 60, 8, seed=1, max_iterations=3, target_fitness=0.5)
+
+        self.assertEqual("run/variables=20,clauses=60,population=8", result["name"])
+        self.assertTrue(result["generations_per_second"] > 0)
+        self.assertTrue(0 < result["final_fitness"] <= 1)
+
+    def test_run_micro_benchmarks_times_each_operation(self):
+        results = run_micro_benchmarks(20, 60, seed=1, repeat=1)
+        self.assertEqual(3, len(results))
+        self.assertTrue(all(r["seconds_per_call"] > 0 for r in results))
+
+    def test_run_validation_benchmark_times_both_paths(self):
+        result = run_validation_benchmark(20, 60, 8, seed=1, repeat=1)
+
+        self.assertEqual("validation/variables=20,clauses=60,population=8", result["name"])
+        self.assertTrue(result["checked_seconds_per_generation"] > 0)
+        self.assertTrue(result["trusted_seconds_per_generation"] > 0)
+        self.assertTrue(result["copy_seconds_per_generation"] > 0)
+
+    @unittest.skipIf(ga_benchmark.resource is None, "requires the resource module")
+    def test_peak_rss_is_reported_in_kib_on_every_platform(self):
+        usage = mock.Mock(ru_maxrss=2048 * 1024)
+        with mock.patch.object(ga_benchmark.resource, "getrusage", return_value=usage):
+            with mock.patch.object(sys, "platform", "darwin"):
+                self.assertEqual(2048, ga_benchmark.get_peak_rss_kb())
+            with mock.patch.object(sys, "platform", "linux"):
+                self.assertEqual(2048 * 1024, ga_benchmark.get_peak_rss_kb())
+
+    def test_compare_without_changes_finds_no_regressions(self):
+        self.assertEqual([], compare(self.baseline, self.baseline))
+
+    def test_compare_flags_lower_throughput(self):
+        current = {"results": [dict(self.baseline["results"][0], generations_per_second=50.0)]}
+        self.assertEqual(1, len(compare(self.baseline, current)))
+
+    def test_compare_flags_slower_micro_benchmark(self):
+        current = {"results": [{"name": "micro/b", "seconds_per_call": 0.002}]}
+        self.assertEqual(1, len(compare(self.baseline, current)))
+
+    def test_compare_tolerates_small_changes(self):
+        current = {"results": [{"name": "micro/b", "seconds_per_call": 0.00105}]}
+        self.assertEqual([], compare(self.baseline, current, tolerance=0.1))
+
+    def test_compare_flags_target_no_longer_reached(self):
+        current = {"results": [dict(self.baseline["results"][0], time_to_target=None)]}
+        self.assertEqual(1, len(compare(self.baseline, current)))
@@ -3,15 +3,34 @@ from sat.literal import Literal
 
 
 class Clause:
-    """ Represents a clause in a MAXSAT problem. """
+    """ Represents a clause in a MAXSAT problem.
+        A soft clause contributes its weight to the score of a valuation satisfying it;
+        a hard clause must be satisfied by any feasible solution.
+    """
 
-    def __init__(self, literals):
+    __slots__ = ("_literals", "_weight", "_hard")
+
+    @classmethod
+    def from_trusted(cls, literals, weight=1, hard=False):
+        """
+        Creates a clause like the constructor, without checking the type of each literal,
+        for literals built from the variables of a problem that was validated before.
+        """
+        clause = cls.__new__(cls)
+        clause._literals = literals
+        clause.weight = weight
+        clause.hard = hard
+        return clause
+
+    def __init__(self, literals, weight=1, hard=False):
         if not isinstance(literals, list):
             raise TypeError("'literals' must be a list.")
         if not all(isinstance(l, Literal) for l in literals):
             raise TypeError("All elements in 'literals' must be Literal instances.")
 
         self._literals = literals
+        self.weight = weight
+        self.hard = hard
 
     def is_satisfied(self, valuation):
         """
@@ -38,5 +57,27 @@ class Clause:
             raise TypeError("'literals' must be a list of Literal instances.")
         self._literals = literals
 
+    @property
+    def weight(self):
+        return self._weight
+
+    @weight.setter
+    def weight(self, weight):
+        if not isinstance(weight, (int, float)) or isinstance(weight, bool):
+            raise TypeError("'weight' must be a number.")
+        if weight < 0:
+            raise ValueError("'weight' cannot be negative.")
+        self._weight = weight
+
+    @property
+    def hard(self):
+        return self._hard
+
+    @hard.setter
+    def hard(self, hard):
+        if not isinstance(hard, bool):
+            raise TypeError("'hard' must be a bool.")
+        self._hard = hard
+
     def __str__(self):
         return "[{0}]".format(", ".join([literal.__str__() for literal in self.literals]))
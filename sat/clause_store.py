@@ -0,0 +1,99 @@
+from array import array
+from itertools import repeat
+
+
+class ClauseStore:
+    """ Flat, CSR-style storage of clauses as signed literals.
+        All literals are stored back to back in 'literals'; clause i occupies literals[offsets[i]:offsets[i + 1]].
+        Literal i + 1 (-(i + 1)) denotes that the variable with ordinal i occurs positively (negatively).
+    """
+
+    __slots__ = ("offsets", "literals", "_length")
+
+    @classmethod
+    def from_clauses(cls, clauses):
+        """
+        :param clauses: iterable containing a sequence of signed literals for each clause
+        :return: ClauseStore containing the given clauses
+        """
+        store = cls()
+        for clause in clauses:
+            store.append(clause)
+        return store
+
+    @classmethod
+    def from_arrays(cls, offsets, literals):
+        """
+        :param offsets: array('q') of clause offsets into 'literals', starting with 0 and ending with len(literals)
+        :param literals: array('i') of signed literals
+        :return: ClauseStore wrapping the given arrays
+        """
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(literals):
+            raise ValueError("'offsets' must run from 0 to the number of literals.")
+
+        store = cls()
+        store.offsets = offsets
+        store.literals = literals
+        store._length = -1 if len(offsets) > 1 else None
+        return store
+
+    def __init__(self):
+        self.offsets = array("q", [0])
+        self.literals = array("i")
+        # Length shared by all clauses; None while empty, -1 once the lengths differ
+        self._length = None
+
+    def append(self, literals):
+        """
+        :param literals: sequence of signed literals making up the clause to add
+        """
+        self.literals.extend(literals)
+        self.offsets.append(len(self.literals))
+
+        length = self.offsets[-1] - self.offsets[-2]
+        if self._length is None:
+            self._length = length
+        elif self._length != length:
+            self._length = -1
+
+    def get_length(self, i):
+        """
+        :param i: index of a clause
+        :return: number of literals in clause i
+        """
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        """
+        :param i: index of a clause
+        :return: tuple of the signed literals in clause i
+        """
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Clause index out of range.")
+        return tuple(self.literals[self.offsets[i]:self.offsets[i + 1]])
+
+    def __iter__(self):
+        """
+        :return: iterator over tuples of the signed literals of each clause
+        """
+        length = self._length
+        if length is None:
+            return iter(())
+        if length == 0:
+            return repeat((), len(self))
+        if length > 0:
+            # All clauses have the same length, so they can be cut from the literals without consulting the offsets
+            return zip(*[iter(self.literals)] * length)
+        return self._iter_by_offsets()
+
+    def _iter_by_offsets(self):
+        literals = self.literals
+        start = 0
+        for end in self.offsets[1:]:
+            yield tuple(literals[start:end])
+            start = end
@@ -0,0 +1,190 @@
+import bz2
+import gzip
+import lzma
+import os
+
+from sat.clause_store import ClauseStore
+from sat.maxsat import MAXSAT
+from sat.variable import Variable
+
+# Decompressors by file extension
+_OPENERS = {".gz": gzip.open, ".xz": lzma.open, ".lzma": lzma.open, ".bz2": bz2.open}
+
+
+def open_dimacs(path, mode="r"):
+    """
+    :param path: path of a DIMACS file, as a str or path-like object, optionally compressed with gzip, xz or bzip2
+    :param mode: "r" to read or "w" to write the file
+    :return: text stream over the (decompressed) lines of the file
+    """
+    path = os.fspath(path)
+    for extension, opener in _OPENERS.items():
+        if path.endswith(extension):
+            return opener(path, mode + "t")
+    return open(path, mode)
+
+
+def load_dimacs(path):
+    """ Loads a DIMACS CNF or WCNF file into a MAXSAT instance.
+        Variable i of the file becomes Variable('i'); clauses are only stored in a ClauseStore.
+    :param path: path of a DIMACS file, optionally compressed with gzip, xz or bzip2
+    :return: MAXSAT instance
+    """
+    with open_dimacs(path) as lines:
+        return read_dimacs(lines)
+
+
+def read_dimacs(lines):
+    """ Reads a DIMACS CNF or WCNF problem into a MAXSAT instance, as 'load_dimacs' does.
+    :param lines: iterable of text lines, such as a file opened by 'open_dimacs' or the result of str.splitlines
+    :return: MAXSAT instance
+    """
+    reader = DimacsReader(lines)
+    clause_store = ClauseStore()
+    weights = []
+    hard = []
+    num_variables = 0
+    for literals, weight, is_hard in reader:
+        clause_store.append(literals)
+        weights.append(weight)
+        hard.append(is_hard)
+        for literal in literals:
+            if abs(literal) > num_variables:
+                num_variables = abs(literal)
+
+    if reader.num_variables is not None:
+        num_variables = max(num_variables, reader.num_variables)
+    variables = [Variable(str(i)) for i in range(1, num_variables + 1)]
+
+    if not any(hard):
+        hard = None
+    if hard is None and all(weight == 1 for weight in weights):
+        weights = None
+    return MAXSAT.from_clause_store(variables, clause_store, weights, hard)
+
+
+def write_cnf(path, num_variables, num_clauses, clauses):
+    """ Streams clauses into a DIMACS CNF file.
+    :param path: path of the file to write; compressed if it ends in '.gz', '.xz' or '.bz2'
+    :param num_variables: number of variables
+    :param num_clauses: number of clauses
+    :param clauses: iterable containing a sequence of signed literals for each clause
+    """
+    with open_dimacs(path, "w") as f:
+        f.write("p cnf {0} {1}\n".format(num_variables, num_clauses))
+        for clause in clauses:
+            f.write(" ".join(map(str, clause)))
+            f.write(" 0\n" if clause else "0\n")
+
+
+def save_dimacs(maxsat, path):
+    """ Writes a MAXSAT instance to a DIMACS file: CNF if it is unweighted without hard clauses, WCNF otherwise.
+        Variable ordinal i is written as variable i + 1.
+    :param maxsat: MAXSAT instance to write
+    :param path: path of the file to write; compressed if it ends in '.gz', '.xz' or '.bz2'
+    """
+    clause_store = maxsat.clause_store
+    if maxsat.weights is None and maxsat.hard is None:
+        write_cnf(path, len(maxsat.variables), len(clause_store), clause_store)
+        return
+
+    weights = maxsat.weights or [1] * len(clause_store)
+    hard = maxsat.hard or [False] * len(clause_store)
+    with open_dimacs(path, "w") as f:
+        for clause, weight, is_hard in zip(clause_store, weights, hard):
+            f.write("h " if is_hard else "{0} ".format(weight))
+            f.write("".join("{0} ".format(literal) for literal in clause))
+            f.write("0\n")
+
+
+class DimacsReader:
+    """ Streams the clauses of a DIMACS file, one line at a time. Supports:
+            - 'p cnf <variables> <clauses>': unweighted clauses, all treated as soft with weight 1
+            - 'p wcnf <variables> <clauses> [<top>]': clauses prefixed with a weight; a weight of at least 'top' is hard
+            - the header-less WCNF format of recent MaxSAT Evaluations: soft clauses prefixed with a weight,
+              hard clauses prefixed with 'h'
+        Clauses may span several lines; each one ends with a 0.
+        A line starting with '%' ends the clauses, as in the SATLIB benchmark files, which are followed by a '0' line.
+    """
+
+    def __init__(self, lines):
+        """
+        :param lines: iterable of text lines, such as a file opened by 'open_dimacs'
+        """
+        self._lines = lines
+
+        self.format = None
+        self.num_variables = None
+        self.num_clauses = None
+        self.top = None
+
+    def __iter__(self):
+        """
+        :return: generator of (literals, weight, hard) tuples, one per clause,
+            where literals is a tuple of signed variable IDs
+        """
+        literals = []
+        weight = None
+        is_hard = False
+
+        for line_number, line in enumerate(self._lines, 1):
+            line = line.strip()
+            if not line or line[0] == "c":
+                continue
+            if line[0] == "%":
+                break
+            if line[0] == "p":
+                self._read_header(line, line_number)
+                continue
+            if self.format is None:
+                self.format = "wcnf"
+
+            for token in line.split():
+                if weight is None:
+                    if self.format == "cnf":
+                        weight = 1
+                    elif token == "h":
+                        weight = 1
+                        is_hard = True
+                        continue
+                    else:
+                        weight = self._parse_number(token, line_number)
+                        is_hard = self.top is not None and weight >= self.top
+                        continue
+
+                try:
+                    literal = int(token)
+                except ValueError:
+                    raise ValueError("Line {0}: invalid literal '{1}'.".format(line_number, token))
+
+                if literal == 0:
+                    yield tuple(literals), weight, is_hard
+                    literals = []
+                    weight = None
+                    is_hard = False
+                else:
+                    literals.append(literal)
+
+        if literals:
+            raise ValueError("Last clause is not terminated by 0.")
+
+    def _read_header(self, line, line_number):
+        fields = line.split()
+        if len(fields) < 4 or fields[1] not in ("cnf", "wcnf"):
+            raise ValueError("Line {0}: invalid problem line '{1}'.".format(line_number, line))
+
+        self.format = fields[1]
+        self.num_variables = int(fields[2])
+        self.num_clauses = int(fields[3])
+        if self.format == "wcnf" and len(fields) > 4:
+            self.top = self._parse_number(fields[4], line_number)
+
+    @staticmethod
+    def _parse_number(token, line_number):
+        try:
+            return int(token)
+        except ValueError:
+            try:
+                return float(token)
+            except ValueError:
+                raise ValueError("Line {0}: invalid weight '{1}'.".format(line_number, token))
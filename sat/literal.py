@@ -6,6 +6,18 @@ class Literal:
         Contains a variable and whether it is a positive or negative literal.
     """
 
+    __slots__ = ("_positive", "_variable")
+
+    @classmethod
+    def from_trusted(cls, variable, positive=True):
+        """
+        Creates a literal like the constructor, without checking the types of its arguments.
+        """
+        literal = cls.__new__(cls)
+        literal._positive = positive
+        literal._variable = variable
+        return literal
+
     def __init__(self, variable, positive=True):
         if not isinstance(positive, bool):
             raise TypeError("'positive' must be a boolean.")
@@ -1,5 +1,11 @@
+from array import array
+from math import inf
+
+from algorithm.compact_valuation import CompactValuation
 from algorithm.valuation import Valuation
 from sat.clause import Clause
+from sat.clause_store import ClauseStore
+from sat.literal import Literal
 from sat.variable import Variable
 
 
@@ -8,8 +14,66 @@ class MAXSAT:
         Contains:
             - a list of variables
             - a list of clauses, which in turn contain literals
+            - optionally, a weight per clause and which clauses are hard constraints
+
+        The score of a valuation is the total weight of the clauses it satisfies, where a hard clause weighs
+        more than all soft clauses together; without weights, it is the number of satisfied clauses.
+        Its cost, in the standard MaxSAT sense, is the total weight of the soft clauses it falsifies.
     """
 
+    @classmethod
+    def from_clause_store(cls, variables, clause_store, weights=None, hard=None):
+        """
+        Creates a problem directly from a flat store of signed literals,
+        without building Clause and Literal instances until 'clauses' is first accessed.
+        :param variables: list of Variable instances
+        :param clause_store: ClauseStore, or an iterable containing a sequence of signed literals for each clause
+        :param weights: optional list containing the weight of each clause
+        :param hard: optional list containing, for each clause, whether it is a hard constraint
+        :return: MAXSAT instance
+        """
+        if not isinstance(clause_store, ClauseStore):
+            clause_store = ClauseStore.from_clauses(clause_store)
+
+        return cls(variables, [])._use_clause_store(clause_store, weights, hard)
+
+    @classmethod
+    def from_trusted(cls, variables, clauses):
+        """
+        Creates a problem like the constructor, without checking the types of the variables and clauses,
+        for lists taken from a problem that was validated before.
+        :param variables: list of Variable instances
+        :param clauses: list of Clause instances
+        :return: MAXSAT instance
+        """
+        maxsat = cls.__new__(cls)
+        maxsat._initialize(variables, clauses)
+        return maxsat
+
+    def _use_clause_store(self, clause_store, weights, hard):
+        """
+        Replaces the (empty) clauses of this problem by those in 'clause_store'.
+        :return: this problem
+        """
+        self._clauses = None
+        self._clause_store = clause_store
+        self.weights = weights
+        self.hard = hard
+        return self
+
+    def with_weights(self, weights=None, hard=None):
+        """
+        Creates a problem with the same variables and clauses but other weights, which shares the variable index,
+        clause store and occurrence index of this problem instead of building its own.
+        :param weights: optional list containing the weight of each clause
+        :param hard: optional list containing, for each clause, whether it is a hard constraint
+        :return: MAXSAT instance
+        """
+        maxsat = MAXSAT.from_trusted(self.variables, [])._use_clause_store(self.clause_store, weights, hard)
+        maxsat._variable_index = self.variable_index
+        maxsat._occurrences = self.occurrences
+        return maxsat
+
     def __init__(self, variables, clauses):
         if not isinstance(variables, list):
             raise TypeError("'variables' must be a list.")
@@ -21,18 +85,85 @@ class MAXSAT:
         if not all(isinstance(c, Clause) for c in clauses):
             raise TypeError("All elements in 'clauses' must be Clause instances.")
 
+        self._initialize(variables, clauses)
+
+    def _initialize(self, variables, clauses):
         self._variables = variables
         self._clauses = clauses
+        self._weights = None
+        self._hard = None
+        self._reset_derived()
+        self._read_weights(clauses)
 
     def get_num_satisfied_clauses(self, valuation):
         """
         :param valuation: truth assignment to use
         :return: number of clauses satisfied by the given valuation
         """
+        return sum(1 for satisfied in self._get_satisfied_clauses(valuation) if satisfied)
+
+    def get_satisfied_weight(self, valuation):
+        """
+        :param valuation: truth assignment to use
+        :return: score of the given valuation: the total weight of the clauses it satisfies,
+            counting each hard clause as self.hard_weight
+        """
+        clause_weights = self.clause_weights
+        if clause_weights is None:
+            return self.get_num_satisfied_clauses(valuation)
+        return sum(w for w, satisfied in zip(clause_weights, self._get_satisfied_clauses(valuation)) if satisfied)
+
+    def get_cost(self, valuation):
+        """
+        :param valuation: truth assignment to use
+        :return: total weight of the soft clauses falsified by the given valuation,
+            or infinity if it falsifies a hard clause
+        """
+        weights = self.weights or [1] * self.num_clauses
+        hard = self.hard or [False] * self.num_clauses
+        cost = 0
+        for weight, is_hard, satisfied in zip(weights, hard, self._get_satisfied_clauses(valuation)):
+            if not satisfied:
+                if is_hard:
+                    return inf
+                cost += weight
+        return cost
+
+    def _get_satisfied_clauses(self, valuation):
+        """
+        :return: generator yielding, for each clause, whether the given valuation satisfies it
+        """
         if not isinstance(valuation, Valuation):
             raise TypeError("'valuation' must be a Valuation instance.")
 
-        return len([c for c in self.clauses if c.is_satisfied(valuation)])
+        if isinstance(valuation, CompactValuation) and valuation.index is self.variable_index:
+            # Evaluate the stored literals directly against the values, without Clause and Literal instances
+            values = valuation.values
+            return (
+                any(values[l - 1] if l > 0 else not values[-l - 1] for l in clause) for clause in self.clause_store
+            )
+        return (c.is_satisfied(valuation) for c in self.clauses)
+
+    def _reset_derived(self):
+        """ Discards the structures derived from the variables and clauses, so they are rebuilt on next use.
+        """
+        if self._clauses is None:
+            # The clause store is the only representation; materialize it before discarding
+            self._clauses = self._materialize_clauses()
+        self._variable_index = None
+        self._clause_store = None
+        self._occurrences = None
+        self._clause_weights = None
+
+    def _read_weights(self, clauses):
+        """ Takes the weights and hard flags from the given Clause instances, if any differ from the defaults.
+        """
+        if any(c.weight != 1 or c.hard for c in clauses):
+            self._weights = [c.weight for c in clauses]
+            self._hard = [c.hard for c in clauses] if any(c.hard for c in clauses) else None
+        else:
+            self._weights = None
+            self._hard = None
 
     @property
     def variables(self):
@@ -44,10 +175,84 @@ class MAXSAT:
             raise TypeError("'variables' must be a list.")
         if not all(isinstance(v, Variable) for v in variables):
             raise TypeError("All elements in 'variables' must be Variable instances.")
+        # Reset before replacing the variables, as the clause store refers to the current variable ordinals
+        self._reset_derived()
         self._variables = variables
 
+    @property
+    def variable_index(self):
+        """
+        :return: 'Variable -> ordinal' mapping, where the ordinal is the position of the variable in self.variables
+        """
+        if self._variable_index is None:
+            self._variable_index = {v: i for i, v in enumerate(self.variables)}
+        return self._variable_index
+
+    @property
+    def clause_store(self):
+        """
+        :return: ClauseStore holding the clauses as signed literals, where literal i + 1 (-(i + 1))
+            denotes that the variable with ordinal i occurs positively (negatively)
+        """
+        if self._clause_store is None:
+            index = self.variable_index
+            clause_store = ClauseStore()
+            for clause in self.clauses:
+                literals = []
+                for literal in clause.literals:
+                    ordinal = index.get(literal.variable)
+                    if ordinal is None:
+                        raise ValueError("Clause contains variable '{0}', which is not part of the problem."
+                                         .format(literal.variable))
+                    literals.append(ordinal + 1 if literal.positive else -(ordinal + 1))
+                clause_store.append(literals)
+            self._clause_store = clause_store
+        return self._clause_store
+
+    @property
+    def occurrences(self):
+        """
+        :return: ClauseStore containing, for each variable ordinal, the signed references to the clauses
+            in which the variable occurs: clause i + 1 (-(i + 1)) if the variable occurs positively (negatively)
+            in the clause with index i
+        """
+        if self._occurrences is None:
+            clause_store = self.clause_store
+            # First count the occurrences of each variable, then fill them in at their offsets
+            counts = [0] * len(self.variables)
+            for literal in clause_store.literals:
+                counts[abs(literal) - 1] += 1
+            offsets = array("q", [0])
+            for count in counts:
+                offsets.append(offsets[-1] + count)
+
+            positions = list(offsets[:-1])
+            references = array("i", bytes(4 * len(clause_store.literals)))
+            for i, clause in enumerate(clause_store):
+                for literal in clause:
+                    ordinal = abs(literal) - 1
+                    references[positions[ordinal]] = i + 1 if literal > 0 else -(i + 1)
+                    positions[ordinal] += 1
+            self._occurrences = ClauseStore.from_arrays(offsets, references)
+        return self._occurrences
+
+    def _materialize_clauses(self):
+        """
+        :return: list of Clause instances built from self._clause_store
+        """
+        variables = self._variables
+        weights = self._weights or [1] * len(self._clause_store)
+        hard = self._hard or [False] * len(self._clause_store)
+        return [
+            Clause.from_trusted([Literal.from_trusted(variables[abs(literal) - 1], literal > 0) for literal in clause],
+                                weight, is_hard)
+            for clause, weight, is_hard in zip(self._clause_store, weights, hard)
+        ]
+
     @property
     def clauses(self):
+        if self._clauses is None:
+            self._clauses = self._materialize_clauses()
         return self._clauses
 
     @clauses.setter
@@ -57,6 +262,100 @@ class MAXSAT:
         if not all(isinstance(c, Clause) for c in clauses):
             raise TypeError("All elements in 'clauses' must be Clause instances.")
         self._clauses = clauses
+        self._reset_derived()
+        self._read_weights(clauses)
+
+    @property
+    def num_clauses(self):
+        if self._clauses is None:
+            return len(self._clause_store)
+        return len(self._clauses)
+
+    @property
+    def weights(self):
+        """
+        :return: list containing the weight of each clause, or None if all clauses weigh the same
+        """
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights):
+        if weights is not None:
+            if not isinstance(weights, list):
+                raise TypeError("'weights' must be a list.")
+            if len(weights) != self.num_clauses:
+                raise ValueError("'weights' must contain exactly one weight per clause.")
+        self._weights = weights
+        self._clause_weights = None
+        if self._clauses is not None:
+            # Other problems may share the clauses, so they are replaced by reweighted copies
+            self._clauses = [
+                Clause.from_trusted(clause.literals, weight, clause.hard)
+                for clause, weight in zip(self._clauses, weights or [1] * len(self._clauses))
+            ]
+
+    @property
+    def hard(self):
+        """
+        :return: list containing, for each clause, whether it is a hard constraint, or None if all clauses are soft
+        """
+        return self._hard
+
+    @hard.setter
+    def hard(self, hard):
+        if hard is not None:
+            if not isinstance(hard, list):
+                raise TypeError("'hard' must be a list.")
+            if len(hard) != self.num_clauses:
+                raise ValueError("'hard' must contain exactly one flag per clause.")
+        self._hard = hard
+        self._clause_weights = None
+        if self._clauses is not None:
+            self._clauses = [
+                Clause.from_trusted(clause.literals, clause.weight, is_hard)
+                for clause, is_hard in zip(self._clauses, hard or [False] * len(self._clauses))
+            ]
+
+    @property
+    def is_weighted(self):
+        """
+        :return: whether the clauses have weights or hard clauses exist, so that scores are not plain counts
+        """
+        return self._weights is not None or self._hard is not None
+
+    @property
+    def hard_weight(self):
+        """
+        :return: weight counted for a hard clause: one more than the total weight of the soft clauses
+        """
+        weights = self._weights or [1] * self.num_clauses
+        hard = self._hard or [False] * self.num_clauses
+        return 1 + sum(weight for weight, is_hard in zip(weights, hard) if not is_hard)
+
+    @property
+    def clause_weights(self):
+        """
+        :return: array of the weight counted for each clause in scores, with hard clauses weighing
+            self.hard_weight, or None if the problem is not weighted
+        """
+        if self._clause_weights is None and self.is_weighted:
+            weights = self._weights or [1] * self.num_clauses
+            hard = self._hard or [False] * self.num_clauses
+            hard_weight = self.hard_weight
+            self._clause_weights = array("d", (
+                hard_weight if is_hard else weight for weight, is_hard in zip(weights, hard)
+            ))
+        return self._clause_weights
+
+    @property
+    def total_weight(self):
+        """
+        :return: highest possible score: the total weight of all clauses, or their number if not weighted
+        """
+        clause_weights = self.clause_weights
+        if clause_weights is None:
+            return self.num_clauses
+        return sum(clause_weights)
 
     def __str__(self):
         return "Variables: {0};\nClauses: {1}.".format(
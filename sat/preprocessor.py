@@ -0,0 +1,234 @@
+from algorithm.compact_valuation import CompactValuation
+from algorithm.valuation import Valuation
+from sat.clause_store import ClauseStore
+from sat.maxsat import MAXSAT
+
+
+class Preprocessor:
+    """ Simplifies a MAXSAT problem before it is solved, preserving its optimal solutions:
+            - literals occurring twice in a clause are merged, and tautologies (clauses containing a literal and its
+              negation) are removed, as every assignment satisfies them
+            - duplicate clauses are merged into one: soft duplicates add up their weights,
+              and soft duplicates of a hard clause are dropped
+            - unit propagation on hard clauses: the literal of a hard unit clause is fixed to true
+            - pure literal fixing: a variable occurring with a single polarity is fixed to satisfy its clauses
+            - subsumption by hard clauses: a clause containing all literals of a hard clause is always satisfied
+              by feasible solutions and is removed; soft clauses do not subsume, as they may be falsified
+        Fixing a literal removes the clauses it satisfies and the negated literal from the others.
+        Soft clauses left without literals are falsified by every assignment; their weight is kept in 'cost_offset'.
+
+        The reduced problem consists of the remaining clauses over the remaining variables, which keep their
+        Variable instances. The cost of a solution restored by 'restore' is the cost of the corresponding solution of
+        the reduced problem plus 'cost_offset'. Unweighted problems have no hard clauses, so that only the
+        simplifications that hold for soft clauses apply to them.
+
+        If the simplifications leave no clauses, the problem is 'solved': the reduced problem is empty and cannot be
+        passed to the GA, and 'restore' without a valuation returns an optimal solution. If the hard clauses
+        contradict each other, the problem is 'infeasible', and there is neither a reduced problem nor a solution.
+    """
+
+    def __init__(self, maxsat, subsumption=True):
+        """
+        Preprocesses the given problem.
+        :param maxsat: MAXSAT instance to simplify
+        :param subsumption: whether to remove clauses subsumed by hard clauses
+        """
+        if not isinstance(maxsat, MAXSAT):
+            raise TypeError("'maxsat' must be an instance of MAXSAT.")
+
+        self.original = maxsat
+        self.subsumption = subsumption
+        # Fixed values by variable ordinal of the original problem
+        self.fixed = {}
+        # Total weight of the soft clauses falsified by every assignment
+        self.cost_offset = 0
+        # Whether the hard clauses contradict each other
+        self.infeasible = False
+        # Number of clauses and literals removed by each simplification
+        self.statistics = {"tautologies": 0, "duplicates": 0, "units": 0, "pure_literals": 0, "subsumed": 0,
+                           "satisfied": 0, "falsified": 0, "removed_literals": 0}
+
+        weights = maxsat.weights or [1] * maxsat.num_clauses
+        hard = maxsat.hard or [False] * maxsat.num_clauses
+        # Sorted literals -> [literals, weight, hard], where literals is a tuple of distinct signed literals
+        # in their original order
+        clauses = {}
+        for literals, weight, is_hard in zip(maxsat.clause_store, weights, hard):
+            literals = tuple(dict.fromkeys(literals))
+            if any(-literal in literals for literal in literals):
+                self.statistics["tautologies"] += 1
+            elif not literals:
+                self._falsify(weight, is_hard)
+            else:
+                self._add_clause(clauses, literals, weight, is_hard)
+
+        changed = True
+        while changed and not self.infeasible:
+            changed = False
+            for simplify in (self._propagate_units, self._fix_pure_literals, self._remove_subsumed):
+                simplified = simplify(clauses)
+                if simplified is not None:
+                    clauses = simplified
+                    changed = True
+
+        # Whether no clauses are left, so that the fixed values make up an optimal solution
+        self.solved = not self.infeasible and not clauses
+        if self.infeasible:
+            self.maxsat, self.variable_ordinals = None, []
+        else:
+            self.maxsat, self.variable_ordinals = self._build_problem(clauses)
+
+    def _add_clause(self, clauses, literals, weight, is_hard):
+        """ Adds a clause to 'clauses', merging it with an equal clause if there is one.
+        """
+        key = tuple(sorted(literals))
+        existing = clauses.get(key)
+        if existing is None:
+            clauses[key] = [literals, weight, is_hard]
+            return
+        self.statistics["duplicates"] += 1
+        if is_hard and not existing[2]:
+            existing[1], existing[2] = weight, True
+        elif not existing[2]:
+            existing[1] += weight
+
+    def _assign(self, clauses, assignment):
+        """
+        Fixes the given literals to true and simplifies the clauses accordingly.
+        :param clauses: clauses as built by '_add_clause'
+        :param assignment: set of literals to make true
+        :return: simplified clauses
+        """
+        for literal in assignment:
+            self.fixed[abs(literal) - 1] = literal > 0
+
+        simplified = {}
+        for literals, weight, is_hard in clauses.values():
+            if any(literal in assignment for literal in literals):
+                self.statistics["satisfied"] += 1
+                continue
+            remaining = tuple(literal for literal in literals if -literal not in assignment)
+            if len(remaining) < len(literals):
+                self.statistics["removed_literals"] += len(literals) - len(remaining)
+                if not remaining:
+                    self._falsify(weight, is_hard)
+                    continue
+            self._add_clause(simplified, remaining, weight, is_hard)
+        return simplified
+
+    def _falsify(self, weight, is_hard):
+        """ Accounts for a clause without literals, which no assignment satisfies.
+        """
+        self.statistics["falsified"] += 1
+        if is_hard:
+            self.infeasible = True
+        else:
+            self.cost_offset += weight
+
+    def _propagate_units(self, clauses):
+        """
+        :return: clauses simplified by fixing the literals of all hard unit clauses, or None if there are none
+        """
+        units = {literals[0] for literals, _, is_hard in clauses.values() if is_hard and len(literals) == 1}
+        if not units:
+            return None
+        if any(-literal in units for literal in units):
+            self.infeasible = True
+            return None
+        self.statistics["units"] += len(units)
+        return self._assign(clauses, units)
+
+    def _fix_pure_literals(self, clauses):
+        """
+        :return: clauses simplified by fixing all pure literals, or None if there are none
+        """
+        occurring = set()
+        for literals, _, _ in clauses.values():
+            occurring.update(literals)
+        pure = {literal for literal in occurring if -literal not in occurring}
+        if not pure:
+            return None
+        self.statistics["pure_literals"] += len(pure)
+        return self._assign(clauses, pure)
+
+    def _remove_subsumed(self, clauses):
+        """
+        :return: clauses without those subsumed by a hard clause, or None if there are none
+        """
+        if not self.subsumption:
+            return None
+
+        # Clause keys by literal, to only compare clauses sharing the rarest literal of a hard clause
+        occurrences = {}
+        for key, (literals, _, _) in clauses.items():
+            for literal in literals:
+                occurrences.setdefault(literal, []).append(key)
+
+        subsumed = set()
+        for key, (literals, _, is_hard) in clauses.items():
+            if not is_hard or key in subsumed:
+                continue
+            rarest = min(literals, key=lambda literal: len(occurrences[literal]))
+            literal_set = set(literals)
+            for other in occurrences[rarest]:
+                if other != key and other not in subsumed and len(other) > len(literals) \
+                        and literal_set.issubset(clauses[other][0]):
+                    subsumed.add(other)
+        if not subsumed:
+            return None
+
+        self.statistics["subsumed"] += len(subsumed)
+        return {key: clause for key, clause in clauses.items() if key not in subsumed}
+
+    def _build_problem(self, clauses):
+        """
+        :return: tuple containing the reduced MAXSAT instance, and a list containing, for each of its variables,
+            the ordinal of the variable in the original problem
+        """
+        ordinals = sorted({abs(literal) - 1 for literals, _, _ in clauses.values() for literal in literals})
+        new_ordinals = {ordinal: i for i, ordinal in enumerate(ordinals)}
+        variables = self.original.variables
+
+        clause_store = ClauseStore()
+        weights = []
+        hard = []
+        for literals, weight, is_hard in clauses.values():
+            clause_store.append([
+                new_ordinals[abs(literal) - 1] + 1 if literal > 0 else -(new_ordinals[abs(literal) - 1] + 1)
+                for literal in literals
+            ])
+            weights.append(weight)
+            hard.append(is_hard)
+
+        if not any(hard):
+            hard = None
+        if hard is None and all(weight == 1 for weight in weights):
+            weights = None
+        maxsat = MAXSAT.from_clause_store([variables[ordinal] for ordinal in ordinals], clause_store, weights, hard)
+        return maxsat, ordinals
+
+    def restore(self, valuation=None):
+        """
+        Maps a solution of the reduced problem back onto the variables of the original problem.
+        Variables that were fixed get their fixed value; variables that no longer occur in any clause are set to false.
+        :param valuation: Valuation of the variables of self.maxsat; may be omitted if the problem is solved
+        :return: CompactValuation over the variables of the original problem, sharing its variable index
+        """
+        if self.infeasible:
+            raise ValueError("The problem is infeasible, so it has no solution to restore.")
+        if valuation is None and not self.solved:
+            raise ValueError("'valuation' is required unless the problem is solved by preprocessing.")
+        if valuation is not None and not isinstance(valuation, Valuation):
+            raise TypeError("'valuation' must be a Valuation instance.")
+
+        original = self.original
+        values = bytearray(len(original.variables))
+        for ordinal, value in self.fixed.items():
+            values[ordinal] = value
+        if isinstance(valuation, CompactValuation) and valuation.index is self.maxsat.variable_index:
+            for value, ordinal in zip(valuation.values, self.variable_ordinals):
+                values[ordinal] = value
+        elif valuation is not None:
+            for variable, ordinal in zip(self.maxsat.variables, self.variable_ordinals):
+                values[ordinal] = bool(valuation.get_value_for_variable(variable))
+        return CompactValuation(original.variables, values, original.variable_index)
@@ -1,7 +1,11 @@
 import random
 import string
+from math import comb
 
+from algorithm.compact_valuation import CompactValuation
 from sat.clause import Clause
+from sat.clause_store import ClauseStore
+from sat.dimacs import write_cnf
 from sat.literal import Literal
 from sat.maxsat import MAXSAT
 from sat.variable import Variable
@@ -9,54 +13,145 @@ from sat.variable import Variable
 
 class ProblemGenerator:
     """ Randomly generates MAXSAT problem instances.
+        Besides small instances of named variables ('generate_problem'), it generates uniform random k-SAT
+        instances of any size directly into a ClauseStore ('generate_random_ksat') or a DIMACS file
+        ('write_random_ksat'), optionally planted with a known satisfying assignment.
     """
 
-    def __init__(self):
+    def __init__(self, seed=None, rng=None):
+        """
+        :param seed: seed for the random number generator, so that generated instances can be reproduced
+        :param rng: random.Random instance to use instead of one created from 'seed'
+        """
         self.max_variables_per_clause = 3
         self.min_num_variables = 5
         self.max_num_variables = 5
         self.min_num_clauses = 5
         self.max_num_clauses = 5
+        self.eliminate_duplicate_clauses = False
+
+        self.random = rng if rng is not None else random.Random(seed)
 
         self.variables = None
         self.clauses = None
+        self.planted_solution = None
 
     def generate_problem(self):
-        # todo: prevent duplicate clauses
         self.variables = self.generate_variables()
         self.clauses = self.generate_clauses()
         return MAXSAT(self.variables, self.clauses)
 
     def generate_variables(self):
-        num_variables = random.randint(self.min_num_variables, self.max_num_variables)
-        variables = []
-
-        for i in range(num_variables):
-            variable = Variable(string.ascii_lowercase[i])
-            if variable not in variables:
-                variables.append(variable)
+        num_variables = self.random.randint(self.min_num_variables, self.max_num_variables)
+        return [Variable(self.get_variable_name(i)) for i in range(num_variables)]
 
-        return variables
+    @staticmethod
+    def get_variable_name(i):
+        """
+        :param i: ordinal of a variable
+        :return: alphabetic name of the variable: 'a' to 'z', followed by 'aa', 'ab', and so on
+        """
+        name = ""
+        i += 1
+        while i > 0:
+            i, remainder = divmod(i - 1, 26)
+            name = string.ascii_lowercase[remainder] + name
+        return name
 
     def generate_clauses(self):
-        num_clauses = random.randint(self.min_num_clauses, self.max_num_clauses)
+        num_clauses = self.random.randint(self.min_num_clauses, self.max_num_clauses)
         clauses = []
 
-        for i in range(num_clauses):
-            variables = []
-            literals = []
-            for j in range(self.max_variables_per_clause):
-                # Choose a random variable to include in clause
-                variable = random.choice([v for v in self.variables if v not in variables])
-                # Randomly determine whether to include variable
-                # as a positive or negative literal in clause
-                if random.randint(0, 1) == 0:
-                    literal = Literal(variable, positive=True)
-                else:
-                    literal = Literal(variable, positive=False)
-
-                variables.append(variable)
-                literals.append(literal)
+        for compiled_clause in self.generate_random_clauses(len(self.variables), num_clauses,
+                                                            self.max_variables_per_clause):
+            literals = [
+                Literal(self.variables[abs(literal) - 1], positive=literal > 0) for literal in compiled_clause
+            ]
             clauses.append(Clause(literals))
 
         return clauses
+
+    def generate_random_ksat(self, num_variables, num_clauses=None, ratio=4.26, k=3, planted=False):
+        """
+        Generates a uniform random k-SAT instance: every clause consists of k distinct variables,
+        each of which is negated with probability 1/2.
+        :param num_variables: number of variables
+        :param num_clauses: number of clauses; defaults to 'ratio' times 'num_variables'
+        :param ratio: clause/variable ratio to use if 'num_clauses' is not given
+        :param k: number of literals per clause
+        :param planted: whether to plant a random assignment satisfying every clause;
+            it is stored as a CompactValuation in self.planted_solution
+        :return: MAXSAT instance holding its clauses in a ClauseStore only
+        """
+        if num_clauses is None:
+            num_clauses = int(round(ratio * num_variables))
+
+        variables = [Variable(str(i)) for i in range(1, num_variables + 1)]
+        planted_values = self._generate_planted_values(num_variables) if planted else None
+        clause_store = ClauseStore.from_clauses(
+            self.generate_random_clauses(num_variables, num_clauses, k, planted_values)
+        )
+
+        maxsat = MAXSAT.from_clause_store(variables, clause_store)
+        if planted:
+            self.planted_solution = CompactValuation(variables, planted_values, maxsat.variable_index)
+        return maxsat
+
+    def write_random_ksat(self, path, num_variables, num_clauses=None, ratio=4.26, k=3, planted=False):
+        """
+        Generates a uniform random k-SAT instance like 'generate_random_ksat',
+        streaming the clauses into a DIMACS CNF file instead of keeping them in memory.
+        :param path: path of the file to write; compressed if it ends in '.gz', '.xz' or '.bz2'
+        :return: bytearray holding the planted solution if 'planted', None otherwise
+        """
+        if num_clauses is None:
+            num_clauses = int(round(ratio * num_variables))
+
+        planted_values = self._generate_planted_values(num_variables) if planted else None
+        write_cnf(path, num_variables, num_clauses,
+                  self.generate_random_clauses(num_variables, num_clauses, k, planted_values))
+        return planted_values
+
+    def generate_random_clauses(self, num_variables, num_clauses, k, planted_values=None):
+        """
+        :param num_variables: number of variables to draw from
+        :param num_clauses: number of clauses to generate
+        :param k: number of distinct variables per clause
+        :param planted_values: optional bytes holding a 0/1 value per variable that every clause must satisfy;
+            a clause it does not satisfy gets one of its literals negated
+        :return: generator of tuples of signed literals, one per clause
+        """
+        if k > num_variables:
+            raise ValueError("'k' cannot exceed the number of variables.")
+        if self.eliminate_duplicate_clauses:
+            num_distinct_clauses = comb(num_variables, k) * (2 ** k - (1 if planted_values is not None else 0))
+            if num_clauses > num_distinct_clauses:
+                raise ValueError("Cannot generate {0} distinct clauses of {1} variables.".format(num_clauses, k))
+
+        rng = self.random
+        ordinals = range(num_variables)
+        seen = set()
+        generated = 0
+        while generated < num_clauses:
+            signs = rng.getrandbits(k)
+            clause = [
+                -(ordinal + 1) if (signs >> j) & 1 else ordinal + 1
+                for j, ordinal in enumerate(rng.sample(ordinals, k))
+            ]
+            if planted_values is not None and not any(
+                    (planted_values[l - 1] == 1) if l > 0 else (planted_values[-l - 1] == 0) for l in clause):
+                j = rng.randrange(k)
+                clause[j] = -clause[j]
+
+            clause = tuple(clause)
+            if self.eliminate_duplicate_clauses:
+                key = tuple(sorted(clause))
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            generated += 1
+            yield clause
+
+    def _generate_planted_values(self, num_variables):
+        return CompactValuation.unpack_bits(self.random.getrandbits(num_variables), num_variables)
@@ -40,3 +40,19 @@ class TestClause(unittest.TestCase):
 
         c = Clause([Literal(variable)])
         self.assertTrue(c.is_satisfied(v))
+
+    def test_create_sets_default_weight_and_soft(self):
+        c = Clause([Literal(Variable('a'))])
+        self.assertEqual(1, c.weight)
+        self.assertFalse(c.hard)
+
+    def test_create_with_negative_weight_fails(self):
+        self.assertRaises(ValueError, lambda: Clause([Literal(Variable('a'))], weight=-1))
+
+    def test_from_trusted_still_checks_weight(self):
+        c = Clause.from_trusted([Literal(Variable('a'))], 2, True)
+        self.assertEqual((2, True), (c.weight, c.hard))
+        self.assertRaises(ValueError, lambda: Clause.from_trusted([Literal(Variable('a'))], weight=-1))
+
+    def test_create_with_invalid_hard_type_fails(self):
+        self.assertRaises(TypeError, lambda: Clause([Literal(Variable('a'))], hard=1))
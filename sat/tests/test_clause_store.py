@@ -0,0 +1,35 @@
+import unittest
+from array import array
+
+from sat.clause_store import ClauseStore
+
+
+class TestClauseStore(unittest.TestCase):
+
+    def test_append_stores_literals_back_to_back(self):
+        store = ClauseStore.from_clauses([(1, -2), (3,)])
+        self.assertEqual(array("i", [1, -2, 3]), store.literals)
+        self.assertEqual(array("q", [0, 2, 3]), store.offsets)
+
+    def test_getitem_returns_clause(self):
+        store = ClauseStore.from_clauses([(1, -2), (3,)])
+        self.assertEqual((3,), store[1])
+        self.assertEqual((1, -2), store[-2])
+
+    def test_getitem_out_of_range_fails(self):
+        store = ClauseStore.from_clauses([(1, -2)])
+        self.assertRaises(IndexError, lambda: store[1])
+
+    def test_iterating_clauses_of_equal_length(self):
+        clauses = [(1, -2), (3, 4)]
+        self.assertEqual(clauses, list(ClauseStore.from_clauses(clauses)))
+
+    def test_iterating_clauses_of_different_length(self):
+        clauses = [(1, -2), (), (3, 4, -5)]
+        self.assertEqual(clauses, list(ClauseStore.from_clauses(clauses)))
+
+    def test_iterating_empty_store(self):
+        self.assertEqual([], list(ClauseStore()))
+
+    def test_from_arrays_with_invalid_offsets_fails(self):
+        self.assertRaises(ValueError, lambda: ClauseStore.from_arrays(array("q", [0, 3]), array("i", [1])))
@@ -0,0 +1,94 @@
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from sat.dimacs import DimacsReader, load_dimacs, read_dimacs, save_dimacs
+from sat.variable import Variable
+
+
+class TestDimacs(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, text, opener=open):
+        path = os.path.join(self.directory, name)
+        with opener(path, "wt") as f:
+            f.write(text)
+        return path
+
+    def test_reader_reads_cnf_clauses(self):
+        reader = DimacsReader(["c comment\n", "p cnf 3 2\n", "1 -3 0\n", "2 3 -1 0\n"])
+        self.assertEqual([((1, -3), 1, False), ((2, 3, -1), 1, False)], list(reader))
+        self.assertEqual(3, reader.num_variables)
+
+    def test_reader_reads_clause_spanning_lines(self):
+        reader = DimacsReader(["p cnf 3 1\n", "1 -3\n", "2 0\n"])
+        self.assertEqual([((1, -3, 2), 1, False)], list(reader))
+
+    def test_reader_reads_wcnf_with_top(self):
+        reader = DimacsReader(["p wcnf 2 2 10\n", "10 1 2 0\n", "3 -1 0\n"])
+        self.assertEqual([((1, 2), 10, True), ((-1,), 3, False)], list(reader))
+
+    def test_reader_reads_headerless_wcnf(self):
+        reader = DimacsReader(["h 1 2 0\n", "2.5 -1 0\n"])
+        self.assertEqual([((1, 2), 1, True), ((-1,), 2.5, False)], list(reader))
+
+    def test_reader_stops_at_satlib_trailer(self):
+        reader = DimacsReader(["p cnf 3 1\n", " 1 -3 2 0\n", "%\n", "0\n", "\n"])
+        self.assertEqual([((1, -3, 2), 1, False)], list(reader))
+
+    def test_load_satlib_cnf_has_declared_clauses(self):
+        maxsat = load_dimacs(self.write("uf3-01.cnf", "c SATLIB\np cnf 3 1\n 1 -3 2 0\n%\n0\n\n"))
+        self.assertEqual(1, maxsat.num_clauses)
+
+    def test_reader_with_invalid_literal_fails(self):
+        self.assertRaises(ValueError, lambda: list(DimacsReader(["p cnf 1 1\n", "1 x 0\n"])))
+
+    def test_reader_with_unterminated_clause_fails(self):
+        self.assertRaises(ValueError, lambda: list(DimacsReader(["p cnf 1 1\n", "1\n"])))
+
+    def test_load_cnf_creates_problem(self):
+        path = self.write("problem.cnf", "p cnf 3 2\n1 -3 0\n2 0\n")
+        maxsat = load_dimacs(path)
+
+        self.assertEqual([Variable('1'), Variable('2'), Variable('3')], maxsat.variables)
+        self.assertEqual([(1, -3), (2,)], list(maxsat.clause_store))
+        self.assertIsNone(maxsat.weights)
+        self.assertEqual("[1, not 3]", str(maxsat.clauses[0]))
+
+    def test_load_dimacs_accepts_path_objects(self):
+        path = Path(self.write("problem.cnf.gz", "p cnf 2 1\n1 -2 0\n", gzip.open))
+        self.assertEqual([(1, -2)], list(load_dimacs(path).clause_store))
+
+    def test_read_dimacs_text_creates_problem(self):
+        maxsat = read_dimacs("p wcnf 2 2 5\n5 1 2 0\n2 -1 0\n".splitlines())
+
+        self.assertEqual([(1, 2), (-1,)], list(maxsat.clause_store))
+        self.assertEqual([True, False], maxsat.hard)
+
+    def test_load_compressed_wcnf_creates_weighted_problem(self):
+        text = "p wcnf 2 2 5\n5 1 2 0\n2 -1 0\n"
+        for name, opener in (("problem.wcnf.gz", gzip.open), ("problem.wcnf.xz", lzma.open)):
+            maxsat = load_dimacs(self.write(name, text, opener))
+
+            self.assertEqual([5, 2], maxsat.weights)
+            self.assertEqual([True, False], maxsat.hard)
+
+    def test_save_and_load_weighted_problem(self):
+        text = "p wcnf 2 2 5\n5 1 2 0\n2 -1 0\n"
+        maxsat = load_dimacs(self.write("problem.wcnf", text))
+        path = os.path.join(self.directory, "copy.wcnf")
+        save_dimacs(maxsat, path)
+
+        loaded = load_dimacs(path)
+        self.assertEqual([(1, 2), (-1,)], list(loaded.clause_store))
+        self.assertEqual([True, False], loaded.hard)
+        self.assertEqual(2, loaded.weights[1])
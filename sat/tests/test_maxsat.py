@@ -1,5 +1,6 @@
 import unittest
 
+from algorithm.compact_valuation import CompactValuation
 from algorithm.valuation import Valuation
 from sat.clause import Clause
 from sat.literal import Literal
@@ -53,3 +54,93 @@ class TestMAXSAT(unittest.TestCase):
     def test_valid_valuation_satisfies_all_clauses(self):
         v = Valuation({self.v1: True, self.v2: False})
         self.assertEqual(2, self.m.get_num_satisfied_clauses(v))
+
+    def test_clause_store_contains_signed_ordinals(self):
+        self.assertEqual([(1,), (-2,)], list(self.m.clause_store))
+
+    def test_occurrences_map_variables_to_clause_references(self):
+        self.assertEqual([(1,), (-2,)], list(self.m.occurrences))
+
+    def test_setting_clauses_resets_occurrences(self):
+        self.m.occurrences
+        self.m.clauses = [self.c2]
+        self.assertEqual([(), (-1,)], list(self.m.occurrences))
+
+    def test_from_clause_store_materializes_clauses(self):
+        m = MAXSAT.from_clause_store(self.variables, [(1, -2)])
+        self.assertEqual("[a, not b]", str(m.clauses[0]))
+
+    def test_from_clause_store_with_wrong_number_of_weights_fails(self):
+        self.assertRaises(ValueError, lambda: MAXSAT.from_clause_store(self.variables, [(1,)], weights=[1, 2]))
+
+    def test_with_weights_shares_structures_of_problem(self):
+        m = self.m.with_weights([3, 1], [False, True])
+
+        self.assertIs(self.m.clause_store, m.clause_store)
+        self.assertIs(self.m.occurrences, m.occurrences)
+        self.assertIs(self.m.variable_index, m.variable_index)
+        self.assertEqual([3, 4], list(m.clause_weights))
+        self.assertIsNone(self.m.weights)
+
+    def test_from_trusted_matches_constructor(self):
+        m = MAXSAT.from_trusted(self.m.variables, self.m.clauses)
+
+        self.assertEqual(list(self.m.clause_store), list(m.clause_store))
+        self.assertIsNone(m.weights)
+
+    def test_materialized_clauses_of_clause_store_match_literals(self):
+        m = MAXSAT.from_clause_store(self.variables, self.m.clause_store, [2, 1])
+
+        self.assertEqual([2, 1], [c.weight for c in m.clauses])
+        self.assertEqual([str(c) for c in self.m.clauses], [str(c) for c in m.clauses])
+
+    def test_compact_valuation_satisfies_all_clauses(self):
+        v = CompactValuation(self.variables, bytearray([1, 0]), self.m.variable_index)
+        self.assertEqual(2, self.m.get_num_satisfied_clauses(v))
+
+    def test_weights_are_taken_from_clauses(self):
+        m = MAXSAT(self.variables, [Clause([self.l1], weight=3), Clause([self.l2], hard=True)])
+        self.assertEqual([3, 1], m.weights)
+        self.assertEqual([False, True], m.hard)
+        self.assertEqual(4, m.hard_weight)
+        self.assertEqual([3, 4], list(m.clause_weights))
+        self.assertEqual(7, m.total_weight)
+
+    def test_reweighting_does_not_affect_problems_sharing_clauses(self):
+        clauses = [Clause([self.l1], weight=3), Clause([self.l2])]
+        m = MAXSAT(self.variables, clauses)
+        other = MAXSAT(self.variables, clauses)
+
+        m.weights = [5, 1]
+        m.hard = [False, True]
+
+        self.assertEqual([5, 1], [c.weight for c in m.clauses])
+        self.assertEqual([False, True], [c.hard for c in m.clauses])
+        self.assertEqual([3, 1], [c.weight for c in other.clauses])
+        self.assertEqual([False, False], [c.hard for c in other.clauses])
+        self.assertEqual([3, 1], other.weights)
+
+    def test_unweighted_problem_has_no_clause_weights(self):
+        self.assertFalse(self.m.is_weighted)
+        self.assertIsNone(self.m.clause_weights)
+        self.assertEqual(2, self.m.total_weight)
+
+    def test_materialized_clauses_carry_weights(self):
+        m = MAXSAT.from_clause_store(self.variables, [(1,), (-2,)], weights=[5, 1], hard=[False, True])
+        self.assertEqual([5, 1], [c.weight for c in m.clauses])
+        self.assertEqual([False, True], [c.hard for c in m.clauses])
+
+    def test_get_satisfied_weight_counts_hard_clauses_as_hard_weight(self):
+        m = MAXSAT.from_clause_store(self.variables, [(1,), (-2,)], weights=[5, 1], hard=[False, True])
+        v = CompactValuation(self.variables, bytearray([0, 0]), m.variable_index)
+        self.assertEqual(6, m.get_satisfied_weight(v))
+        self.assertEqual(6, m.get_satisfied_weight(Valuation({self.v1: False, self.v2: False})))
+
+    def test_get_cost_sums_weights_of_falsified_soft_clauses(self):
+        m = MAXSAT.from_clause_store(self.variables, [(1,), (-2,)], weights=[5, 2])
+        self.assertEqual(5, m.get_cost(Valuation({self.v1: False, self.v2: False})))
+        self.assertEqual(0, m.get_cost(Valuation({self.v1: True, self.v2: False})))
+
+    def test_get_cost_of_valuation_falsifying_hard_clause_is_infinite(self):
+        m = MAXSAT.from_clause_store(self.variables, [(1,), (-2,)], hard=[False, True])
+        self.assertEqual(float("inf"), m.get_cost(Valuation({self.v1: True, self.v2: True})))
@@ -0,0 +1,129 @@
+import itertools
+import random
+import unittest
+from math import inf
+
+from algorithm.compact_valuation import CompactValuation
+from algorithm.ga import GA
+from algorithm.valuation import Valuation
+from sat.maxsat import MAXSAT
+from sat.preprocessor import Preprocessor
+from sat.problem_generator import ProblemGenerator
+from sat.variable import Variable
+
+
+class TestPreprocessor(unittest.TestCase):
+
+    def setUp(self):
+        self.variables = [Variable(str(i)) for i in range(1, 5)]
+
+    def preprocess(self, clauses, weights=None, hard=None):
+        return Preprocessor(MAXSAT.from_clause_store(self.variables, clauses, weights, hard))
+
+    def test_tautologies_are_removed(self):
+        p = self.preprocess([(1, -1, 2), (2, 3), (-2, -3)])
+        self.assertEqual(1, p.statistics["tautologies"])
+        self.assertEqual([(1, 2), (-1, -2)], list(p.maxsat.clause_store))
+
+    def test_duplicate_soft_clauses_add_up_weights(self):
+        p = self.preprocess([(1, 2), (2, 1), (-1, -2), (1, 2, 1)])
+        self.assertEqual(2, p.statistics["duplicates"])
+        self.assertEqual([(1, 2), (-1, -2)], list(p.maxsat.clause_store))
+        self.assertEqual([3, 1], p.maxsat.weights)
+
+    def test_pure_literals_are_fixed(self):
+        p = self.preprocess([(1, 2), (1, -2), (-3, 4), (3, -4)])
+
+        self.assertEqual({0: True}, p.fixed)
+        self.assertEqual([Variable('3'), Variable('4')], p.maxsat.variables)
+        self.assertEqual([(-1, 2), (1, -2)], list(p.maxsat.clause_store))
+
+    def test_hard_units_are_propagated(self):
+        p = self.preprocess([(1,), (-1, 2), (-1, -2, 3), (-3, 4), (3, -4)], weights=[1, 1, 1, 1, 1],
+                            hard=[True, False, False, False, False])
+
+        self.assertEqual(1, p.statistics["units"])
+        self.assertTrue(p.fixed[0])
+        self.assertEqual([(1,), (-1, 2), (-2, 3), (2, -3)], list(p.maxsat.clause_store))
+        self.assertEqual([Variable('2'), Variable('3'), Variable('4')], p.maxsat.variables)
+
+    def test_soft_units_are_not_propagated(self):
+        p = self.preprocess([(1,), (-1,)])
+        self.assertEqual(2, p.maxsat.num_clauses)
+        self.assertEqual({}, p.fixed)
+
+    def test_contradicting_hard_units_make_problem_infeasible(self):
+        p = self.preprocess([(1,), (-1,)], hard=[True, True])
+        self.assertTrue(p.infeasible)
+
+    def test_restore_of_infeasible_problem_fails(self):
+        p = self.preprocess([(1,), (-1,), (2, 3)], hard=[True, True, False])
+
+        self.assertIsNone(p.maxsat)
+        self.assertFalse(p.solved)
+        self.assertRaises(ValueError, lambda: p.restore())
+
+    def test_problem_without_remaining_clauses_is_solved(self):
+        maxsat = MAXSAT.from_clause_store(self.variables, [(1, 2), (1, 3)])
+        p = Preprocessor(maxsat)
+
+        self.assertTrue(p.solved)
+        self.assertEqual(0, p.maxsat.num_clauses)
+        self.assertEqual(0, maxsat.get_cost(p.restore()))
+
+    def test_restore_without_valuation_of_unsolved_problem_fails(self):
+        p = self.preprocess([(1, 2), (-1, -2), (1, -2), (-1, 2)])
+
+        self.assertFalse(p.solved)
+        self.assertRaises(ValueError, lambda: p.restore())
+
+    def test_soft_clause_falsified_by_propagation_adds_to_cost_offset(self):
+        p = self.preprocess([(1,), (-1,), (2, 3), (-2, -3)], weights=[1, 5, 1, 1], hard=[True, False, False, False])
+        self.assertEqual(5, p.cost_offset)
+        self.assertEqual(1, p.statistics["falsified"])
+
+    def test_clauses_subsumed_by_hard_clauses_are_removed(self):
+        p = self.preprocess([(1, 2), (1, 2, 3), (-1, -2), (-3, 1)], weights=[1, 1, 1, 1],
+                            hard=[True, False, False, False])
+        self.assertEqual(1, p.statistics["subsumed"])
+        self.assertNotIn((1, 2, 3), list(p.maxsat.clause_store))
+
+    def test_restore_maps_solution_onto_original_variables(self):
+        maxsat = MAXSAT.from_clause_store(self.variables, [(1, 2), (1, -2), (-3, 4), (3, -4)])
+        p = Preprocessor(maxsat)
+        reduced = CompactValuation(p.maxsat.variables, bytearray([1, 1]), p.maxsat.variable_index)
+
+        for valuation in (reduced, Valuation({v: True for v in p.maxsat.variables})):
+            restored = p.restore(valuation)
+            self.assertIs(maxsat.variable_index, restored.index)
+            self.assertEqual(bytearray([1, 0, 1, 1]), restored.values)
+            self.assertEqual(0, maxsat.get_cost(restored))
+
+    def test_preprocessing_preserves_optimal_cost(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            clauses = [[rng.choice((1, -1)) * rng.randint(1, 4) for _ in range(rng.randint(1, 3))] for _ in range(8)]
+            weights = [rng.randint(1, 3) for _ in clauses]
+            hard = [rng.random() < 0.3 for _ in clauses]
+            maxsat = MAXSAT.from_clause_store(self.variables, clauses, weights, hard)
+            p = Preprocessor(maxsat)
+
+            expected = self.get_optimal_cost(maxsat)
+            if p.infeasible:
+                self.assertEqual(inf, expected)
+            else:
+                self.assertEqual(expected, self.get_optimal_cost(p.maxsat) + p.cost_offset)
+
+    def test_ga_solves_reduced_problem(self):
+        maxsat = ProblemGenerator(seed=0).generate_random_ksat(40, ratio=3.0)
+        p = Preprocessor(maxsat)
+
+        result = GA(p.maxsat).run()
+        self.assertEqual(result.cost + p.cost_offset, maxsat.get_cost(p.restore(result.solution)))
+
+    @staticmethod
+    def get_optimal_cost(maxsat):
+        return min(
+            maxsat.get_cost(CompactValuation(maxsat.variables, bytearray(values), maxsat.variable_index))
+            for values in itertools.product((0, 1), repeat=len(maxsat.variables))
+        )
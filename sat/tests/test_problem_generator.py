@@ -0,0 +1,65 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from sat.dimacs import load_dimacs
+from sat.problem_generator import ProblemGenerator
+
+
+class TestProblemGenerator(unittest.TestCase):
+
+    def test_variable_names_continue_after_z(self):
+        self.assertEqual(['a', 'z', 'aa', 'ab', 'ba'],
+                         [ProblemGenerator.get_variable_name(i) for i in (0, 25, 26, 27, 52)])
+
+    def test_generate_problem_with_many_variables(self):
+        generator = ProblemGenerator()
+        generator.min_num_variables = generator.max_num_variables = 40
+        maxsat = generator.generate_problem()
+        self.assertEqual(40, len(set(maxsat.variables)))
+
+    def test_same_seed_generates_same_problem(self):
+        self.assertEqual(str(ProblemGenerator(seed=3).generate_problem()),
+                         str(ProblemGenerator(seed=3).generate_problem()))
+
+    def test_given_rng_generates_same_problem_as_seed(self):
+        self.assertEqual(list(ProblemGenerator(seed=3).generate_random_ksat(20).clause_store),
+                         list(ProblemGenerator(rng=random.Random(3)).generate_random_ksat(20).clause_store))
+
+    def test_generate_random_ksat_has_requested_shape(self):
+        maxsat = ProblemGenerator(seed=1).generate_random_ksat(100, ratio=4.26, k=4)
+
+        self.assertEqual(100, len(maxsat.variables))
+        self.assertEqual(426, len(maxsat.clause_store))
+        self.assertTrue(all(len(set(abs(l) for l in clause)) == 4 for clause in maxsat.clause_store))
+
+    def test_planted_solution_satisfies_all_clauses(self):
+        generator = ProblemGenerator(seed=2)
+        maxsat = generator.generate_random_ksat(50, 300, planted=True)
+
+        self.assertEqual(300, maxsat.get_num_satisfied_clauses(generator.planted_solution))
+
+    def test_eliminate_duplicate_clauses_generates_distinct_clauses(self):
+        generator = ProblemGenerator(seed=4)
+        generator.eliminate_duplicate_clauses = True
+        maxsat = generator.generate_random_ksat(4, 32, k=3)
+
+        self.assertEqual(32, len(set(tuple(sorted(clause)) for clause in maxsat.clause_store)))
+
+    def test_eliminate_duplicate_clauses_with_too_many_clauses_fails(self):
+        generator = ProblemGenerator()
+        generator.eliminate_duplicate_clauses = True
+        self.assertRaises(ValueError, lambda: generator.generate_random_ksat(3, 9, k=3))
+
+    def test_write_random_ksat_writes_loadable_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "random.cnf.gz")
+            ProblemGenerator(seed=5).write_random_ksat(path, 30, 120)
+            expected = ProblemGenerator(seed=5).generate_random_ksat(30, 120)
+
+            self.assertEqual(list(expected.clause_store), list(load_dimacs(path).clause_store))
+        finally:
+            shutil.rmtree(directory)
@@ -11,3 +11,10 @@ class TestVariable(unittest.TestCase):
     def test_create_sets_value(self):
         v = Variable('a')
         self.assertEqual('a', v.value)
+
+    def test_create_with_non_alphanumeric_string_fails(self):
+        self.assertRaises(TypeError, lambda: Variable('x-1'))
+
+    def test_create_with_numeric_string_sets_value(self):
+        v = Variable('17')
+        self.assertEqual('17', v.value)
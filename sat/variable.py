@@ -1,10 +1,13 @@
 class Variable:
     """ Represents a variable in a MAXSAT problem.
+        Its value is an alphanumeric name, such as 'a' or the integer ID '17' used by DIMACS files.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, value):
-        if not str.isalpha(value):
-            raise TypeError("'value' must be an alphabetic character.")
+        if not str.isalnum(value):
+            raise TypeError("'value' must be an alphanumeric string.")
 
         self._value = value
 